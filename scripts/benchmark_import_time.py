@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""YFPY import time benchmark.
+
+Measures the wall-clock import time of common YFPY entry points, each in a fresh Python interpreter, and optionally
+fails if any of them exceeds a maximum (to catch startup time regressions).
+
+Usage:
+    python scripts/benchmark_import_time.py [--runs 10] [--max-milliseconds 150]
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+project_dir = Path(__file__).parent.parent
+
+import_scenarios = {
+    "package": "import yfpy",
+    "models": "from yfpy import Player, Team",
+    "offline data": "from yfpy import Data",
+    "query": "from yfpy import YahooFantasySportsQuery",
+    "full public api": "from yfpy import *",
+}
+
+
+def measure_import_time(import_statement: str) -> float:
+    """Measure the import time of an import statement in a fresh Python interpreter.
+
+    Args:
+        import_statement (str): Python import statement to measure.
+
+    Returns:
+        float: Import time in milliseconds.
+
+    """
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            f"import time\nstart = time.perf_counter()\n{import_statement}\nprint((time.perf_counter() - start) * 1000)"
+        ],
+        cwd=project_dir
+    )
+    return float(output.decode("utf-8").strip())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the import time of YFPY entry points.")
+    parser.add_argument("--runs", type=int, default=10, help="number of measurements per scenario (default: 10)")
+    parser.add_argument(
+        "--max-milliseconds", type=float, default=None,
+        help="fail if the median import time of the package, models, or offline data scenarios exceeds this value"
+    )
+    args = parser.parse_args()
+
+    exceeded_scenarios = []
+    for scenario, import_statement in import_scenarios.items():
+        import_times = [measure_import_time(import_statement) for _ in range(args.runs)]
+        median_import_time = statistics.median(import_times)
+        print(
+            f"{scenario:<16} median: {median_import_time:8.1f} ms  min: {min(import_times):8.1f} ms  "
+            f"({import_statement})"
+        )
+        if (args.max_milliseconds is not None and scenario in {"package", "models", "offline data"}
+                and median_import_time > args.max_milliseconds):
+            exceeded_scenarios.append(scenario)
+
+    if exceeded_scenarios:
+        print(f"Import time exceeded {args.max_milliseconds} ms for: {', '.join(exceeded_scenarios)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+"""Pytest unit tests for YFPY.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""Pytest unit test conftest.py.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+from typing import Any, Callable, Dict, Tuple
+
+import pytest
+
+from tests.unit.mocks import MockOAuth, MockSession
+from yfpy.query import YahooFantasySportsQuery
+
+
+@pytest.fixture
+def mock_yahoo_query() -> Callable[..., YahooFantasySportsQuery]:
+    """Create YahooFantasySportsQuery objects that use a mock session instead of the Yahoo Fantasy Sports API."""
+
+    def _mock_yahoo_query(handler: Callable[[str], Tuple[int, Dict[str, Any]]], league_key: str = "331.l.729259",
+                          **kwargs) -> YahooFantasySportsQuery:
+        yahoo_query = YahooFantasySportsQuery(
+            "729259",
+            "nfl",
+            game_id=331,
+            yahoo_consumer_key="consumer_key",
+            yahoo_consumer_secret="consumer_secret",
+            env_var_fallback=False,
+            offline=True,
+            **kwargs
+        )
+        yahoo_query.offline = False
+        yahoo_query.oauth = MockOAuth(MockSession(handler))
+        yahoo_query.league_key = league_key
+        return yahoo_query
+
+    return _mock_yahoo_query
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""Mock Yahoo Fantasy Sports API sessions, OAuth clients, and responses shared by the pytest unit tests.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from requests.exceptions import HTTPError
+
+
+class MockResponse(object):
+    """Minimal stand-in for a requests Response returned by the mock Yahoo session."""
+
+    def __init__(self, url: str, status_code: int, payload: Dict[str, Any]):
+        self.url = url
+        self.status_code = status_code
+        self._payload = payload
+
+    def json(self) -> Dict[str, Any]:
+        # return a fresh copy every time, like parsing a real response body
+        return json.loads(json.dumps(self._payload))
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise HTTPError(f"{self.status_code} error for url: {self.url}")
+
+
+class MockSession(object):
+    """Mock authenticated session that routes requested URLs to a handler function and records them."""
+
+    def __init__(self, handler: Callable[[str], Tuple[int, Dict[str, Any]]]):
+        self.handler = handler
+        self.requested_urls: List[str] = []
+        self._lock = threading.Lock()
+
+    def get(self, url: str, params: Dict[str, str] = None) -> MockResponse:
+        with self._lock:
+            self.requested_urls.append(url)
+        status_code, payload = self.handler(url)
+        return MockResponse(url, status_code, payload)
+
+    def mount(self, prefix: str, adapter: Any) -> None:
+        pass
+
+
+class MockOAuth(object):
+    """Mock yahoo-oauth OAuth2 client exposing a mock session and counting its access token refreshes."""
+
+    def __init__(self, session: MockSession, token_time: float = None):
+        self.session = session
+        self.access_token = "access_token"
+        self.consumer_key = "consumer_key"
+        self.consumer_secret = "consumer_secret"
+        self.guid = "guid"
+        self.refresh_token = "refresh_token"
+        self.token_time = time.time() if token_time is None else token_time
+        self.token_type = "bearer"
+        self.refresh_count = 0
+
+    def token_is_valid(self) -> bool:
+        return time.time() - self.token_time <= 3540
+
+    def refresh_access_token(self) -> Dict[str, Any]:
+        self.refresh_count += 1
+        self.access_token = f"access_token_{self.refresh_count}"
+        self.token_time = time.time()
+        return {"access_token": self.access_token, "token_time": self.token_time}
+
+
+def league_response(league_key: str, **league_fields) -> Tuple[int, Dict[str, Any]]:
+    """Build a successful mock Yahoo Fantasy Sports API response containing league metadata."""
+    return 200, {"fantasy_content": {"league": [{"league_key": league_key, **league_fields}]}}
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Pytest unit tests for composing Yahoo Fantasy Sports REST API queries.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import pytest
+
+from yfpy.models import League, PlayerStats, Roster, Settings, Standings, Team, TeamPoints
+
+
+def _team(team_id: int):
+    return {"team": [
+        [{"team_key": f"331.l.729259.t.{team_id}"}, {"team_id": str(team_id)}],
+        {"roster": {"coverage_type": "week", "week": "1", "0": {
+            "players": {"0": {"player": [[{"player_key": f"331.p.{team_id}"}]]}, "count": 1}
+        }}}
+    ]}
+
+
+def _league_handler(url: str):
+    if url.endswith("/league/331.l.729259;out=settings,standings,scoreboard"):
+        return 200, {"fantasy_content": {"league": [
+            {"league_key": "331.l.729259", "season": "2014"},
+            {"settings": [{"draft_type": "live"}]},
+            {"standings": [{"teams": {"0": _team(1), "1": _team(2), "count": 2}}]},
+            {"scoreboard": {"week": "16"}}
+        ]}}
+    if url.endswith("/league/331.l.729259/teams;out=roster"):
+        return 200, {"fantasy_content": {"league": [
+            {"league_key": "331.l.729259"},
+            {"teams": {"0": _team(1), "1": _team(2), "count": 2}}
+        ]}}
+    return 400, {"error": {"description": f"unexpected url {url}"}}
+
+
+@pytest.mark.unit
+def test_query_builder_composes_resource_paths(mock_yahoo_query):
+    builder = mock_yahoo_query(_league_handler).build_query()
+
+    assert builder.league().teams().roster(week=3).players(position="QB").stats(type="week", week=3).url == (
+        "https://fantasysports.yahooapis.com/fantasy/v2/league/331.l.729259/teams/roster;week=3/players;position=QB/"
+        "stats;type=week;week=3"
+    )
+    assert builder.team(3).out("roster", "stats").out("roster").url.endswith("/team/331.l.729259.t.3;out=roster,stats")
+    players_builder = builder.league().players(player_keys=["331.p.1", "331.p.2"])
+    assert players_builder.url.endswith("/players;player_keys=331.p.1,331.p.2")
+    assert builder.team(3).roster(week=1).data_type_class is Roster
+    assert builder.league().teams().data_type_class is None
+    with pytest.raises(ValueError):
+        builder.out("settings")
+
+
+@pytest.mark.unit
+def test_get_league_snapshot_uses_two_composed_requests(mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_league_handler)
+
+    league = yahoo_query.get_league_snapshot()
+
+    assert len(yahoo_query.oauth.session.requested_urls) == 2
+    assert isinstance(league, League) and league.season == 2014
+    assert isinstance(league.settings, Settings) and league.settings.draft_type == "live"
+    assert isinstance(league.standings, Standings)
+    assert league.scoreboard.week == 16
+    assert all(isinstance(team, Team) for team in league.teams)
+    assert [team.roster.players[0].player_key for team in league.teams] == ["331.p.1", "331.p.2"]
+
+
+def _league_teams_handler(url: str):
+    if "/teams/roster;week=2/players/stats" in url:
+        teams = {str(idx): _team(team_id) for idx, team_id in enumerate([1, 2])}
+    elif "/teams/stats;type=week;week=2" in url:
+        teams = {str(idx): {"team": [
+            [{"team_key": f"331.l.729259.t.{team_id}"}],
+            {"team_points": {"coverage_type": "week", "week": "2", "total": f"{100 + team_id}.5"}},
+            {"team_projected_points": {"coverage_type": "week", "week": "2", "total": "90.0"}}
+        ]} for idx, team_id in enumerate([1, 2])}
+    else:
+        return 400, {"error": {"description": f"unexpected url {url}"}}
+    return 200, {"fantasy_content": {"league": [{"league_key": "331.l.729259"}, {"teams": {**teams, "count": 2}}]}}
+
+
+@pytest.mark.unit
+def test_league_wide_team_queries_use_single_requests(mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_league_teams_handler)
+
+    rosters = yahoo_query.get_league_teams_roster_player_stats_by_week(2)
+    team_stats = yahoo_query.get_league_teams_stats_by_week(2)
+
+    assert len(yahoo_query.oauth.session.requested_urls) == 2
+    assert {team_key: [player.player_key for player in players] for team_key, players in rosters.items()} == {
+        "331.l.729259.t.1": ["331.p.1"], "331.l.729259.t.2": ["331.p.2"]
+    }
+    assert {team_key: stats["team_points"].total for team_key, stats in team_stats.items()} == {
+        "331.l.729259.t.1": 101.5, "331.l.729259.t.2": 102.5
+    }
+    assert team_stats["331.l.729259.t.1"]["team_projected_points"].total == 90.0
+
+
+def _stats_handler(url: str):
+    if url.endswith("/team/331.l.729259.t.1/stats;type=week;week=1"):
+        return 200, {"fantasy_content": {"team": [
+            [{"team_key": "331.l.729259.t.1"}],
+            {"team_points": {"coverage_type": "week", "week": "1", "total": "101.5"}},
+            {"team_projected_points": {"coverage_type": "week", "week": "1", "total": "90.0"}}
+        ]}}
+    if url.endswith("/player/331.p.1/stats;type=week;week=1"):
+        return 200, {"fantasy_content": {"player": [
+            [{"player_key": "331.p.1"}],
+            {"player_stats": {"coverage_type": "week", "week": "1", "stats": [
+                {"stat": {"stat_id": "4", "value": "250"}}
+            ]}}
+        ]}}
+    return 200, {"fantasy_content": {"team": [[{"team_key": "331.l.729259.t.1"}], {"team_stats": {}}]}}
+
+
+@pytest.mark.unit
+def test_query_builder_extracts_subresources_returned_under_other_names(mock_yahoo_query):
+    builder = mock_yahoo_query(_stats_handler).build_query()
+
+    team_points = builder.team(1).stats(type="week", week=1).fetch()
+    assert isinstance(team_points, TeamPoints) and team_points.total == 101.5
+    player_stats = builder.player("331.p.1").stats(type="week", week=1).fetch()
+    assert isinstance(player_stats, PlayerStats) and player_stats.stats[0].value == 250.0
+
+    with pytest.raises(ValueError, match="cannot contain further resources"):
+        builder.team(1).stats(type="week", week=1).resource("stat_categories").fetch()
+    with pytest.raises(ValueError, match="has no 'matchups' data key"):
+        builder.team(1).resource("matchups").fetch()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""Pytest unit tests for running YFPY queries in bulk across multiple leagues.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import pytest
+
+from tests.unit.mocks import league_response
+from yfpy.bulk import MultiLeagueQuery, SeasonBackfill
+from yfpy.data import Data
+from yfpy.models import League
+
+
+def _league_metadata_handler(url: str):
+    league_key = url.split("/league/")[1].split("/")[0]
+    if league_key.endswith(".l.3"):
+        return 400, {"error": {"description": "league not found"}}
+    return league_response(league_key, name=f"League {league_key}")
+
+
+@pytest.mark.unit
+def test_multi_league_query_shares_session_and_reports_failures(mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_league_metadata_handler)
+
+    multi_league_result = MultiLeagueQuery(yahoo_query, ["1", "2", "3", "2"], max_workers=4).run(
+        ["get_league_metadata"]
+    )
+
+    assert multi_league_result.league_ids == ["1", "2", "3"]
+    assert isinstance(multi_league_result.results["1"]["get_league_metadata"], League)
+    assert multi_league_result.results["2"]["get_league_metadata"].league_key == "331.l.2"
+    assert multi_league_result.succeeded_league_ids == ["1", "2"]
+    assert multi_league_result.failed_league_ids == ["3"]
+    assert "get_league_metadata" in multi_league_result.failures["3"]
+    # all league queries reuse the authenticated session of the original query
+    assert len(yahoo_query.oauth.session.requested_urls) == 3
+
+
+@pytest.mark.unit
+def test_multi_league_query_rejects_unknown_operations(mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_league_metadata_handler)
+
+    with pytest.raises(ValueError):
+        MultiLeagueQuery(yahoo_query, ["1"]).run(["save_access_token_data_to_env_file"])
+
+
+@pytest.mark.unit
+def test_multi_league_query_raises_errors_that_are_not_query_failures(mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_league_metadata_handler)
+
+    with pytest.raises(TypeError):
+        MultiLeagueQuery(yahoo_query, ["1"]).run({"get_league_metadata": {"chosen_week": 1}})
+
+
+def _backfill_handler(failing_urls):
+    def _handler(url: str):
+        if url in failing_urls:
+            return 400, {"error": {"description": "temporarily unavailable"}}
+        if "/games;" in url:
+            return 200, {"fantasy_content": {"games": {
+                "0": {"game": [{"game_key": "331", "season": "2014", "code": "nfl"}]},
+                "1": {"game": [{"game_key": "348", "season": "2015", "code": "nfl"}]},
+                "count": 2
+            }}}
+        league_key = url.split("/league/")[1].split("/")[0]
+        if url.endswith("/metadata"):
+            return league_response(league_key, start_week="1", end_week="2", current_week="2", is_finished=1)
+        team = {"team": [[{"team_key": f"{league_key}.t.1"}, {"name": "Team"}]]}
+        league_resource = {
+            "standings": {"standings": [{"teams": {"0": team, "count": 1}}]},
+            "draftresults": {"draft_results": {"0": {"draft_result": {"pick": 1, "round": 1}}, "count": 1}},
+            "transactions": {"transactions": {"0": {"transaction": [{"type": "add"}]}, "count": 1}},
+            "scoreboard": {"scoreboard": {"0": {"matchups": {"0": {"matchup": {"week": "1"}}, "count": 1}}}},
+        }[url.split(f"{league_key}/")[1].split(";")[0]]
+        return 200, {"fantasy_content": {"league": [{"league_key": league_key}, league_resource]}}
+    return _handler
+
+
+@pytest.mark.unit
+def test_season_backfill_checkpoints_and_resumes(mock_yahoo_query, tmp_path):
+    failing_url = "https://fantasysports.yahooapis.com/fantasy/v2/league/348.l.729259/scoreboard;week=2"
+    failing_urls = {failing_url}
+    yahoo_query = mock_yahoo_query(_backfill_handler(failing_urls))
+
+    backfill_result = SeasonBackfill(yahoo_query, Data(tmp_path), [2014, 2015]).run()
+
+    # 2 seasons x (metadata + standings + draft results + transactions + 2 weeks of matchups)
+    assert len(backfill_result.completed) == 11
+    assert list(backfill_result.failures.keys()) == ["2015/348.l.729259/league_matchups_week_2"]
+    assert (tmp_path / "2014" / "331.l.729259" / "league_matchups_week_1.json").is_file()
+
+    failing_urls.clear()
+    requested_url_count = len(yahoo_query.oauth.session.requested_urls)
+    resumed_backfill_result = SeasonBackfill(yahoo_query, Data(tmp_path), [2014, 2015]).run()
+
+    assert resumed_backfill_result.completed == ["2015/348.l.729259/league_matchups_week_2"]
+    assert len(resumed_backfill_result.skipped) == 11
+    assert resumed_backfill_result.is_complete
+    # game keys come from the checkpoint and league metadata from the saved data, so only the failed unit is re-run
+    assert yahoo_query.oauth.session.requested_urls[requested_url_count:] == [failing_url]
+
+
+@pytest.mark.unit
+def test_season_backfill_refetches_data_of_season_in_progress(mock_yahoo_query, tmp_path):
+    handler = _backfill_handler(set())
+    league_fields = {"current_week": "2"}
+
+    def _in_progress_handler(url: str):
+        if url.endswith("/metadata"):
+            league_key = url.split("/league/")[1].split("/")[0]
+            return league_response(league_key, start_week="1", end_week="16", is_finished=0,
+                                   draft_status="postdraft", **league_fields)
+        return handler(url)
+
+    yahoo_query = mock_yahoo_query(_in_progress_handler)
+    season_backfill = SeasonBackfill(yahoo_query, Data(tmp_path), [2014])
+    checkpoint_saves = []
+    save_checkpoint = season_backfill._save_checkpoint
+    season_backfill._save_checkpoint = lambda: (checkpoint_saves.append(1), save_checkpoint())
+
+    backfill_result = season_backfill.run()
+
+    # the current week 2 is still in progress, so only week 1 matchups are retrieved
+    assert sorted(backfill_result.completed) == [
+        "2014/331.l.729259/league_draft_results",
+        "2014/331.l.729259/league_matchups_week_1",
+        "2014/331.l.729259/league_metadata",
+        "2014/331.l.729259/league_standings",
+        "2014/331.l.729259/league_transactions",
+    ]
+    assert season_backfill.completed_unit_ids == {
+        "2014/331.l.729259/league_draft_results", "2014/331.l.729259/league_matchups_week_1"
+    }
+    # checkpoint writes are batched: once for the game keys and once per batch of units
+    assert len(checkpoint_saves) <= 3
+
+    league_fields["current_week"] = "3"
+    resumed_backfill_result = SeasonBackfill(yahoo_query, Data(tmp_path), [2014]).run()
+
+    assert sorted(resumed_backfill_result.completed) == [
+        "2014/331.l.729259/league_matchups_week_2",
+        "2014/331.l.729259/league_metadata",
+        "2014/331.l.729259/league_standings",
+        "2014/331.l.729259/league_transactions",
+    ]
+    assert sorted(resumed_backfill_result.skipped) == [
+        "2014/331.l.729259/league_draft_results", "2014/331.l.729259/league_matchups_week_1"
+    ]
@@ -0,0 +1,428 @@
+# -*- coding: utf-8 -*-
+"""Pytest unit tests for saving and loading YFPY data locally.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tests.unit.mocks import league_response
+from yfpy.data import Data, SQLiteData
+from yfpy.exceptions import YahooFantasySportsDataCorrupted
+from yfpy.models import League, Player, PlayerStats, Roster, Stat
+
+
+def _players():
+    return [
+        Player({
+            "player_key": f"331.p.{player_id}",
+            "name": {"full": f"Player {player_id}"},
+            "player_stats": PlayerStats({"stats": [
+                {"stat": Stat({"stat_id": 4, "value": player_id * 10})},
+                {"stat": Stat({"stat_id": 5, "value": player_id})}
+            ]})
+        }) for player_id in range(1, 4)
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("storage_format", ["parquet", "arrow"])
+def test_columnar_storage_format_round_trip(tmp_path, storage_format):
+    pytest.importorskip("pyarrow")
+    data = Data(tmp_path, storage_format=storage_format)
+    json_data = Data(tmp_path / "json")
+
+    data.save("2014/players", _players)
+    json_data.save("2014/players", _players)
+
+    assert (tmp_path / "2014" / f"players.{storage_format}").exists()
+    # loaded models are identical to the models loaded from the default JSON storage format
+    assert data.load("2014/players") == json_data.load("2014/players")
+    assert data.load_table("2014/players", columns=["player_key", "stat_4"]).to_pydict() == {
+        "player_key": ["331.p.1", "331.p.2", "331.p.3"],
+        "stat_4": [10.0, 20.0, 30.0],
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("storage_format", ["json", "parquet", "arrow"])
+def test_empty_list_round_trip(tmp_path, storage_format):
+    if storage_format != "json":
+        pytest.importorskip("pyarrow")
+    data = Data(tmp_path, storage_format=storage_format)
+
+    data.save("players", lambda: [])
+
+    assert data.load("players") == []
+
+
+@pytest.mark.unit
+def test_columnar_storage_format_saves_other_data_as_json(tmp_path):
+    data = Data(tmp_path, storage_format="parquet")
+
+    league = data.save("league", lambda: League({"league_key": "331.l.729259"}))
+
+    assert (tmp_path / "league.json").exists()
+    assert data.load("league", League) == league
+    with pytest.raises(FileNotFoundError):
+        data.load_table("league")
+
+
+def _roster_handler(url: str):
+    if url.endswith("/metadata"):
+        return league_response("331.l.729259", season="2014")
+    team_key = url.split("/team/")[1].split("/")[0]
+    week = url.split("week=")[1]
+    return 200, {"fantasy_content": {"team": [
+        [{"team_key": team_key}],
+        {"roster": {"coverage_type": "week", "week": week, "0": {
+            "players": {"0": {"player": [[{"player_key": f"331.p.{week}"}]]}, "count": 1}
+        }}}
+    ]}}
+
+
+@pytest.mark.unit
+def test_sqlite_data_indexes_and_upserts_saved_data(tmp_path, mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_roster_handler)
+    data = SQLiteData(tmp_path)
+
+    data.save("league", yahoo_query.get_league_metadata)
+    for team_id in [1, 3]:
+        for week in [1, 2]:
+            data.save(f"roster_{team_id}_{week}", yahoo_query.get_team_roster_by_week,
+                      {"team_id": team_id, "chosen_week": week})
+    data.save("players", _players)
+    # saving the same name again replaces the previously saved data
+    data.save("roster_3_2", yahoo_query.get_team_roster_by_week, {"team_id": 3, "chosen_week": 2})
+
+    team_rosters = data.find(query="get_team_roster_by_week", team_key="331.l.729259.t.3", season=2014,
+                             data_type_class=Roster)
+    assert [roster.week for roster in team_rosters] == [1, 2]
+    assert all(isinstance(roster, Roster) for roster in team_rosters)
+    assert [player.player_key for player in data.find(player_key="331.p.2")] == ["331.p.2"]
+    assert data.load("league", League).season == 2014
+    assert len(data.load("players")) == 3
+    with pytest.raises(FileNotFoundError):
+        data.load("missing")
+
+
+@pytest.mark.unit
+def test_sqlite_data_derives_keys_when_league_key_was_not_retrieved(tmp_path, mock_yahoo_query):
+    def _handler(url: str):
+        if "/game/331/metadata" in url:
+            return 200, {"fantasy_content": {"game": [{"game_key": "331", "season": "2014"}]}}
+        return _roster_handler(url)
+
+    yahoo_query = mock_yahoo_query(_handler, league_key=None)
+    data = SQLiteData(tmp_path)
+
+    data.save("league", yahoo_query.get_league_metadata)
+    data.save("roster_3_1", yahoo_query.get_team_roster_by_week, {"team_id": 3, "chosen_week": 1})
+
+    assert yahoo_query.league_key is None
+    team_rosters = data.find(team_key="331.l.729259.t.3", season=2014, data_type_class=Roster)
+    assert [roster.week for roster in team_rosters] == [1]
+    assert len(data.find(league_key="331.l.729259", season=2014)) == 2
+
+
+@pytest.mark.unit
+def test_sqlite_data_empty_list_round_trip(tmp_path):
+    data = SQLiteData(tmp_path)
+
+    data.save("players", _players)
+    data.save("players", lambda: [])
+
+    assert data.load("players") == []
+    assert data.find() == []
+
+
+@pytest.mark.unit
+def test_sqlite_data_only_quotes_its_own_identifiers():
+    assert SQLiteData._quote_identifier("player_key") == '"player_key"'
+    with pytest.raises(ValueError):
+        SQLiteData._quote_identifier("player_key = player_key; DROP TABLE yfpy_data")
+
+
+@pytest.mark.unit
+def test_load_rebuilds_tagged_models_without_unpacking(tmp_path, monkeypatch):
+    data = Data(tmp_path)
+    players = data.save("players", lambda: _players()[:1])
+    league = data.save("league", lambda: League({"league_key": "331.l.729259", "season": 2014}))
+
+    def _fail_unpack_data(*args, **kwargs):
+        raise AssertionError("saved data with type tags should not be unpacked")
+
+    monkeypatch.setattr("yfpy.data.unpack_data", _fail_unpack_data)
+
+    # single-element lists are loaded as lists
+    assert data.load("players") == players
+    assert data.load("league", League) == league
+
+
+@pytest.mark.unit
+def test_load_untagged_data_saved_by_previous_versions(tmp_path):
+    (tmp_path / "players.json").write_text(
+        '[{"player": {"player_key": "331.p.1"}}, {"player": {"player_key": "331.p.2"}}]', encoding="utf-8"
+    )
+
+    players = Data(tmp_path).load("players")
+
+    assert [player.player_key for player in players] == ["331.p.1", "331.p.2"]
+    assert all(isinstance(player, Player) for player in players)
+
+
+@pytest.mark.unit
+def test_failed_save_keeps_previously_saved_data(tmp_path):
+    data = Data(tmp_path)
+    league = data.save("league", lambda: League({"league_key": "331.l.729259"}))
+
+    with pytest.raises(TypeError):
+        data.save("league", lambda: League({"league_key": "331.l.729259", "unserializable": object()}))
+
+    assert data.load("league", League) == league
+    assert [path.name for path in tmp_path.iterdir()] == ["league.json"]
+
+
+@pytest.mark.unit
+def test_concurrent_saves_with_locking_and_manifest(tmp_path):
+    data = Data(tmp_path, lock_files=True, use_manifest=True)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda idx: data.save(f"players_{idx % 2}", _players), range(16)))
+
+    assert len(data.load("players_0")) == 3
+    assert data.verify_manifest() == []
+
+    (tmp_path / "players_1.json").write_text("[]", encoding="utf-8")
+    assert data.verify_manifest() == ["players_1.json"]
+    with pytest.raises(YahooFantasySportsDataCorrupted):
+        data.load("players_1")
+
+
+@pytest.mark.unit
+def test_concurrent_manifest_updates_without_locking_saved_data(tmp_path):
+    # every instance has its own in-process lock, so only the manifest file lock keeps their updates from being lost
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda idx: Data(tmp_path, use_manifest=True).save(f"players_{idx}", _players), range(16)))
+
+    data = Data(tmp_path, use_manifest=True)
+    assert sorted(json.loads((tmp_path / "yfpy_manifest.json").read_text(encoding="utf-8"))) == sorted(
+        f"players_{idx}.json" for idx in range(16)
+    )
+    assert data.verify_manifest() == []
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("compression, file_extension", [("gzip", "gz"), ("zstd", "zst")])
+def test_compressed_data_is_detected_on_load(tmp_path, compression, file_extension):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    Data(tmp_path).save("players", _players)
+
+    players = Data(tmp_path, compression=compression).save("players", _players)
+
+    assert [path.name for path in tmp_path.iterdir()] == [f"players.json.{file_extension}"]
+    # compressed data is loaded without configuring the compression
+    assert Data(tmp_path).load("players") == players
+
+
+@pytest.mark.unit
+def test_saving_replaces_data_saved_with_other_compressions_and_formats(tmp_path):
+    pytest.importorskip("pyarrow")
+    Data(tmp_path, compression="gzip", use_manifest=True).save("players", _players)
+    Data(tmp_path, storage_format="parquet", use_manifest=True).save("players", _players)
+
+    # the plain JSON save replaces both the compressed JSON and the Parquet data saved before
+    players = Data(tmp_path, use_manifest=True).save("players", lambda: _players()[:1])
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        ".yfpy_manifest.lock", "players.json", "yfpy_manifest.json"
+    ]
+    assert Data(tmp_path, storage_format="parquet", use_manifest=True).load("players") == players
+    assert Data(tmp_path, use_manifest=True).verify_manifest() == []
+
+
+def _cache_handler(is_game_over: int, is_offseason: int = 0):
+    def _handler(url: str):
+        if "/game/331/metadata" in url:
+            game = {"game_key": "331", "season": "2014", "is_game_over": is_game_over, "is_offseason": is_offseason}
+            return 200, {"fantasy_content": {"game": [game]}}
+        return league_response("331.l.729259", season="2014")
+    return _handler
+
+
+@pytest.mark.unit
+def test_cache_never_refetches_data_of_completed_seasons(tmp_path, mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_cache_handler(is_game_over=1))
+    requested_urls = yahoo_query.oauth.session.requested_urls
+
+    for _ in range(3):
+        assert Data(tmp_path, cache=True).retrieve("league", yahoo_query.get_league_metadata, data_type_class=League)
+
+    # league metadata is retrieved once and game metadata is only checked once (and saved, since the game is over)
+    assert [url.rsplit("/", 2)[-2] for url in requested_urls] == ["331.l.729259", "331"]
+
+
+@pytest.mark.unit
+def test_cache_treats_offseason_games_as_completed(tmp_path, mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_cache_handler(is_game_over=0, is_offseason=1))
+    requested_urls = yahoo_query.oauth.session.requested_urls
+
+    for _ in range(3):
+        assert Data(tmp_path, cache=True).retrieve("league", yahoo_query.get_league_metadata, data_type_class=League)
+
+    assert [url.rsplit("/", 2)[-2] for url in requested_urls] == ["331.l.729259", "331"]
+
+
+@pytest.mark.unit
+def test_cache_refetches_stale_data_of_active_seasons(tmp_path, mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_cache_handler(is_game_over=0))
+    requested_urls = yahoo_query.oauth.session.requested_urls
+
+    data = Data(tmp_path, cache=True)
+    for _ in range(3):
+        data.retrieve("league", yahoo_query.get_league_metadata, data_type_class=League)
+    assert len([url for url in requested_urls if "/league/" in url]) == 3
+    # the game of an active season is only checked once within the game status check interval
+    assert len([url for url in requested_urls if "/game/" in url]) == 1
+
+    for _ in range(2):
+        Data(tmp_path, cache=True, cache_ttl=60).retrieve("league", yahoo_query.get_league_metadata)
+    assert len([url for url in requested_urls if "/league/" in url]) == 3
+
+
+@pytest.mark.unit
+def test_derived_cache_keys_and_memoized_queries(tmp_path, mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_roster_handler)
+    requested_urls = yahoo_query.oauth.session.requested_urls
+
+    data = Data(tmp_path, cache=True, cache_ttl=60)
+    assert data.get_cache_key(yahoo_query.get_team_roster_by_week, {"team_id": 3, "chosen_week": 1}) == (
+        "331/331.l.729259/get_team_roster_by_week/team_id=3,chosen_week=1"
+    )
+    # omitted default parameters result in the same key as explicitly passed ones
+    player_stats_params = {"player_key": "331.p.1", "chosen_week": 1}
+    assert data.get_cache_key(yahoo_query.get_player_stats_by_week, player_stats_params) == data.get_cache_key(
+        yahoo_query.get_player_stats_by_week, {**player_stats_params, "limit_to_league_stats": True}
+    )
+    assert data.get_cache_key(yahoo_query.get_league_metadata) == "331/331.l.729259/get_league_metadata"
+
+    get_roster = data.memoize(yahoo_query.get_team_roster_by_week, Roster)
+    assert get_roster(3, chosen_week=1).week == get_roster(team_id=3, chosen_week=1).week == 1
+    assert get_roster(3, 2).week == 2
+    assert len(requested_urls) == 2
+    assert (tmp_path / "331" / "331.l.729259" / "get_team_roster_by_week" / "team_id=3,chosen_week=1.json").exists()
+    assert data.load(yf_query=yahoo_query.get_team_roster_by_week, params={"team_id": 3, "chosen_week": 2}).week == 2
+
+
+@pytest.mark.unit
+def test_derived_cache_keys_resolve_the_current_season(tmp_path, mock_yahoo_query):
+    def _handler(url: str):
+        if "/game/nfl/metadata" in url:
+            return 200, {"fantasy_content": {"game": [{"game_key": "331", "season": "2014"}]}}
+        return league_response("331.l.729259", season="2014")
+
+    yahoo_query = mock_yahoo_query(_handler, league_key=None)
+    yahoo_query.game_id = None
+    requested_urls = yahoo_query.oauth.session.requested_urls
+
+    data = Data(tmp_path)
+    for _ in range(2):
+        assert data.get_cache_key(yahoo_query.get_league_metadata) == "331/331.l.729259/get_league_metadata"
+    # the league key of the current season is only retrieved once within the game status check interval
+    assert requested_urls == ["https://fantasysports.yahooapis.com/fantasy/v2/game/nfl/metadata"]
+
+
+@pytest.mark.unit
+def test_queries_of_relative_data_are_not_cached(tmp_path, mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_roster_handler)
+    requested_urls = yahoo_query.oauth.session.requested_urls
+
+    data = Data(tmp_path, cache=True, cache_ttl=60)
+    with pytest.raises(ValueError, match="chosen_week"):
+        data.get_cache_key(yahoo_query.get_team_roster_by_week, {"team_id": 3})
+
+    get_roster = data.memoize(yahoo_query.get_team_roster_by_week, Roster)
+    for _ in range(2):
+        assert get_roster(3).week == "current"
+    assert len(requested_urls) == 2
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.unit
+def test_prune_evicts_expired_and_least_recently_used_data(tmp_path):
+    data = Data(tmp_path, use_manifest=True)
+    for file_name in ["331/331.l.1/players", "331/331.l.1/standings", "331/331.l.2/players", "348/348.l.1/players"]:
+        data.save(file_name, _players)
+    file_size = (tmp_path / "331" / "331.l.1" / "players.json").stat().st_size
+
+    now = time.time()
+    for age, file_name in enumerate(["331/331.l.1/players", "331/331.l.1/standings", "331/331.l.2/players"], 1):
+        os.utime(tmp_path / f"{file_name}.json", (now - age * 100, now - age * 100))
+    os.utime(tmp_path / "348" / "348.l.1" / "players.json", (now - 1000, now - 1000))
+    data.load("348/348.l.1/players")
+
+    usage = data.get_cache_usage()
+    assert {group: group_usage["files"] for group, group_usage in usage.items()} == {
+        "331/331.l.1": 2, "331/331.l.2": 1, "348/348.l.1": 1
+    }
+    assert data.get_cache_usage(depth=1)["331"]["size"] == 3 * file_size
+
+    # expired data is evicted per file name pattern, then the least recently used data until the rest fits
+    assert data.prune(max_age={"*/standings": 150}) == ["331/331.l.1/standings"]
+    assert data.prune(max_bytes=2 * file_size) == ["331/331.l.2/players"]
+    assert not (tmp_path / "331" / "331.l.2").exists()
+    assert data.verify_manifest() == []
+    assert data.prune(max_age=0, file_name_prefix="331/") == ["331/331.l.1/players"]
+    assert list(data.get_cache_usage().keys()) == ["348/348.l.1"]
+
+
+@pytest.mark.unit
+def test_prune_never_evicts_game_metadata_or_backfill_checkpoints(tmp_path, mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_cache_handler(is_game_over=1))
+    data = Data(tmp_path, cache=True)
+    for _ in range(2):
+        data.retrieve("league", yahoo_query.get_league_metadata)
+    data.save("backfill_checkpoint", dict)
+
+    assert list(data.get_cache_usage(depth=1).keys()) == ["league"]
+    assert data.prune(max_age=0) == ["league"]
+    assert (tmp_path / "yfpy_games" / "game_331.json").is_file()
+    assert (tmp_path / "backfill_checkpoint.json").is_file()
+
+
+@pytest.mark.unit
+def test_saving_data_only_scans_saved_data_when_pruning_is_due(tmp_path, monkeypatch):
+    data = Data(tmp_path, max_cache_bytes=10 ** 6, max_cache_age=3600)
+    cache_scans = []
+    get_cache_entries = data._get_cache_entries
+    monkeypatch.setattr(data, "_get_cache_entries", lambda: cache_scans.append(1) or get_cache_entries())
+
+    for i in range(5):
+        data.save(f"players_{i}", _players)
+    # the saved data is only measured once, and its size is tracked as data is saved until it exceeds the maximum
+    assert len(cache_scans) == 1
+    assert data._data_cache._cache_size == sum(path.stat().st_size for path in tmp_path.iterdir())
+
+    data.max_cache_bytes = data._data_cache._cache_size
+    data.save("players_5", _players)
+    assert len(cache_scans) == 2
+    assert len(list(tmp_path.iterdir())) == 5
+
+
+@pytest.mark.unit
+def test_saving_data_enforces_the_maximum_cache_size(tmp_path):
+    Data(tmp_path).save("players_0", _players)
+    max_cache_bytes = 2 * (tmp_path / "players_0.json").stat().st_size
+
+    data = Data(tmp_path, max_cache_bytes=max_cache_bytes)
+    for i in range(1, 4):
+        os.utime(tmp_path / f"players_{i - 1}.json", (time.time() - 10, time.time() - 10))
+        data.save(f"players_{i}", _players)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["players_2.json", "players_3.json"]
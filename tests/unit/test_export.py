@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""Pytest unit tests for exporting YFPY models to columnar data.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import pytest
+
+from yfpy.export import to_arrow, to_columns, to_pandas
+from yfpy.models import Player, PlayerStats, Roster, Scoreboard, Stat
+
+
+def _player(player_id: int, stat_values: dict) -> Player:
+    return Player({
+        "player_id": player_id,
+        "player_key": f"331.p.{player_id}",
+        "eligible_positions": [{"position": "WR"}],
+        "player_stats": PlayerStats({
+            "stats": [{"stat": Stat({"stat_id": stat_id, "value": value})} for stat_id, value in stat_values.items()]
+        })
+    })
+
+
+@pytest.mark.unit
+def test_to_columns_pivots_stats_by_stat_id():
+    players = [_player(1, {4: "10", 5: "2"}), _player(2, {5: "1", 6: "7"})]
+
+    columns = to_columns(players, fields=["player_key", "eligible_positions"], stat_column_names={6: "ret_td"})
+
+    assert columns == {
+        "player_key": ["331.p.1", "331.p.2"],
+        "eligible_positions": [["WR"], ["WR"]],
+        "stat_4": [10.0, None],
+        "stat_5": [2.0, 1.0],
+        "ret_td": [None, 7.0],
+    }
+
+
+@pytest.mark.unit
+def test_to_columns_adds_key_column_for_keyed_collections():
+    columns = to_columns({1: [_player(1, {})], 2: [_player(1, {}), _player(2, {})]}, fields=["player_id"],
+                         key_column="week")
+
+    assert columns == {"week": [1, 2, 2], "player_id": [1, 1, 2]}
+
+
+@pytest.mark.unit
+def test_to_pandas_and_to_arrow():
+    pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    players = [_player(1, {4: "10"}), _player(2, {4: "5"})]
+
+    assert to_pandas(players)["stat_4"].sum() == 15.0
+    assert to_arrow(players).num_rows == 2
+
+
+def _roster_handler(url: str):
+    week = int(url.split("week=")[1])
+    players = {
+        str(idx): {"player": [[{"player_key": f"331.p.{player_id}"}, {"player_id": str(player_id)}]]}
+        for idx, player_id in enumerate(range(week, week + 2))
+    }
+    return 200, {"fantasy_content": {"team": [
+        [{"team_key": "331.l.729259.t.1"}],
+        {"roster": {"coverage_type": "week", "week": str(week), "0": {"players": {**players, "count": 2}}}}
+    ]}}
+
+
+def _scoreboard_handler(url: str):
+    week = int(url.split("week=")[1])
+    return 200, {"fantasy_content": {"league": [
+        {"league_key": "331.l.729259"},
+        {"scoreboard": {"week": str(week), "0": {"matchups": {
+            "0": {"matchup": {"week": str(week), "status": "postevent"}}, "count": 1
+        }}}}
+    ]}}
+
+
+@pytest.mark.unit
+def test_to_columns_unwraps_rosters_returned_by_weeks(mock_yahoo_query):
+    rosters = mock_yahoo_query(_roster_handler).get_team_roster_by_weeks(1, [1, 2])
+    assert all(isinstance(roster, Roster) for roster in rosters.values())
+
+    columns = to_columns(rosters, fields=["player_key"], include_stats=False, key_column="week")
+
+    assert columns == {"week": [1, 1, 2, 2], "player_key": ["331.p.1", "331.p.2", "331.p.2", "331.p.3"]}
+
+
+@pytest.mark.unit
+def test_to_columns_unwraps_scoreboards_returned_by_weeks(mock_yahoo_query):
+    scoreboards = mock_yahoo_query(_scoreboard_handler).get_league_scoreboard_by_weeks([1, 2])
+    assert all(isinstance(scoreboard, Scoreboard) for scoreboard in scoreboards.values())
+
+    columns = to_columns(scoreboards, fields=["week", "status"], key_column="scoreboard_week")
+
+    assert columns == {"scoreboard_week": [1, 2], "week": [1, 2], "status": ["postevent", "postevent"]}
+
+
+@pytest.mark.unit
+def test_to_columns_rejects_unsupported_data():
+    with pytest.raises(TypeError, match="expected a YFPY model"):
+        to_columns({1: ["331.p.1"]})
+    with pytest.raises(TypeError, match="expected a YFPY model or an iterable"):
+        to_columns("331.p.1")
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""Pytest unit tests for lazy loading of the public YFPY API.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import yfpy
+
+project_dir = Path(__file__).parent.parent.parent
+
+
+def _get_imported_modules(import_statements: str) -> set:
+    # run the imports in a fresh interpreter, since the test session has already imported everything
+    imported_modules_json = subprocess.check_output(
+        [sys.executable, "-c", f"import json, sys\n{import_statements}\nprint(json.dumps(list(sys.modules)))"],
+        cwd=project_dir
+    )
+    return set(json.loads(imported_modules_json))
+
+
+@pytest.mark.unit
+def test_models_and_offline_data_do_not_import_the_query_stack():
+    imported_modules = _get_imported_modules(
+        "import yfpy\nfrom yfpy import Data, Player\nfrom yfpy.models import League"
+    )
+
+    assert {"yfpy.data", "yfpy.models"} <= imported_modules
+    assert not {"yfpy.query", "requests", "yahoo_oauth", "dotenv"} & imported_modules
+
+
+@pytest.mark.unit
+def test_public_api_is_loaded_lazily():
+    imported_modules = _get_imported_modules("import yfpy")
+    assert not {name for name in imported_modules if name.startswith("yfpy.")}
+
+    from yfpy.query import YahooFantasySportsQuery
+    assert yfpy.YahooFantasySportsQuery is YahooFantasySportsQuery
+    assert set(yfpy.__all__) <= set(dir(yfpy))
+    with pytest.raises(AttributeError):
+        getattr(yfpy, "NotAPublicAttribute")
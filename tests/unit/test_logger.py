@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Pytest unit tests for the custom YFPY logger.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import logging
+
+import pytest
+
+from yfpy.logger import (
+    DEFAULT_HANDLER_NAME, LogPayload, _parse_log_payload_max_length, disable_default_log_handlers, get_logger
+)
+from yfpy import logger as yfpy_logger
+
+
+@pytest.fixture
+def restore_default_handlers():
+    yield
+    yfpy_logger._default_handlers_enabled = True
+
+
+@pytest.mark.unit
+def test_log_payload_is_formatted_lazily_and_truncated():
+    calls = []
+
+    def build_payload():
+        calls.append(1)
+        return "x" * 20
+
+    payload = LogPayload(build_payload, max_length=5)
+    assert calls == []
+    assert str(payload) == "xxxxx... [truncated 15 of 20 characters]"
+    assert calls == [1]
+    assert str(LogPayload({"a": 1}, max_length=0)) == "{'a': 1}"
+
+
+@pytest.mark.unit
+def test_log_payload_is_not_formatted_when_level_is_disabled():
+    logger = get_logger("yfpy.test_logger.disabled_level")
+    logger.setLevel(logging.INFO)
+    calls = []
+
+    logger.debug("Payload: %s", LogPayload(lambda: calls.append(1)))
+
+    assert calls == []
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("value, expected", [(None, 5000), ("", 5000), ("100", 100), ("0", 0), ("abc", 5000),
+                                             ("-1", 5000)])
+def test_parse_log_payload_max_length_falls_back_to_default(value, expected):
+    assert _parse_log_payload_max_length(value) == expected
+
+
+@pytest.mark.unit
+def test_get_logger_attaches_one_handler_and_keeps_configured_level():
+    logger = get_logger("yfpy.test_logger.repeated")
+    logger.setLevel(logging.DEBUG)
+
+    assert get_logger("yfpy.test_logger.repeated") is logger
+    assert logger.level == logging.DEBUG
+    assert [handler.get_name() for handler in logger.handlers] == [DEFAULT_HANDLER_NAME]
+
+
+@pytest.mark.unit
+def test_disable_default_log_handlers(restore_default_handlers):
+    logger = get_logger("yfpy.test_logger.disabled_handlers")
+    host_handler = logging.NullHandler()
+    logger.addHandler(host_handler)
+
+    disable_default_log_handlers("yfpy.test_logger")
+
+    assert logger.handlers == [host_handler]
+    assert get_logger("yfpy.test_logger.created_after_disabling").handlers == []
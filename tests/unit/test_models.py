@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Pytest unit tests for YFPY model constructors generated from model field specifications.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import inspect
+
+import pytest
+
+from yfpy import models
+from yfpy.models import PercentOwned, Player, YahooFantasyObject, _extract_model_fields
+
+
+def _model_classes():
+    return [
+        model_class for _, model_class in inspect.getmembers(models, inspect.isclass)
+        if issubclass(model_class, YahooFantasyObject) and model_class is not YahooFantasyObject
+        and "_fields" in model_class.__dict__
+    ]
+
+
+@pytest.mark.unit
+def test_generated_constructor_casts_values_and_falls_back_to_defaults():
+    percent_owned = PercentOwned({"coverage_type": "week", "week": 3, "value": "42", "delta": "abc"})
+
+    assert percent_owned.coverage_type == "week"
+    assert percent_owned.week == 3
+    assert percent_owned.value == 42
+    assert percent_owned.delta == 0.0
+
+
+@pytest.mark.unit
+def test_generated_constructor_builds_default_models_and_nested_values():
+    player = Player({"player_id": 7200, "percent_owned": PercentOwned({"value": "12"})})
+
+    assert player.player_id == 7200
+    assert player.percent_owned_value == 12.0
+    assert isinstance(Player({}).percent_owned, PercentOwned)
+    assert Player({}).eligible_positions_to_add is not Player({}).eligible_positions_to_add
+
+
+@pytest.mark.unit
+def test_generated_constructor_keeps_all_eligible_positions():
+    player = Player({"eligible_positions": [{"position": "WR"}, {"position": "TE"}, {"position": "W/R/T"}]})
+
+    assert player.eligible_positions == ["WR", "TE", "W/R/T"]
+    assert Player({"eligible_positions": {"position": "QB"}}).eligible_positions == ["QB"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("model_class", _model_classes(), ids=lambda model_class: model_class.__name__)
+@pytest.mark.parametrize("value", [None, "1", 1, "abc", {}])
+def test_model_constructors_match_field_extraction(model_class, value):
+    extracted_data = {field.path: value for field in model_class._fields if isinstance(field.path, str)}
+
+    for data in [{}, extracted_data]:
+        reference_model = model_class.__new__(model_class)
+        YahooFantasyObject.__init__(reference_model, data)
+        try:
+            _extract_model_fields(reference_model, model_class._fields)
+        except (AttributeError, TypeError, ValueError) as err:
+            # values that cannot be extracted fail the same way in the model constructor
+            with pytest.raises(type(err)):
+                model_class(data)
+        else:
+            assert vars(model_class(data)) == vars(reference_model)
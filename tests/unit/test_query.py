@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""Pytest unit tests for YFPY query request handling.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tests.unit.mocks import MockOAuth, MockSession, league_response
+from yfpy.models import Player
+from yfpy.query import YahooFantasySportsQuery
+from yfpy.utils import AdaptivePageSize
+
+
+def _league_players_handler(player_count: int, bad_player_indices):
+    def _handler(url: str):
+        start = int(url.split("start=")[1].split(";")[0])
+        count = int(url.split("count=")[1].split(";")[0])
+        player_indices = range(start, min(start + count, player_count))
+        if any(player_index in bad_player_indices for player_index in player_indices):
+            return 400, {"error": {"description": "invalid player"}}
+        players = {
+            str(idx): {"player": [[{"player_key": f"331.p.{player_index}"}]]}
+            for idx, player_index in enumerate(player_indices)
+        }
+        return 200, {"fantasy_content": {"league": [
+            {"league_key": "331.l.729259"},
+            {"players": {**players, "count": len(players)} if players else []}
+        ]}}
+    return _handler
+
+
+@pytest.mark.unit
+def test_get_league_players_bisects_failed_batches(mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_league_players_handler(40, {7, 30}), retries=0)
+    requested_urls = yahoo_query.oauth.session.requested_urls
+
+    players = yahoo_query.get_league_players()
+
+    assert [player.player_key for player in players] == [f"331.p.{idx}" for idx in range(40) if idx not in {7, 30}]
+    assert [failure["failed_player_retrieval_index"] for failure in yahoo_query.failed_league_player_retrievals] == [
+        7, 30
+    ]
+    # each failed batch of 25 players is split in half (2 requests per split) until the bad player is isolated after 5
+    # splits, instead of being retried with 25 single-player requests
+    assert len(requested_urls) == 2 + 2 * (2 * 5)
+
+
+@pytest.mark.unit
+def test_get_league_players_bisection_respects_player_count_limit(mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_league_players_handler(60, {3}), retries=0)
+
+    players = yahoo_query.get_league_players(player_count_limit=10)
+
+    assert [player.player_key for player in players] == [f"331.p.{idx}" for idx in range(10) if idx != 3]
+
+
+@pytest.mark.unit
+def test_get_league_players_with_single_player_pages(mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_league_players_handler(3, set()), retries=0)
+
+    players = yahoo_query.get_league_players(page_size=1)
+
+    assert all(isinstance(player, Player) for player in players)
+    assert [player.player_key for player in players] == [f"331.p.{idx}" for idx in range(3)]
+
+
+@pytest.mark.unit
+def test_get_league_players_records_failed_single_player_pages(mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_league_players_handler(5, {3}), retries=0)
+    requested_urls = yahoo_query.oauth.session.requested_urls
+
+    yahoo_query.get_league_players(page_size=1)
+
+    assert [failure["failed_player_retrieval_index"] for failure in yahoo_query.failed_league_player_retrievals] == [3]
+    # a failed page of a single player is not split into an empty page and retrieved again
+    assert [url.split("players;")[1] for url in requested_urls] == [f"start={idx};count=1" for idx in range(6)]
+
+
+@pytest.mark.unit
+def test_adaptive_page_size_backs_off_and_recovers():
+    page_size = AdaptivePageSize(20, min_page_size=5, max_page_size=25, target_latency=1.0, max_payload_bytes=1000)
+
+    page_size.record_success(latency=0.1, payload_bytes=500)
+    assert page_size.page_size == 25
+    page_size.record_success(latency=1.5, payload_bytes=500)
+    assert page_size.page_size == 12
+    page_size.record_success(latency=0.1, payload_bytes=5000)
+    page_size.record_failure()
+    assert page_size.page_size == 5
+    page_size.record_success(latency=0.1)
+    assert page_size.page_size == 10
+
+    fixed_page_size = AdaptivePageSize(25, adaptive=False)
+    fixed_page_size.record_failure()
+    assert fixed_page_size.page_size == 25
+
+
+@pytest.mark.unit
+def test_get_league_players_uses_adaptive_page_size(mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_league_players_handler(60, {3}), retries=0, adaptive_page_size=True)
+    requested_urls = yahoo_query.oauth.session.requested_urls
+
+    players = yahoo_query.get_league_players()
+
+    assert len(players) == 59
+    # the failed first page halves the page size, and each following fast page increases it again
+    page_requests = [url.split("players;")[1] for url in requested_urls]
+    assert page_requests[0] == "start=0;count=25"
+    assert page_requests[-4:] == ["start=25;count=12", "start=37;count=17", "start=54;count=22", "start=60;count=25"]
+
+
+@pytest.mark.unit
+def test_adaptive_page_size_ignores_rate_limiting_waits(mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(
+        _league_players_handler(60, set()), requests_per_second=20, league_player_page_size=10, adaptive_page_size=True
+    )
+    yahoo_query._league_player_page_size.target_latency = 0.02
+    requested_urls = yahoo_query.oauth.session.requested_urls
+
+    assert len(yahoo_query.get_league_players()) == 60
+    # the requests are fast even though each one waits for the rate limiter, so every page increases the page size
+    assert [url.split("players;")[1] for url in requested_urls] == [
+        "start=0;count=10", "start=10;count=15", "start=25;count=20", "start=45;count=25", "start=60;count=25"
+    ]
+
+
+@pytest.mark.unit
+def test_identical_concurrent_queries_share_a_single_request(mock_yahoo_query):
+    release_response = threading.Event()
+
+    def _handler(url: str):
+        release_response.wait(timeout=5)
+        return league_response("331.l.729259", season="2014")
+
+    yahoo_query = mock_yahoo_query(_handler)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(yahoo_query.get_league_metadata) for _ in range(4)]
+        # release the response once all other callers are waiting for the in-flight request
+        while yahoo_query._in_flight_queries.coalesced_calls < 3:
+            time.sleep(0.01)
+        release_response.set()
+        leagues = [future.result() for future in futures]
+
+    assert len(yahoo_query.oauth.session.requested_urls) == 1
+    assert all(league == leagues[0] for league in leagues)
+
+    # every caller gets its own copy of the shared models
+    leagues[0].league_key = "331.l.1"
+    assert [league.league_key for league in leagues[1:]] == ["331.l.729259"] * 3
+
+    # subsequent (non-concurrent) queries are not coalesced
+    yahoo_query.get_league_metadata()
+    assert len(yahoo_query.oauth.session.requested_urls) == 2
+
+
+class _FakeOAuth2(MockOAuth):
+    instances = []
+
+    def __init__(self, consumer_key, consumer_secret, **kwargs):
+        super().__init__(MockSession(lambda url: league_response("331.l.729259")), token_time=kwargs.get("token_time"))
+        self.consumer_key = consumer_key
+        self.consumer_secret = consumer_secret
+        self.access_token = kwargs.get("access_token") or self.access_token
+        self.refresh_token = kwargs.get("refresh_token") or self.refresh_token
+        _FakeOAuth2.instances.append(self)
+
+
+@pytest.mark.unit
+def test_authentication_is_lazy_and_shared_per_account(monkeypatch):
+    monkeypatch.setattr("yfpy.query.OAuth2", _FakeOAuth2)
+    monkeypatch.setattr(_FakeOAuth2, "instances", [])
+
+    def _create_query(league_id: str, consumer_key: str = "lazy_consumer_key") -> YahooFantasySportsQuery:
+        return YahooFantasySportsQuery(
+            league_id, "nfl", game_id=331, yahoo_consumer_key=consumer_key, yahoo_consumer_secret="consumer_secret",
+            env_var_fallback=False
+        )
+
+    yahoo_queries = [_create_query(league_id) for league_id in ["1", "2", "3"]]
+    other_account_query = _create_query("1", consumer_key="other_consumer_key")
+    assert _FakeOAuth2.instances == []
+
+    for yahoo_query in yahoo_queries:
+        yahoo_query.league_key = f"331.l.{yahoo_query.league_id}"
+        yahoo_query.get_league_metadata()
+    assert len(_FakeOAuth2.instances) == 1
+    assert len(_FakeOAuth2.instances[0].session.requested_urls) == 3
+
+    assert other_account_query.oauth is not yahoo_queries[0].oauth
+    assert len(_FakeOAuth2.instances) == 2
+
+
+@pytest.mark.unit
+def test_authentication_is_only_shared_by_instances_with_the_same_token_source(monkeypatch, tmp_path):
+    monkeypatch.setattr("yfpy.query.OAuth2", _FakeOAuth2)
+    monkeypatch.setattr(_FakeOAuth2, "instances", [])
+
+    def _create_query(token_file_name: str) -> YahooFantasySportsQuery:
+        return YahooFantasySportsQuery(
+            "729259", "nfl", game_id=331, yahoo_consumer_key="token_source_consumer_key",
+            yahoo_consumer_secret="consumer_secret", env_var_fallback=False, token_store_path=tmp_path / token_file_name
+        )
+
+    yahoo_query = _create_query("tokens.json")
+
+    # without a known account GUID, instances with different token stores may authenticate as different accounts
+    assert _create_query("tokens.json")._shared_auth is yahoo_query._shared_auth
+    assert _create_query("other_tokens.json")._shared_auth is not yahoo_query._shared_auth
+
+
+@pytest.mark.unit
+def test_token_store_shares_a_single_refresh_across_processes(monkeypatch, tmp_path):
+    monkeypatch.setattr("yfpy.query.OAuth2", _FakeOAuth2)
+    monkeypatch.setattr(_FakeOAuth2, "instances", [])
+
+    # separate (unshared) authentication states stand in for separate worker processes using the same token store
+    yahoo_queries = [
+        YahooFantasySportsQuery(
+            "729259", "nfl", game_id=331, yahoo_consumer_key="store_consumer_key",
+            yahoo_consumer_secret="consumer_secret", env_var_fallback=False, share_authentication=False,
+            token_store_path=tmp_path / "tokens.json"
+        ) for _ in range(3)
+    ]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        oauth_clients = list(executor.map(lambda yahoo_query: yahoo_query.oauth, yahoo_queries))
+
+    assert len(set(map(id, oauth_clients))) == 3
+    assert sum(oauth.refresh_count for oauth in oauth_clients) == 1
+    assert {oauth.session.access_token for oauth in oauth_clients} == {"access_token_1"}
+
+
+@pytest.mark.unit
+def test_instances_sharing_authentication_reconcile_token_settings(monkeypatch, tmp_path):
+    monkeypatch.setattr("yfpy.query.OAuth2", _FakeOAuth2)
+    monkeypatch.setattr(_FakeOAuth2, "instances", [])
+    warnings = []
+    monkeypatch.setattr("yfpy.query.logger.warning", warnings.append)
+
+    def _create_query(**kwargs) -> YahooFantasySportsQuery:
+        # instances only share authentication with different token stores once the account GUID is known
+        return YahooFantasySportsQuery(
+            "729259", "nfl", game_id=331, env_var_fallback=False, yahoo_access_token_json={
+                "access_token": "access_token", "consumer_key": "reconciled_consumer_key",
+                "consumer_secret": "consumer_secret", "guid": "guid", "refresh_token": "refresh_token",
+                "token_time": time.time(), "token_type": "bearer"
+            }, **kwargs
+        )
+
+    yahoo_query = _create_query()
+    assert yahoo_query.oauth is not None
+    shared_auth = yahoo_query._shared_auth
+
+    stored_query = _create_query(token_store_path=tmp_path / "tokens.json", token_refresh_margin=600.0)
+    assert stored_query.oauth is yahoo_query.oauth
+    assert shared_auth.token_store.token_file_path == tmp_path / "tokens.json"
+    assert shared_auth.token_refresh_margin == 600.0
+
+    other_stored_query = _create_query(token_store_path=tmp_path / "other_tokens.json", token_refresh_margin=60.0)
+    assert other_stored_query.oauth is yahoo_query.oauth
+    assert shared_auth.token_store.token_file_path == tmp_path / "tokens.json"
+    assert shared_auth.token_refresh_margin == 600.0
+    assert len(warnings) == 1 and "other_tokens.json" in warnings[0]
+
+
+@pytest.mark.unit
+def test_access_token_is_refreshed_ahead_of_expiry(mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(lambda url: league_response("331.l.729259"), token_refresh_margin=300.0)
+    yahoo_query.oauth.token_time = time.time() - 3400
+
+    yahoo_query.get_league_metadata()
+    yahoo_query.get_league_metadata()
+
+    assert yahoo_query.oauth.refresh_count == 1
+    assert yahoo_query.oauth.session.access_token == "access_token_1"
+
+
+@pytest.mark.unit
+def test_unauthorized_requests_collapse_into_one_refresh_and_replay_without_retries(mock_yahoo_query):
+    thread_count = 5
+    unauthorized_barrier = threading.Barrier(thread_count, timeout=5)
+
+    def handler(url):
+        if getattr(yahoo_query.oauth.session, "access_token", "access_token") == "access_token":
+            # make every thread send its request with the expired access token before any of them refreshes it
+            unauthorized_barrier.wait()
+            return 401, {"error": {"description": "Please provide valid credentials."}}
+        return league_response("331.l.729259")
+
+    yahoo_query = mock_yahoo_query(handler, retries=0)
+    urls = [f"https://fantasysports.yahooapis.com/fantasy/v2/league/331.l.{league_id}" for league_id in range(5)]
+    with ThreadPoolExecutor(max_workers=thread_count) as executor:
+        responses = list(executor.map(yahoo_query.get_response, urls))
+
+    assert [response.status_code for response in responses] == [200] * thread_count
+    assert yahoo_query.oauth.refresh_count == 1
+    assert len(yahoo_query.oauth.session.requested_urls) == 2 * thread_count
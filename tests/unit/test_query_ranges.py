@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Pytest unit tests for YFPY queries retrieving data for multiple weeks or dates.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import pytest
+
+from yfpy.models import Matchup, Scoreboard
+
+
+def _matchup(week: int):
+    return {"matchup": {"week": str(week), "status": "postevent", "is_tied": 0}}
+
+
+def _matchups_handler(url: str):
+    if "/scoreboard;week=" in url:
+        week = int(url.split("week=")[1])
+        return 200, {"fantasy_content": {"league": [
+            {"league_key": "331.l.729259"},
+            {"scoreboard": {"week": str(week), "0": {"matchups": {"0": _matchup(week), "count": 1}}}}
+        ]}}
+    if "/matchups;weeks=" in url:
+        weeks = [int(week) for week in url.split("weeks=")[1].split(",")]
+        matchups = {str(idx): _matchup(week) for idx, week in enumerate(weeks)}
+        return 200, {"fantasy_content": {"team": [
+            [{"team_key": "331.l.729259.t.1"}],
+            {"matchups": {**matchups, "count": len(weeks)}}
+        ]}}
+    return 400, {"error": {"description": "unexpected url"}}
+
+
+@pytest.mark.unit
+def test_get_league_scoreboard_by_weeks(mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_matchups_handler)
+
+    scoreboards = yahoo_query.get_league_scoreboard_by_weeks(range(1, 4), max_workers=3)
+
+    assert list(scoreboards.keys()) == [1, 2, 3]
+    assert all(isinstance(scoreboard, Scoreboard) for scoreboard in scoreboards.values())
+    assert [scoreboard.week for scoreboard in scoreboards.values()] == [1, 2, 3]
+    assert len(yahoo_query.oauth.session.requested_urls) == 3
+
+
+@pytest.mark.unit
+def test_get_team_matchups_by_weeks_uses_single_request(mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_matchups_handler)
+
+    matchups_by_week = yahoo_query.get_team_matchups_by_weeks(1, [1, 2, 3])
+
+    assert list(matchups_by_week.keys()) == [1, 2, 3]
+    assert all(isinstance(matchups[0], Matchup) for matchups in matchups_by_week.values())
+    assert yahoo_query.oauth.session.requested_urls == [
+        "https://fantasysports.yahooapis.com/fantasy/v2/team/331.l.729259.t.1/matchups;weeks=1,2,3"
+    ]
+
+
+@pytest.mark.unit
+def test_get_player_stats_by_date_range_rejects_reversed_range(mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_matchups_handler)
+
+    with pytest.raises(ValueError):
+        yahoo_query.get_player_stats_by_date_range("nhl.p.4588", "2011-05-07", "2011-05-01")
+
+
+def _game_and_matchups_handler(url: str):
+    if url.endswith("/game/331/metadata"):
+        return 200, {"fantasy_content": {"game": [{"game_key": "331", "game_id": "331", "code": "nfl"}]}}
+    return _matchups_handler(url)
+
+
+@pytest.mark.unit
+def test_by_weeks_queries_resolve_league_key_once(mock_yahoo_query):
+    yahoo_query = mock_yahoo_query(_game_and_matchups_handler, league_key=None)
+
+    scoreboards = yahoo_query.get_league_scoreboard_by_weeks(range(1, 4), max_workers=3)
+
+    assert list(scoreboards.keys()) == [1, 2, 3]
+    requested_urls = yahoo_query.oauth.session.requested_urls
+    assert requested_urls[0] == "https://fantasysports.yahooapis.com/fantasy/v2/game/331/metadata"
+    assert sorted(requested_urls[1:]) == [
+        f"https://fantasysports.yahooapis.com/fantasy/v2/league/331.l.729259/scoreboard;week={week}"
+        for week in range(1, 4)
+    ]
+    # the pinned league key is only used while the concurrent query runs
+    assert yahoo_query._pinned_league_key is None
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Pytest unit tests for compact serialization of YFPY models.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import pytest
+
+from yfpy.models import Player, Team, YahooFantasyObject
+from yfpy.serialization import TYPE_TAG, deserialize, serialize, to_tagged_data
+from yfpy.utils import unpack_data
+
+
+def _team() -> Team:
+    return unpack_data({"team": [
+        [{"team_key": "331.l.729259.t.1"}, {"name": "Ünicode Team"}],
+        {"roster": {"0": {"players": {
+            "0": {"player": [[{"player_key": "331.p.7200"}, {"name": {"full": "Aaron Rodgers"}}]]},
+            "1": {"player": [[{"player_key": "331.p.5479"}, {"eligible_positions": [{"position": "WR"}]}]]},
+            "count": 2
+        }}}}
+    ]}, YahooFantasyObject)["team"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("serialization_format", ["json", "msgpack", "cbor"])
+def test_serialize_round_trip(serialization_format):
+    if serialization_format != "json":
+        pytest.importorskip({"msgpack": "msgpack", "cbor": "cbor2"}[serialization_format])
+    team = _team()
+
+    deserialized_team = deserialize(serialize(team, serialization_format), serialization_format)
+
+    assert deserialized_team == team
+    assert isinstance(deserialized_team.players[0], Player)
+    assert deserialized_team.name == "Ünicode Team".encode("utf-8")
+
+
+@pytest.mark.unit
+def test_serialize_json_is_compact_and_tagged():
+    serialized_team = serialize([_team()])
+
+    assert "\n" not in serialized_team and ", " not in serialized_team
+    assert to_tagged_data(_team())[TYPE_TAG] == "Team"
+    with pytest.raises(ValueError):
+        serialize(_team(), "xml")
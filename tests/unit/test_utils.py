@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Pytest unit tests for YFPY utilities.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import os
+import stat
+
+import pytest
+
+from yfpy.auth import TokenStore
+from yfpy.utils import _get_umask, atomic_write
+
+
+def _get_mode(file_path) -> int:
+    return stat.S_IMODE(file_path.stat().st_mode)
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(os.name != "posix", reason="file permissions are only enforced on POSIX systems")
+def test_atomic_write_uses_default_and_existing_file_permissions(tmp_path):
+    file_path = tmp_path / "data.json"
+
+    with atomic_write(file_path) as temporary_file_path:
+        temporary_file_path.write_text("{}", encoding="utf-8")
+    assert _get_mode(file_path) == 0o666 & ~_get_umask()
+
+    file_path.chmod(0o640)
+    with atomic_write(file_path) as temporary_file_path:
+        temporary_file_path.write_text("[]", encoding="utf-8")
+    assert _get_mode(file_path) == 0o640
+    assert file_path.read_text(encoding="utf-8") == "[]"
+    assert [path.name for path in tmp_path.iterdir()] == ["data.json"]
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(os.name != "posix", reason="file permissions are only enforced on POSIX systems")
+def test_token_store_is_only_accessible_by_its_owner(tmp_path):
+    token_store = TokenStore(tmp_path / "tokens.json")
+
+    token_store.save({"consumer_key": "consumer_key", "access_token": "access_token"})
+
+    assert _get_mode(token_store.token_file_path) == 0o600
+
+
+@pytest.mark.unit
+def test_token_store_keeps_the_access_tokens_of_all_accounts_of_an_app(tmp_path):
+    token_store = TokenStore(tmp_path / "tokens.json")
+    # an access token stored by consumer key only (before its GUID was known) is replaced by the one of its account
+    token_store.save({"consumer_key": "consumer_key", "access_token": "access_token_0"})
+    assert token_store.load("consumer_key", "guid_1")["access_token"] == "access_token_0"
+
+    for guid in ["guid_1", "guid_2"]:
+        token_store.save({"consumer_key": "consumer_key", "guid": guid, "access_token": f"access_token_{guid}"})
+
+    assert token_store.load("consumer_key", "guid_1")["access_token"] == "access_token_guid_1"
+    assert token_store.load("consumer_key", "guid_2")["access_token"] == "access_token_guid_2"
+    assert token_store.load("consumer_key", "guid_3") is None
+    # the account cannot be determined without its GUID once multiple accounts of the app are stored
+    assert token_store.load("consumer_key") is None
+    assert sorted(token_store._read().keys()) == ["consumer_key:guid_1", "consumer_key:guid_2"]
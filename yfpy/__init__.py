@@ -1,53 +1,172 @@
+# -*- coding: utf-8 -*-
+"""YFPY - Yahoo Fantasy Sports API wrapper.
+
+The public API is loaded lazily (see PEP 562): importing yfpy is nearly free, and each submodule (along with its
+dependencies, such as requests and yahoo-oauth for the query module) is only imported the first time one of its public
+attributes is accessed, so tools that only need the models or offline Data loading never pay for the HTTP and OAuth
+stack.
+
+Attributes:
+    __all__ (list[str]): Names of the public YFPY API.
+
+"""
 __author__ = "Wren J. R. (uberfastman)"
 __email__ = "uberfastman@uberfastman.dev"
 
-from yfpy.data import Data
-from yfpy.exceptions import YahooFantasySportsException, YahooFantasySportsDataNotFound
-from yfpy.logger import get_logger
-from yfpy.models import (
-    User,
-    Game,
-    GameWeek,
-    PositionType,
-    League,
-    Team,
-    DraftResult,
-    Standings,
-    Transaction,
-    Pick,
-    Manager,
-    Roster,
-    RosterAdds,
-    TeamLogo,
-    TeamPoints,
-    TeamProjectedPoints,
-    TeamStandings,
-    DivisionalOutcomeTotals,
-    OutcomeTotals,
-    Streak,
-    Scoreboard,
-    Settings,
-    Division,
-    RosterPosition,
-    StatCategories,
-    Group,
-    StatModifiers,
-    Stat,
-    StatPositionType,
-    Bonus,
-    Matchup,
-    MatchupGrade,
-    Player,
-    ByeWeeks,
-    DraftAnalysis,
-    Headshot,
-    Name,
-    Ownership,
-    PercentOwned,
-    PlayerAdvancedStats,
-    PlayerPoints,
-    PlayerStats,
-    SelectedPosition,
-    TransactionData
-)
-from yfpy.query import YahooFantasySportsQuery
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from yfpy.auth import TokenStore
+    from yfpy.builder import QueryBuilder
+    from yfpy.bulk import BackfillResult, BackfillUnit, MultiLeagueQuery, MultiLeagueResult, SeasonBackfill
+    from yfpy.data import Data, SQLiteData
+    from yfpy.exceptions import (
+        YahooFantasySportsException, YahooFantasySportsDataNotFound, YahooFantasySportsDataCorrupted
+    )
+    from yfpy.export import columns_to_arrow, to_arrow, to_columns, to_pandas
+    from yfpy.logger import get_logger
+    from yfpy.models import (
+        User,
+        Game,
+        GameWeek,
+        PositionType,
+        League,
+        Team,
+        DraftResult,
+        Standings,
+        Transaction,
+        Pick,
+        Manager,
+        Roster,
+        RosterAdds,
+        TeamLogo,
+        TeamPoints,
+        TeamProjectedPoints,
+        TeamStandings,
+        DivisionalOutcomeTotals,
+        OutcomeTotals,
+        Streak,
+        Scoreboard,
+        Settings,
+        Division,
+        RosterPosition,
+        StatCategories,
+        Group,
+        StatModifiers,
+        Stat,
+        StatPositionType,
+        Bonus,
+        Matchup,
+        MatchupGrade,
+        Player,
+        ByeWeeks,
+        DraftAnalysis,
+        Headshot,
+        Name,
+        Ownership,
+        PercentOwned,
+        PlayerAdvancedStats,
+        PlayerPoints,
+        PlayerStats,
+        SelectedPosition,
+        TransactionData
+    )
+    from yfpy.query import YahooFantasySportsQuery
+    from yfpy.serialization import deserialize, from_tagged_data, serialize, to_tagged_data
+
+# modules from which each public attribute is lazily imported
+_lazy_attribute_modules: Dict[str, str] = {
+    "TokenStore": "yfpy.auth",
+    "QueryBuilder": "yfpy.builder",
+    "BackfillResult": "yfpy.bulk",
+    "BackfillUnit": "yfpy.bulk",
+    "MultiLeagueQuery": "yfpy.bulk",
+    "MultiLeagueResult": "yfpy.bulk",
+    "SeasonBackfill": "yfpy.bulk",
+    "Data": "yfpy.data",
+    "SQLiteData": "yfpy.data",
+    "YahooFantasySportsException": "yfpy.exceptions",
+    "YahooFantasySportsDataNotFound": "yfpy.exceptions",
+    "YahooFantasySportsDataCorrupted": "yfpy.exceptions",
+    "columns_to_arrow": "yfpy.export",
+    "to_arrow": "yfpy.export",
+    "to_columns": "yfpy.export",
+    "to_pandas": "yfpy.export",
+    "get_logger": "yfpy.logger",
+    "User": "yfpy.models",
+    "Game": "yfpy.models",
+    "GameWeek": "yfpy.models",
+    "PositionType": "yfpy.models",
+    "League": "yfpy.models",
+    "Team": "yfpy.models",
+    "DraftResult": "yfpy.models",
+    "Standings": "yfpy.models",
+    "Transaction": "yfpy.models",
+    "Pick": "yfpy.models",
+    "Manager": "yfpy.models",
+    "Roster": "yfpy.models",
+    "RosterAdds": "yfpy.models",
+    "TeamLogo": "yfpy.models",
+    "TeamPoints": "yfpy.models",
+    "TeamProjectedPoints": "yfpy.models",
+    "TeamStandings": "yfpy.models",
+    "DivisionalOutcomeTotals": "yfpy.models",
+    "OutcomeTotals": "yfpy.models",
+    "Streak": "yfpy.models",
+    "Scoreboard": "yfpy.models",
+    "Settings": "yfpy.models",
+    "Division": "yfpy.models",
+    "RosterPosition": "yfpy.models",
+    "StatCategories": "yfpy.models",
+    "Group": "yfpy.models",
+    "StatModifiers": "yfpy.models",
+    "Stat": "yfpy.models",
+    "StatPositionType": "yfpy.models",
+    "Bonus": "yfpy.models",
+    "Matchup": "yfpy.models",
+    "MatchupGrade": "yfpy.models",
+    "Player": "yfpy.models",
+    "ByeWeeks": "yfpy.models",
+    "DraftAnalysis": "yfpy.models",
+    "Headshot": "yfpy.models",
+    "Name": "yfpy.models",
+    "Ownership": "yfpy.models",
+    "PercentOwned": "yfpy.models",
+    "PlayerAdvancedStats": "yfpy.models",
+    "PlayerPoints": "yfpy.models",
+    "PlayerStats": "yfpy.models",
+    "SelectedPosition": "yfpy.models",
+    "TransactionData": "yfpy.models",
+    "YahooFantasySportsQuery": "yfpy.query",
+    "deserialize": "yfpy.serialization",
+    "from_tagged_data": "yfpy.serialization",
+    "serialize": "yfpy.serialization",
+    "to_tagged_data": "yfpy.serialization",
+}
+
+__all__: List[str] = list(_lazy_attribute_modules.keys())
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public YFPY attribute from its submodule the first time it is accessed.
+
+    Args:
+        name (str): Name of the attribute.
+
+    Returns:
+        Any: The public YFPY attribute.
+
+    """
+    module_name = _lazy_attribute_modules.get(name)
+    if module_name is None:
+        raise AttributeError(f"module \"{__name__}\" has no attribute \"{name}\"")
+
+    attribute = getattr(import_module(module_name), name)
+    # cache the attribute in the package namespace so subsequent accesses bypass this function
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals().keys()) | set(__all__))
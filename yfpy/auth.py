@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""YFPY module for sharing Yahoo access tokens across processes.
+
+Yahoo access tokens expire one hour after they are issued. When many worker processes on the same host query the Yahoo
+Fantasy Sports API with the same Yahoo account, a TokenStore lets them share a single access token: the token is kept in
+a local JSON file guarded by an inter-process lock, so whichever process refreshes the token first saves it for every
+other process, which then reuses it instead of refreshing it again.
+
+Example:
+    A TokenStore can be shared by all worker processes as follows::
+
+        yahoo_query = YahooFantasySportsQuery(
+            league_id="######", game_code="nfl", token_store_path=Path.home() / ".yfpy" / "tokens.json"
+        )
+
+Attributes:
+    logger (Logger): Module level logger for usage and debugging.
+    ACCESS_TOKEN_LIFETIME (float): Number of seconds a Yahoo access token is valid after it is issued.
+    TOKEN_FIELDS (list[str]): Yahoo access token fields stored for each Yahoo account.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from yfpy.logger import get_logger
+from yfpy.utils import atomic_write, file_lock
+
+logger = get_logger(__name__)
+
+ACCESS_TOKEN_LIFETIME: float = 3600.0
+
+TOKEN_FIELDS: List[str] = [
+    "access_token",
+    "consumer_key",
+    "consumer_secret",
+    "guid",
+    "refresh_token",
+    "token_time",
+    "token_type"
+]
+
+
+def get_token_expires_in(token_dict: Optional[Dict[str, Any]]) -> float:
+    """Calculate the number of seconds until a Yahoo access token expires.
+
+    Args:
+        token_dict (dict[str, Any], optional): Yahoo access token fields (including token_time, the time at which the
+            access token was issued).
+
+    Returns:
+        float: Number of seconds until the access token expires (negative if it has already expired, and -inf if there
+            is no access token).
+
+    """
+    if not token_dict or not token_dict.get("access_token"):
+        return float("-inf")
+    return float(token_dict.get("token_time") or 0.0) + ACCESS_TOKEN_LIFETIME - time.time()
+
+
+class TokenStore(object):
+    """Local JSON file storing the Yahoo access token of each Yahoo account (by consumer key and account GUID), shared
+    by all processes on the host that use the same file.
+
+    Note:
+        The token file is replaced atomically and is only readable by its owner, so it can always be read without
+        locking, while all updates and refreshes are serialized across threads and processes with an advisory lock on a
+        sibling lock file (see `yfpy.utils.file_lock`).
+    """
+
+    def __init__(self, token_file_path: Union[Path, str]):
+        """Instantiate a token store.
+
+        Args:
+            token_file_path (Path | str): Path of the JSON file in which access tokens are stored (created on the first
+                save).
+
+        Attributes:
+            token_file_path (Path): Path of the JSON file in which access tokens are stored.
+
+        """
+        self.token_file_path: Path = Path(token_file_path)
+        self._lock_file_path: Path = self.token_file_path.with_name(f".{self.token_file_path.name}.lock")
+        self._thread_lock: threading.RLock = threading.RLock()
+        self._lock_depth: int = 0
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.token_file_path})"
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Context manager to hold the exclusive lock of the token store, which is reentrant within the holding thread.
+
+        Returns:
+            Iterator[None]: Iterator holding the lock until it is exhausted.
+
+        """
+        with self._thread_lock:
+            if self._lock_depth:
+                # the file lock is already held by this thread
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                return
+
+            with file_lock(self._lock_file_path):
+                self._lock_depth = 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth = 0
+
+    @staticmethod
+    def _get_token_key(consumer_key: str, guid: Optional[str] = None) -> str:
+        """Get the key under which the access token of a Yahoo account is stored.
+
+        Args:
+            consumer_key (str): Yahoo developer app consumer key.
+            guid (str, optional): Yahoo account GUID.
+
+        Returns:
+            str: Token key formatted as <consumer_key>:<guid> (or only the consumer key if the GUID is unknown).
+
+        """
+        return f"{consumer_key}:{guid}" if guid else consumer_key
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """Read all stored access tokens.
+
+        Returns:
+            dict[str, dict[str, Any]]: Dictionary with token keys (see `_get_token_key`) as keys and access token fields
+                as values.
+
+        """
+        if not self.token_file_path.is_file():
+            return {}
+        try:
+            with open(self.token_file_path, "r", encoding="utf-8") as token_file:
+                return json.load(token_file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unable to read stored access tokens from {self.token_file_path}: {e}")
+            return {}
+
+    def load(self, consumer_key: str, guid: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Load the stored access token of a Yahoo account.
+
+        Args:
+            consumer_key (str): Yahoo developer app consumer key.
+            guid (str, optional): Yahoo account GUID (if unknown, the access token is only loaded if it is the only one
+                stored for the consumer key).
+
+        Returns:
+            dict[str, Any] | None: Stored access token fields, or None if no access token is stored for the account.
+
+        """
+        stored_token_dicts = self._read()
+        if not guid:
+            consumer_token_dicts = [
+                token_dict for token_key, token_dict in stored_token_dicts.items()
+                if token_key == consumer_key or token_key.startswith(f"{consumer_key}:")
+            ]
+            return consumer_token_dicts[0] if len(consumer_token_dicts) == 1 else None
+
+        token_dict = stored_token_dicts.get(self._get_token_key(consumer_key, guid))
+        if token_dict is None:
+            # fall back to an access token stored by consumer key only (before its GUID was known)
+            token_dict = stored_token_dicts.get(consumer_key)
+            if token_dict and token_dict.get("guid") not in (None, guid):
+                return None
+        return token_dict
+
+    def save(self, token_dict: Dict[str, Any]) -> None:
+        """Save the access token of a Yahoo account.
+
+        Args:
+            token_dict (dict[str, Any]): Yahoo access token fields (including consumer_key and guid).
+
+        Returns:
+            None
+
+        """
+        consumer_key = token_dict["consumer_key"]
+        guid = token_dict.get("guid")
+        with self.lock():
+            stored_token_dicts = self._read()
+            if guid and stored_token_dicts.get(consumer_key, {}).get("guid") in (None, guid):
+                # replace the access token stored by consumer key only (before its GUID was known)
+                stored_token_dicts.pop(consumer_key, None)
+            stored_token_dicts[self._get_token_key(consumer_key, guid)] = {
+                field: token_dict.get(field) for field in TOKEN_FIELDS
+            }
+            # access tokens are secrets, so the token file is only accessible by its owner
+            with atomic_write(self.token_file_path, mode=0o600) as temporary_file_path:
+                temporary_file_path.write_text(json.dumps(stored_token_dicts, indent=2), encoding="utf-8")
+
+    def refresh(self, token_dict: Dict[str, Any], refresh_function: Callable[[Dict[str, Any]], Dict[str, Any]],
+                min_expires_in: float = 0.0) -> Dict[str, Any]:
+        """Get an access token for a Yahoo account that is valid for at least min_expires_in seconds, refreshing it only
+        if neither the provided nor the stored access token is valid for long enough.
+
+        The exclusive lock is held while refreshing, so when multiple processes need a fresh access token at the same
+        time, only the first one refreshes it and all others reuse the refreshed access token from the store.
+
+        Args:
+            token_dict (dict[str, Any]): Current Yahoo access token fields of the calling process (including
+                consumer_key).
+            refresh_function (Callable[[dict[str, Any]], dict[str, Any]]): Function refreshing the provided (freshest
+                known) access token and returning the refreshed access token fields.
+            min_expires_in (float, optional): Minimum number of seconds the returned access token must remain valid
+                (defaults to 0.0).
+
+        Returns:
+            dict[str, Any]: Access token fields of the freshest valid access token.
+
+        """
+        with self.lock():
+            stored_token_dict = self.load(token_dict["consumer_key"], token_dict.get("guid"))
+            if get_token_expires_in(stored_token_dict) > get_token_expires_in(token_dict):
+                token_dict = {**token_dict, **stored_token_dict}
+            elif stored_token_dict != {field: token_dict.get(field) for field in TOKEN_FIELDS}:
+                self.save(token_dict)
+
+            if get_token_expires_in(token_dict) > min_expires_in:
+                return token_dict
+
+            logger.debug(f"Refreshing access token stored in {self.token_file_path}.")
+            refreshed_token_dict = refresh_function(token_dict)
+            self.save(refreshed_token_dict)
+            return refreshed_token_dict
@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+"""YFPY module for composing Yahoo Fantasy Sports REST API resource paths into single requests.
+
+The Yahoo Fantasy Sports REST API supports composite resource paths that chain resources and collections (such as
+`league/{league_key}/teams/roster/players/stats`), filters (such as `;week=3`), and `out=` subresources (such as
+`league/{league_key};out=settings,standings,scoreboard`), so data that would otherwise take many separate queries can
+be retrieved with a single request.
+
+Example:
+    The QueryBuilder can be used as follows::
+
+        builder = QueryBuilder(yahoo_query)
+
+        # league settings, standings, and scoreboard in one request
+        league = builder.league().out("settings", "standings", "scoreboard").fetch()
+        league.settings, league.standings, league.scoreboard
+
+        # all team rosters with player stats for week 3 in one request
+        teams = builder.league().teams().roster(week=3).players().stats(type="week", week=3).fetch()
+
+Attributes:
+    logger (Logger): Module level logger for usage and debugging.
+    BASE_URL (str): Base URL of the Yahoo Fantasy Sports REST API.
+    RESOURCE_MODEL_CLASSES (dict[str, Type[YahooFantasyObject]]): YFPY model classes of the resources and
+        subresources retrieved by a composed query.
+    SUBRESOURCE_RESPONSE_KEYS (dict[tuple[str, str], tuple[str, Type[YahooFantasyObject]]]): Response keys and YFPY
+        model classes of subresources that Yahoo returns under a different name than their resource path name, with
+        (resource name, subresource name) tuples as keys.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from yfpy.logger import get_logger
+from yfpy.models import (
+    Game, League, Player, PlayerStats, Roster, Scoreboard, Settings, Standings, Team, TeamPoints, TeamStandings,
+    YahooFantasyObject
+)
+
+logger = get_logger(__name__)
+
+BASE_URL: str = "https://fantasysports.yahooapis.com/fantasy/v2"
+
+RESOURCE_MODEL_CLASSES: Dict[str, Type[YahooFantasyObject]] = {
+    "game": Game,
+    "league": League,
+    "team": Team,
+    "player": Player,
+    "roster": Roster,
+    "scoreboard": Scoreboard,
+    "settings": Settings,
+    "standings": Standings,
+}
+
+SUBRESOURCE_RESPONSE_KEYS: Dict[Tuple[str, str], Tuple[str, Type[YahooFantasyObject]]] = {
+    ("team", "stats"): ("team_points", TeamPoints),
+    ("team", "standings"): ("team_standings", TeamStandings),
+    ("player", "stats"): ("player_stats", PlayerStats),
+}
+
+
+class _ResourceSegment(object):
+    """Single resource or collection segment of a composed resource path.
+    """
+
+    def __init__(self, name: str, key: Optional[str] = None, filters: Optional[Dict[str, Any]] = None,
+                 out: Tuple[str, ...] = ()):
+        """Instantiate a resource path segment.
+
+        Args:
+            name (str): Resource or collection name (such as "league", "teams", or "stats").
+            key (str, optional): Resource key (such as a league key) for resources identified by a key.
+            filters (dict[str, Any], optional): Filters of the resource or collection (such as {"week": 3}).
+            out (tuple[str, ...], optional): Subresources to include in the response (such as ("settings",)).
+
+        """
+        self.name: str = name
+        self.key: Optional[str] = key
+        self.filters: Dict[str, Any] = filters or {}
+        self.out: Tuple[str, ...] = out
+
+    def with_filters(self, filters: Dict[str, Any]) -> "_ResourceSegment":
+        return _ResourceSegment(self.name, self.key, {**self.filters, **filters}, self.out)
+
+    def with_out(self, subresources: Tuple[str, ...]) -> "_ResourceSegment":
+        return _ResourceSegment(self.name, self.key, self.filters, tuple(dict.fromkeys(self.out + subresources)))
+
+    @staticmethod
+    def _format_filter_value(value: Any) -> str:
+        if isinstance(value, (list, tuple, set)):
+            return ",".join(str(el) for el in value)
+        return str(value)
+
+    def __str__(self):
+        segment = f"{self.name}/{self.key}" if self.key is not None else self.name
+        for filter_name, filter_value in self.filters.items():
+            if filter_value is not None:
+                segment += f";{filter_name}={self._format_filter_value(filter_value)}"
+        if self.out:
+            segment += f";out={','.join(self.out)}"
+        return segment
+
+
+class QueryBuilder(object):
+    """Composable builder of Yahoo Fantasy Sports REST API resource paths that retrieves all composed resources,
+    filters, and `out=` subresources with a single request.
+
+    Every builder method returns a new QueryBuilder, so partially built queries can be reused.
+    """
+
+    def __init__(self, yahoo_query: Any, segments: Tuple[_ResourceSegment, ...] = ()):
+        """Instantiate a query builder.
+
+        Args:
+            yahoo_query (YahooFantasySportsQuery): Query object used to run the composed query.
+            segments (tuple[_ResourceSegment, ...], optional): Resource path segments composed so far.
+
+        Attributes:
+            yahoo_query (YahooFantasySportsQuery): Query object used to run the composed query.
+
+        """
+        self.yahoo_query = yahoo_query
+        self._segments: Tuple[_ResourceSegment, ...] = segments
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.url})"
+
+    def resource(self, name: str, key: Optional[str] = None, **filters) -> "QueryBuilder":
+        """Append a resource or collection to the resource path.
+
+        Args:
+            name (str): Resource or collection name (such as "league", "teams", "transactions", or "draftresults").
+            key (str, optional): Resource key (such as a league key) for resources identified by a key.
+            **filters: Filters of the resource or collection (such as week=3 or player_keys=["331.p.7200"], where
+                filters with a value of None are omitted).
+
+        Returns:
+            QueryBuilder: New query builder with the appended resource.
+
+        """
+        return QueryBuilder(self.yahoo_query, self._segments + (_ResourceSegment(name, key, filters),))
+
+    def filter(self, **filters) -> "QueryBuilder":
+        """Add filters to the last resource or collection of the resource path.
+
+        Args:
+            **filters: Filters of the resource or collection (such as position="QB" or status="A").
+
+        Returns:
+            QueryBuilder: New query builder with the added filters.
+
+        """
+        return self._replace_last_segment(self._get_last_segment().with_filters(filters))
+
+    def out(self, *subresources: str) -> "QueryBuilder":
+        """Include subresources of the last resource or collection of the resource path in the response.
+
+        Args:
+            *subresources (str): Subresource names (such as "settings", "standings", "scoreboard", or "roster").
+
+        Returns:
+            QueryBuilder: New query builder with the included subresources.
+
+        """
+        return self._replace_last_segment(self._get_last_segment().with_out(subresources))
+
+    def game(self, game_key: Union[str, int, None] = None) -> "QueryBuilder":
+        """Start the resource path with a game.
+
+        Args:
+            game_key (str | int, optional): Game key or ID (defaults to the game ID of the query object, or its game
+                code for the current season).
+
+        Returns:
+            QueryBuilder: New query builder with the game resource.
+
+        """
+        if game_key is None:
+            game_key = self.yahoo_query.game_id or self.yahoo_query.game_code
+        return self.resource("game", str(game_key))
+
+    def league(self, league_key: Optional[str] = None) -> "QueryBuilder":
+        """Start the resource path with a league.
+
+        Args:
+            league_key (str, optional): League key (defaults to the league of the query object).
+
+        Returns:
+            QueryBuilder: New query builder with the league resource.
+
+        """
+        return self.resource("league", league_key or self.yahoo_query.get_league_key())
+
+    def team(self, team_id: Union[str, int]) -> "QueryBuilder":
+        """Start the resource path with a team.
+
+        Args:
+            team_id (str | int): Team ID within the league of the query object, or a full team key.
+
+        Returns:
+            QueryBuilder: New query builder with the team resource.
+
+        """
+        team_key = str(team_id) if ".t." in str(team_id) else f"{self.yahoo_query.get_league_key()}.t.{team_id}"
+        return self.resource("team", team_key)
+
+    def player(self, player_key: str) -> "QueryBuilder":
+        """Start the resource path with a player.
+
+        Args:
+            player_key (str): Player key (such as "331.p.7200").
+
+        Returns:
+            QueryBuilder: New query builder with the player resource.
+
+        """
+        return self.resource("player", player_key)
+
+    def teams(self, **filters) -> "QueryBuilder":
+        """Append the teams collection to the resource path.
+
+        Args:
+            **filters: Filters of the teams collection (such as team_keys=[...]).
+
+        Returns:
+            QueryBuilder: New query builder with the teams collection.
+
+        """
+        return self.resource("teams", **filters)
+
+    def players(self, **filters) -> "QueryBuilder":
+        """Append the players collection to the resource path.
+
+        Args:
+            **filters: Filters of the players collection (such as player_keys=[...], position="QB", status="A",
+                sort="PTS", start=0, or count=25).
+
+        Returns:
+            QueryBuilder: New query builder with the players collection.
+
+        """
+        return self.resource("players", **filters)
+
+    def roster(self, week: Union[int, str, None] = None, date: Optional[str] = None) -> "QueryBuilder":
+        """Append the roster subresource to the resource path.
+
+        Args:
+            week (int | str, optional): Roster week (for sports with weekly rosters).
+            date (str, optional): Roster date (for sports with daily rosters). FORMAT: YYYY-MM-DD (Ex. 2011-05-01)
+
+        Returns:
+            QueryBuilder: New query builder with the roster subresource.
+
+        """
+        return self.resource("roster", week=week, date=date)
+
+    def stats(self, **filters) -> "QueryBuilder":
+        """Append the stats subresource to the resource path.
+
+        Args:
+            **filters: Filters of the stats (such as type="week" and week=3, or type="date" and date="2011-05-01").
+
+        Returns:
+            QueryBuilder: New query builder with the stats subresource.
+
+        """
+        return self.resource("stats", **filters)
+
+    @property
+    def url(self) -> str:
+        """Yahoo Fantasy Sports REST API URL of the composed query.
+
+        Returns:
+            str: REST API request URL.
+
+        """
+        return "/".join([BASE_URL, *(str(segment) for segment in self._segments)])
+
+    @property
+    def data_key_list(self) -> List[str]:
+        """Keys used to extract the data of the composed query from the response (the first resource and, if the
+        resource path continues, the resource or collection directly below it, which contains all deeper resources).
+
+        Returns:
+            list[str]: List of data keys.
+
+        """
+        return [self._get_response_key(segment_index)[0] for segment_index in range(len(self._segments[:2]))]
+
+    @property
+    def data_type_class(self) -> Optional[Type[YahooFantasyObject]]:
+        """YFPY model class of the data retrieved by the composed query.
+
+        Returns:
+            Type[YahooFantasyObject] | None: Model class, or None if the query retrieves a collection.
+
+        """
+        # raise a descriptive error if the query has no resources
+        self._get_last_segment(2)
+        return self._get_response_key(len(self._segments[:2]) - 1)[1]
+
+    def fetch(self) -> Any:
+        """Run the composed query with a single request.
+
+        Raises:
+            ValueError: If the data of the composed query cannot be extracted from the response.
+
+        Returns:
+            object: YFPY model (with any `out=` subresources as its typed attributes, such as League.settings) or list
+                of YFPY models retrieved by the composed query (or a JSON string if all_output_as_json_str is True).
+
+        """
+        logger.debug(f"Running composed query: {self.url}")
+        data_key_list = self.data_key_list
+        try:
+            return self.yahoo_query.query(self.url, data_key_list, self.data_type_class)
+        except KeyError as e:
+            raise ValueError(
+                f"Unable to extract the data of composed query {self.url} from the response, since the response has "
+                f"no {e} data key (extracting {data_key_list}). Compose the query with a resource or collection that "
+                f"Yahoo returns under the same name (or use a query method) instead."
+            ) from e
+
+    def _get_response_key(self, segment_index: int) -> Tuple[str, Optional[Type[YahooFantasyObject]]]:
+        """Get the response key and YFPY model class of a segment of the resource path.
+
+        Args:
+            segment_index (int): Index of the segment in the resource path.
+
+        Raises:
+            ValueError: If the segment is a subresource returned under a different name and the resource path
+                continues below it.
+
+        Returns:
+            tuple[str, Type[YahooFantasyObject] | None]: Response key and model class (None for collections) of the
+                segment.
+
+        """
+        segment = self._segments[segment_index]
+        if segment_index > 0:
+            parent_segment = self._segments[segment_index - 1]
+            response_key = SUBRESOURCE_RESPONSE_KEYS.get((parent_segment.name, segment.name))
+            if response_key:
+                if len(self._segments) > segment_index + 1:
+                    raise ValueError(
+                        f"Unsupported composed query {self.url}: the {parent_segment.name} {segment.name} subresource "
+                        f"(returned as {response_key[0]}) cannot contain further resources."
+                    )
+                return response_key
+        return segment.name, RESOURCE_MODEL_CLASSES.get(segment.name)
+
+    def _get_last_segment(self, max_depth: Optional[int] = None) -> _ResourceSegment:
+        """Get the last segment of the resource path (or of its first max_depth segments).
+
+        Args:
+            max_depth (int, optional): Number of leading segments to consider (defaults to all segments).
+
+        Returns:
+            _ResourceSegment: The last resource path segment.
+
+        """
+        segments = self._segments[:max_depth] if max_depth else self._segments
+        if not segments:
+            raise ValueError("The query has no resources. Start it with game(), league(), team(), or player().")
+        return segments[-1]
+
+    def _replace_last_segment(self, segment: _ResourceSegment) -> "QueryBuilder":
+        return QueryBuilder(self.yahoo_query, self._segments[:-1] + (segment,))
@@ -0,0 +1,607 @@
+# -*- coding: utf-8 -*-
+"""YFPY module for running Yahoo Fantasy Sports queries in bulk across many leagues.
+
+This module allows the same set of YahooFantasySportsQuery operations to be fanned out across many leagues concurrently,
+reusing a single authenticated session (and its rate limit) instead of creating and authenticating one query instance
+per league.
+
+Example:
+    The bulk module can be used as follows::
+
+        yahoo_query = YahooFantasySportsQuery(
+            "<league_id>",
+            "<game_code>",
+            game_id="<game_key>",
+            yahoo_consumer_key=os.environ.get("YFPY_CONSUMER_KEY"),
+            yahoo_consumer_secret=os.environ.get("YFPY_CONSUMER_SECRET"),
+            max_concurrent_requests=8
+        )
+
+        multi_league_query = MultiLeagueQuery(yahoo_query, ["<league_id_1>", "<league_id_2>"])
+        multi_league_result = multi_league_query.run(
+            {
+                "get_league_standings": None,
+                "get_league_scoreboard_by_week": {"chosen_week": 1}
+            }
+        )
+        multi_league_result.results["<league_id_1>"]["get_league_standings"]
+        multi_league_result.failures
+
+    The full history of a league can be backfilled into a Data directory as follows (re-running it after an
+    interruption skips everything that was already completed)::
+
+        season_backfill = SeasonBackfill(yahoo_query, Data(data_dir), [2019, 2020, 2021])
+        backfill_result = season_backfill.run()
+
+Attributes:
+    logger (Logger): Module level logger for usage and debugging.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+from requests.exceptions import RequestException
+
+from yfpy.data import Data
+from yfpy.exceptions import YahooFantasySportsException
+from yfpy.logger import get_logger
+from yfpy.models import League
+from yfpy.query import YahooFantasySportsQuery
+from yfpy.utils import atomic_write
+
+logger = get_logger(__name__)
+
+# errors of queries (and of saving their data) that are recorded as failures instead of stopping all other queries
+_QUERY_ERRORS = (YahooFantasySportsException, RequestException, OSError)
+
+
+class MultiLeagueResult(object):
+    """YFPY container for the results (and any failures) of operations run across multiple leagues.
+    """
+
+    def __init__(self, league_ids: List[str]):
+        """Instantiate a multi-league result.
+
+        Args:
+            league_ids (list[str]): League IDs of all leagues for which operations were run.
+
+        Attributes:
+            league_ids (list[str]): League IDs of all leagues for which operations were run.
+            results (dict[str, dict[str, Any]]): Successful operation results keyed by league ID and then by operation
+                name.
+            failures (dict[str, dict[str, Exception]]): Exceptions raised by failed operations keyed by league ID and
+                then by operation name.
+
+        """
+        self.league_ids: List[str] = league_ids
+        self.results: Dict[str, Dict[str, Any]] = {league_id: {} for league_id in league_ids}
+        self.failures: Dict[str, Dict[str, Exception]] = {}
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(leagues={len(self.league_ids)}, "
+            f"succeeded={len(self.succeeded_league_ids)}, failed={len(self.failed_league_ids)})"
+        )
+
+    @property
+    def succeeded_league_ids(self) -> List[str]:
+        """League IDs for which all operations succeeded.
+
+        Returns:
+            list[str]: League IDs without any failed operations.
+
+        """
+        return [league_id for league_id in self.league_ids if league_id not in self.failures]
+
+    @property
+    def failed_league_ids(self) -> List[str]:
+        """League IDs for which at least one operation failed.
+
+        Returns:
+            list[str]: League IDs with one or more failed operations.
+
+        """
+        return [league_id for league_id in self.league_ids if league_id in self.failures]
+
+    @property
+    def is_complete(self) -> bool:
+        """Check whether all operations succeeded for all leagues.
+
+        Returns:
+            bool: True if no operations failed, else False.
+
+        """
+        return not self.failures
+
+
+class MultiLeagueQuery(object):
+    """YFPY orchestrator to run YahooFantasySportsQuery operations concurrently across multiple leagues.
+    """
+
+    def __init__(self, yahoo_query: YahooFantasySportsQuery, league_ids: Iterable[str], game_id: Optional[int] = None,
+                 max_workers: int = 8):
+        """Instantiate a multi-league query orchestrator.
+
+        Args:
+            yahoo_query (YahooFantasySportsQuery): Authenticated query instance whose session, token refreshes, and rate
+                limit are shared by the queries for all leagues.
+            league_ids (Iterable[str]): League IDs of all leagues for which to run operations.
+            game_id (int, optional): Game ID of the Yahoo Fantasy game shared by all leagues (defaults to the game ID of
+                yahoo_query).
+            max_workers (int, optional): Maximum number of operations run concurrently (defaults to 8).
+
+        Attributes:
+            yahoo_query (YahooFantasySportsQuery): Authenticated query instance shared by all leagues.
+            league_ids (list[str]): League IDs of all leagues for which to run operations.
+            game_id (int): Game ID of the Yahoo Fantasy game shared by all leagues.
+            max_workers (int): Maximum number of operations run concurrently.
+            league_queries (dict[str, YahooFantasySportsQuery]): Query instances for each league keyed by league ID.
+
+        """
+        self.yahoo_query: YahooFantasySportsQuery = yahoo_query
+        # deduplicate league IDs while preserving their order
+        self.league_ids: List[str] = list(dict.fromkeys(str(league_id) for league_id in league_ids))
+        self.game_id: Optional[int] = game_id if game_id is not None else yahoo_query.game_id
+        self.max_workers: int = max_workers
+        self.league_queries: Dict[str, YahooFantasySportsQuery] = {}
+
+    def _get_league_queries(self) -> Dict[str, YahooFantasySportsQuery]:
+        """Create query instances for all leagues, looking up the shared game key only once.
+
+        Returns:
+            dict[str, YahooFantasySportsQuery]: Query instances for each league keyed by league ID.
+
+        """
+        if not self.league_queries:
+            game_query = self.yahoo_query.for_league(self.yahoo_query.league_id, self.game_id)
+            game_key = game_query.get_league_key().split(".l.")[0]
+
+            for league_id in self.league_ids:
+                league_query = self.yahoo_query.for_league(league_id, self.game_id)
+                league_query.league_key = f"{game_key}.l.{league_id}"
+                self.league_queries[league_id] = league_query
+
+        return self.league_queries
+
+    @staticmethod
+    def _normalize_operations(
+            operations: Union[Iterable[str], Dict[str, Optional[Dict[str, Any]]]]) -> Dict[str, Dict[str, Any]]:
+        """Convert supported operation specifications into a dictionary of query method names and parameters.
+
+        Args:
+            operations (Iterable[str] | dict[str, dict[str, Any] | None]): Names of YahooFantasySportsQuery methods to
+                run, or a dictionary with method names as keys and dictionaries of method parameters (or None) as
+                values.
+
+        Returns:
+            dict[str, dict[str, Any]]: Dictionary with method names as keys and method parameters as values.
+
+        """
+        if isinstance(operations, dict):
+            normalized_operations = {name: (params or {}) for name, params in operations.items()}
+        else:
+            normalized_operations = {name: {} for name in operations}
+
+        for operation_name in normalized_operations.keys():
+            if (not operation_name.startswith("get_")
+                    or not callable(getattr(YahooFantasySportsQuery, operation_name, None))):
+                raise ValueError(f"Invalid YahooFantasySportsQuery operation: \"{operation_name}\"")
+
+        return normalized_operations
+
+    def run(self, operations: Union[Iterable[str], Dict[str, Optional[Dict[str, Any]]]]) -> MultiLeagueResult:
+        """Run the selected operations concurrently for all leagues.
+
+        Note:
+            Failed operations do not stop the remaining operations from running, and are instead reported in the
+            `failures` attribute of the returned MultiLeagueResult.
+
+        Args:
+            operations (Iterable[str] | dict[str, dict[str, Any] | None]): Names of YahooFantasySportsQuery `get_*`
+                methods to run for each league, or a dictionary with method names as keys and dictionaries of method
+                parameters (or None) as values.
+
+        Returns:
+            MultiLeagueResult: Results keyed by league ID and operation name, along with any failures.
+
+        """
+        normalized_operations = self._normalize_operations(operations)
+        league_queries = self._get_league_queries()
+        multi_league_result = MultiLeagueResult(self.league_ids)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(getattr(league_query, operation_name), **params): (league_id, operation_name)
+                for league_id, league_query in league_queries.items()
+                for operation_name, params in normalized_operations.items()
+            }
+
+            for future in as_completed(futures):
+                league_id, operation_name = futures[future]
+                try:
+                    multi_league_result.results[league_id][operation_name] = future.result()
+                except _QUERY_ERRORS as e:
+                    logger.warning(f"Operation \"{operation_name}\" failed for league {league_id}: {e}")
+                    multi_league_result.failures.setdefault(league_id, {})[operation_name] = e
+
+        if multi_league_result.failures:
+            logger.warning(
+                f"{sum(len(failures) for failures in multi_league_result.failures.values())} operation(s) failed for "
+                f"{len(multi_league_result.failures)} of {len(self.league_ids)} league(s)."
+            )
+
+        return multi_league_result
+
+
+class BackfillUnit(object):
+    """YFPY unit of work in a season backfill, representing a single query whose results are saved to one data file.
+    """
+
+    def __init__(self, season: int, league_key: str, operation_name: str, params: Optional[Dict[str, Any]] = None,
+                 label: Optional[str] = None, is_final: bool = True):
+        """Instantiate a backfill unit.
+
+        Args:
+            season (int): The season/year of the league.
+            league_key (str): The Yahoo Fantasy Sports league key formatted as <game_id>.l.<league_id>.
+            operation_name (str): Name of the YahooFantasySportsQuery method to run.
+            params (dict[str, Any], optional): Dictionary of parameters to be passed to the query method.
+            label (str, optional): Name used for the saved data file (defaults to the operation name without the "get_"
+                prefix).
+            is_final (bool, optional): Whether the retrieved data can no longer change (defaults to True). Units that
+                are not final (such as the standings of a season in progress) are re-run by every backfill run instead
+                of being checkpointed.
+
+        Attributes:
+            season (int): The season/year of the league.
+            league_key (str): The Yahoo Fantasy Sports league key formatted as <game_id>.l.<league_id>.
+            operation_name (str): Name of the YahooFantasySportsQuery method to run.
+            params (dict[str, Any]): Dictionary of parameters to be passed to the query method.
+            unit_id (str): Unique ID of the unit, which is also the name of its data file relative to the data
+                directory.
+            is_final (bool): Whether the retrieved data can no longer change.
+
+        """
+        self.season: int = season
+        self.league_key: str = league_key
+        self.operation_name: str = operation_name
+        self.params: Dict[str, Any] = params or {}
+        self.unit_id: str = f"{season}/{league_key}/{label or operation_name.removeprefix('get_')}"
+        self.is_final: bool = is_final
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.unit_id})"
+
+
+class BackfillResult(object):
+    """YFPY container for the outcome of a season backfill.
+    """
+
+    def __init__(self):
+        """Instantiate a backfill result.
+
+        Attributes:
+            completed (list[str]): Unit IDs of units completed during this run.
+            skipped (list[str]): Unit IDs of units skipped because they were completed during a previous run.
+            failures (dict[str, Exception]): Exceptions raised by failed units keyed by unit ID.
+
+        """
+        self.completed: List[str] = []
+        self.skipped: List[str] = []
+        self.failures: Dict[str, Exception] = {}
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(completed={len(self.completed)}, skipped={len(self.skipped)}, "
+            f"failed={len(self.failures)})"
+        )
+
+    @property
+    def is_complete(self) -> bool:
+        """Check whether all units of the backfill succeeded.
+
+        Returns:
+            bool: True if no units failed, else False.
+
+        """
+        return not self.failures
+
+
+class SeasonBackfill(object):
+    """YFPY pipeline to backfill the full history of a league across multiple seasons into a Data directory.
+
+    Note:
+        The pipeline looks up the game keys of all seasons with a single query, retrieves the league metadata of each
+        season to determine its weeks, and then concurrently retrieves the standings, draft results, transactions, and
+        matchups of every completed week of every season. Every unit of work is saved to its own data file as soon as it
+        completes and recorded in a checkpoint file in the data directory (written at most every checkpoint_interval
+        seconds and at the end of every batch of units), so re-running an interrupted backfill skips all previously
+        completed units. Data that can still change in a season in progress (its metadata, standings, transactions,
+        and the current week) is never checkpointed, so every run retrieves it again.
+    """
+
+    def __init__(self, yahoo_query: YahooFantasySportsQuery, data: Data, seasons: Union[Iterable[int], Dict[int, str]],
+                 max_workers: int = 8, checkpoint_file_name: str = "backfill_checkpoint",
+                 checkpoint_interval: float = 5.0):
+        """Instantiate a season backfill pipeline.
+
+        Args:
+            yahoo_query (YahooFantasySportsQuery): Authenticated query instance whose session, token refreshes, and rate
+                limit are shared by all queries of the backfill.
+            data (Data): YFPY Data instance to which all retrieved data is saved.
+            seasons (Iterable[int] | dict[int, str]): Seasons/years to backfill, or a dictionary with seasons/years as
+                keys and the league IDs of the league in those seasons as values (for leagues whose ID changed when they
+                were renewed).
+            max_workers (int, optional): Maximum number of queries run concurrently (defaults to 8).
+            checkpoint_file_name (str, optional): Name of the checkpoint file in the data directory (defaults to
+                "backfill_checkpoint").
+            checkpoint_interval (float, optional): Minimum number of seconds between writes of the checkpoint file while
+                units are completing (defaults to 5.0).
+
+        Attributes:
+            yahoo_query (YahooFantasySportsQuery): Authenticated query instance shared by all queries of the backfill.
+            data (Data): YFPY Data instance to which all retrieved data is saved.
+            league_ids_by_season (dict[int, str]): League IDs keyed by season/year.
+            max_workers (int): Maximum number of queries run concurrently.
+            checkpoint_file_path (Path): Path to the checkpoint file recording completed units.
+            checkpoint_interval (float): Minimum number of seconds between writes of the checkpoint file.
+
+        """
+        self.yahoo_query: YahooFantasySportsQuery = yahoo_query
+        self.data: Data = data
+        if isinstance(seasons, dict):
+            self.league_ids_by_season: Dict[int, str] = {int(k): str(v) for k, v in seasons.items()}
+        else:
+            self.league_ids_by_season: Dict[int, str] = {int(season): yahoo_query.league_id for season in seasons}
+        self.max_workers: int = max_workers
+        self.checkpoint_file_path: Path = Path(self.data.data_dir) / f"{checkpoint_file_name}.json"
+        # never evict the checkpoint when the saved data is pruned
+        if checkpoint_file_name not in self.data.cache_excluded_file_name_patterns:
+            self.data.cache_excluded_file_name_patterns.append(checkpoint_file_name)
+        self.checkpoint_interval: float = checkpoint_interval
+
+        self._checkpoint_lock: threading.Lock = threading.Lock()
+        self._checkpoint: Dict[str, Any] = self._load_checkpoint()
+        self._has_unsaved_checkpoint: bool = False
+        self._checkpoint_saved_at: float = time.monotonic()
+
+    def _load_checkpoint(self) -> Dict[str, Any]:
+        """Load the checkpoint of a previous run of the backfill if one exists.
+
+        Returns:
+            dict[str, Any]: Dictionary with the game keys by season and the unit IDs of completed units.
+
+        """
+        checkpoint = {"game_keys": {}, "completed_units": []}
+        if self.checkpoint_file_path.is_file():
+            with open(self.checkpoint_file_path, "r", encoding="utf-8") as checkpoint_file:
+                checkpoint.update(json.load(checkpoint_file))
+            logger.debug(f"Loaded backfill checkpoint from: {self.checkpoint_file_path}")
+        return checkpoint
+
+    def _save_checkpoint(self) -> None:
+        """Write the checkpoint to the data directory (must be called while holding the checkpoint lock).
+
+        Returns:
+            None
+
+        """
+        # write the checkpoint atomically so an interruption never leaves it truncated
+        with atomic_write(self.checkpoint_file_path) as temporary_file_path:
+            with open(temporary_file_path, "w", encoding="utf-8") as checkpoint_file:
+                json.dump(self._checkpoint, checkpoint_file, indent=2)
+        self._has_unsaved_checkpoint = False
+        self._checkpoint_saved_at = time.monotonic()
+
+    def _flush_checkpoint(self) -> None:
+        """Write the checkpoint to the data directory if units were completed since it was last written.
+
+        Returns:
+            None
+
+        """
+        with self._checkpoint_lock:
+            if self._has_unsaved_checkpoint:
+                self._save_checkpoint()
+
+    @property
+    def completed_unit_ids(self) -> Set[str]:
+        """Unit IDs of all units completed during this or any previous run.
+
+        Returns:
+            set[str]: Set of completed unit IDs.
+
+        """
+        with self._checkpoint_lock:
+            return set(self._checkpoint["completed_units"])
+
+    def _mark_completed(self, unit: BackfillUnit) -> None:
+        with self._checkpoint_lock:
+            self._checkpoint["completed_units"].append(unit.unit_id)
+            self._has_unsaved_checkpoint = True
+            # batch checkpoint writes instead of rewriting the checkpoint file after every unit
+            if time.monotonic() - self._checkpoint_saved_at >= self.checkpoint_interval:
+                self._save_checkpoint()
+
+    def _get_game_keys(self) -> Dict[int, str]:
+        """Retrieve the game keys of all backfilled seasons with a single query (or from the checkpoint).
+
+        Returns:
+            dict[int, str]: Game keys keyed by season/year.
+
+        """
+        game_keys = {int(season): game_key for season, game_key in self._checkpoint["game_keys"].items()}
+        if not set(self.league_ids_by_season.keys()).issubset(game_keys.keys()):
+            with self.yahoo_query.suppress_json_str_output():
+                games = self.yahoo_query.get_all_yahoo_fantasy_game_keys()
+            game_keys = {int(game.season): str(game.game_key) for game in games}
+
+            missing_seasons = set(self.league_ids_by_season.keys()).difference(game_keys.keys())
+            if missing_seasons:
+                raise ValueError(f"No Yahoo Fantasy Sports games found for seasons: {sorted(missing_seasons)}")
+
+            with self._checkpoint_lock:
+                self._checkpoint["game_keys"] = {str(season): game_key for season, game_key in game_keys.items()}
+                self._save_checkpoint()
+
+        return {season: game_keys[season] for season in self.league_ids_by_season.keys()}
+
+    def _get_season_queries(self) -> Dict[int, YahooFantasySportsQuery]:
+        """Create query instances for the league in every backfilled season.
+
+        Returns:
+            dict[int, YahooFantasySportsQuery]: Query instances keyed by season/year.
+
+        """
+        season_queries = {}
+        for season, game_key in self._get_game_keys().items():
+            league_id = self.league_ids_by_season[season]
+            season_query = self.yahoo_query.for_league(league_id, int(game_key) if game_key.isdigit() else None)
+            season_query.league_key = f"{game_key}.l.{league_id}"
+            season_queries[season] = season_query
+        return season_queries
+
+    def _run_units(self, units: List[BackfillUnit], season_queries: Dict[int, YahooFantasySportsQuery],
+                   backfill_result: BackfillResult) -> Dict[str, Any]:
+        """Concurrently run and save all units that have not already been completed, and checkpoint the final ones.
+
+        Args:
+            units (list[BackfillUnit]): Units to run.
+            season_queries (dict[int, YahooFantasySportsQuery]): Query instances keyed by season/year.
+            backfill_result (BackfillResult): Backfill result to which the outcome of every unit is added.
+
+        Returns:
+            dict[str, Any]: Data retrieved by every unit that was run keyed by unit ID.
+
+        """
+        completed_unit_ids = self.completed_unit_ids
+        # deduplicate units shared by multiple seasons or operations
+        units_to_run = {}
+        for unit in units:
+            if unit.unit_id in completed_unit_ids:
+                backfill_result.skipped.append(unit.unit_id)
+            else:
+                units_to_run[unit.unit_id] = unit
+
+        unit_data = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.data.save,
+                    unit.unit_id,
+                    getattr(season_queries[unit.season], unit.operation_name),
+                    unit.params
+                ): unit for unit in units_to_run.values()
+            }
+
+            try:
+                for future in as_completed(futures):
+                    unit = futures[future]
+                    try:
+                        unit_data[unit.unit_id] = future.result()
+                        if unit.is_final:
+                            self._mark_completed(unit)
+                        backfill_result.completed.append(unit.unit_id)
+                    except _QUERY_ERRORS as e:
+                        logger.warning(f"Backfill unit {unit.unit_id} failed: {e}")
+                        backfill_result.failures[unit.unit_id] = e
+            finally:
+                self._flush_checkpoint()
+
+        return unit_data
+
+    def _get_weeks(self, league_metadata: League) -> List[int]:
+        """Determine all completed weeks of a league season from its metadata (excluding the current week of a season
+        in progress, whose matchups can still change).
+
+        Args:
+            league_metadata (League): YFPY League instance with league metadata.
+
+        Returns:
+            list[int]: Weeks of the league season.
+
+        """
+        start_week = int(league_metadata.start_week or 1)
+        if league_metadata.is_finished:
+            end_week = int(league_metadata.end_week or start_week)
+        else:
+            end_week = int(league_metadata.current_week or start_week) - 1
+        return list(range(start_week, end_week + 1))
+
+    def plan(self, league_metadata_by_season: Dict[int, League]) -> List[BackfillUnit]:
+        """Plan all per-season units of the backfill.
+
+        Args:
+            league_metadata_by_season (dict[int, League]): YFPY League instances with league metadata keyed by
+                season/year.
+
+        Returns:
+            list[BackfillUnit]: All units needed to backfill the selected seasons.
+
+        """
+        units = []
+        for season, league_metadata in league_metadata_by_season.items():
+            league_key = str(league_metadata.league_key)
+            is_finished = bool(league_metadata.is_finished)
+            units.extend([
+                BackfillUnit(season, league_key, "get_league_standings", is_final=is_finished),
+                BackfillUnit(
+                    season, league_key, "get_league_draft_results",
+                    is_final=is_finished or league_metadata.draft_status == "postdraft"
+                ),
+                BackfillUnit(season, league_key, "get_league_transactions", is_final=is_finished),
+            ])
+            units.extend([
+                BackfillUnit(
+                    season, league_key, "get_league_matchups_by_week", {"chosen_week": week},
+                    label=f"league_matchups_week_{week}"
+                ) for week in self._get_weeks(league_metadata)
+            ])
+        return units
+
+    def run(self) -> BackfillResult:
+        """Run the backfill, skipping all units completed during previous runs.
+
+        Returns:
+            BackfillResult: The completed, skipped, and failed units of the backfill.
+
+        """
+        backfill_result = BackfillResult()
+        season_queries = self._get_season_queries()
+
+        # retrieve (or load previously saved) league metadata to determine the weeks of every season, and only
+        # checkpoint the metadata of finished seasons, since the current week of a season in progress keeps advancing
+        metadata_units = {
+            season: BackfillUnit(season, season_query.league_key, "get_league_metadata", is_final=False)
+            for season, season_query in season_queries.items()
+        }
+        metadata_unit_data = self._run_units(list(metadata_units.values()), season_queries, backfill_result)
+        for metadata_unit in metadata_units.values():
+            league_metadata = metadata_unit_data.get(metadata_unit.unit_id)
+            if isinstance(league_metadata, League) and league_metadata.is_finished:
+                self._mark_completed(metadata_unit)
+        self._flush_checkpoint()
+
+        league_metadata_by_season = {}
+        for season, metadata_unit in metadata_units.items():
+            if metadata_unit.unit_id in backfill_result.failures:
+                continue
+            league_metadata = metadata_unit_data.get(metadata_unit.unit_id)
+            if not isinstance(league_metadata, League):
+                league_metadata = self.data.load(metadata_unit.unit_id, League)
+            league_metadata_by_season[season] = league_metadata
+
+        self._run_units(self.plan(league_metadata_by_season), season_queries, backfill_result)
+
+        logger.info(
+            f"Backfill of {len(season_queries)} season(s) finished: {len(backfill_result.completed)} completed, "
+            f"{len(backfill_result.skipped)} skipped, {len(backfill_result.failures)} failed."
+        )
+        return backfill_result
@@ -0,0 +1,612 @@
+# -*- coding: utf-8 -*-
+"""YFPY module for the read-through cache and the checksummed manifest of saved Yahoo Fantasy Sports data.
+
+This module provides the collaborators of the Data module that manage saved data independently of how it is stored:
+DataCache derives cache keys, decides whether saved data is fresh, and evicts saved data by age and size, while
+DataManifest records and verifies the checksums of saved data files. Both are created by (and only used through) Data
+objects, which provide the storage of the saved data.
+
+Example:
+    The cache and manifest are configured through the Data module::
+
+        data = Data(data_dir, cache=True, max_cache_bytes=10 ** 9, use_manifest=True)
+        data.retrieve(yf_query=yahoo_query.get_league_standings)
+        data.prune(file_name_prefix="331/")
+        data.verify_manifest()
+
+Attributes:
+    logger (Logger): Module level logger for usage and debugging.
+    MANIFEST_FILE_NAME (str): File name of the checksummed manifest of all data saved in a data directory.
+    MANIFEST_LOCK_FILE_NAME (str): File name of the lock file used for advisory locking of the manifest.
+    GAME_METADATA_FILE_NAME_PREFIX (str): File name prefix under which the metadata of completed Yahoo Fantasy games is
+        cached to determine the freshness of cached data.
+    CACHE_EXCLUDED_FILE_NAME_PATTERNS (list[str]): File name patterns (fnmatch-style) of saved files that are not
+        query results and are therefore never evicted from (or counted towards) the saved data by default.
+    CACHE_KEY_EXCLUDED_PARAMS (set[str]): yfpy query parameters that do not affect the retrieved data and are therefore
+        excluded from derived cache keys.
+    CACHE_KEY_MAX_PARAMS_LENGTH (int): Maximum length of the parameters part of a derived cache key before it is
+        shortened with a hash.
+    CACHE_KEY_RELATIVE_PARAMS (dict[str, Any]): yfpy query parameters and the values with which they refer to data
+        relative to the time of the query (such as the current week), so no cache key can be derived for them.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import fnmatch
+import hashlib
+import inspect
+import json
+import re
+import sys
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Set, Union
+
+from yfpy.exceptions import YahooFantasySportsDataCorrupted
+from yfpy.logger import get_logger
+from yfpy.models import Game
+from yfpy.utils import atomic_write, file_lock, get_file_checksum
+
+if TYPE_CHECKING:
+    from yfpy.data import Data
+
+logger = get_logger(__name__)
+
+MANIFEST_FILE_NAME: str = "yfpy_manifest.json"
+MANIFEST_LOCK_FILE_NAME: str = ".yfpy_manifest.lock"
+
+GAME_METADATA_FILE_NAME_PREFIX: str = "yfpy_games/game_"
+
+# the metadata of completed games and the default checkpoint of yfpy.bulk.SeasonBackfill
+CACHE_EXCLUDED_FILE_NAME_PATTERNS: List[str] = [f"{GAME_METADATA_FILE_NAME_PREFIX}*", "backfill_checkpoint"]
+
+CACHE_KEY_EXCLUDED_PARAMS: Set[str] = {"max_workers"}
+CACHE_KEY_MAX_PARAMS_LENGTH: int = 100
+CACHE_KEY_RELATIVE_PARAMS: Dict[str, Any] = {"chosen_week": "current", "chosen_date": None}
+
+
+def _is_yahoo_query(obj: Any) -> bool:
+    """Check if an object is a YahooFantasySportsQuery instance without importing the query module (and its HTTP and
+    OAuth dependencies), so offline use of the Data module stays lightweight.
+
+    Args:
+        obj (Any): Object to check.
+
+    Returns:
+        bool: True if the object is a YahooFantasySportsQuery instance, else False.
+
+    """
+    # an object can only be a YahooFantasySportsQuery instance if the query module has already been imported
+    query_module = sys.modules.get("yfpy.query")
+    return query_module is not None and isinstance(obj, query_module.YahooFantasySportsQuery)
+
+
+class DataCache(object):
+    """YFPY read-through cache of a Data object, which derives the file names (cache keys) of query results, decides
+    whether saved data is fresh, and evicts saved data by age and size.
+
+    The cache settings (cache_ttl, game_status_check_interval, max_cache_bytes, max_cache_age, prune_interval, and
+    cache_excluded_file_name_patterns) are read from the Data object, and the saved data is read, measured, and deleted
+    through it, so the same cache works for every storage of saved data (such as data files or a SQLite database).
+    """
+
+    def __init__(self, data: "Data"):
+        """Instantiate the cache of a Data object.
+
+        Args:
+            data (Data): Data object providing the cache settings and the storage of the saved data.
+
+        Attributes:
+            data (Data): Data object providing the cache settings and the storage of the saved data.
+
+        """
+        self.data: "Data" = data
+        self._completed_game_ids: Set[int] = set()
+        self._active_games_checked_at: Dict[Union[int, str], float] = {}
+        self._game_status_lock: threading.Lock = threading.Lock()
+        self._resolved_league_keys: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._cache_size: Optional[int] = None
+        self._pruned_at: float = 0.0
+        self._cache_size_lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def _format_cache_key_value(value: Any) -> str:
+        """Format a yfpy query parameter value for use in a cache key.
+
+        Args:
+            value (Any): Query parameter value.
+
+        Returns:
+            str: Formatted query parameter value.
+
+        """
+        if isinstance(value, (list, tuple)):
+            return "+".join(DataCache._format_cache_key_value(el) for el in value)
+        elif isinstance(value, (set, frozenset)):
+            return "+".join(sorted(DataCache._format_cache_key_value(el) for el in value))
+        elif isinstance(value, bytes):
+            return value.decode("utf-8")
+        return str(value)
+
+    def get_league_key(self, yf_query_instance: Any) -> Optional[str]:
+        """Get the league key of a query object, only retrieving it if the query object has no league key or game ID.
+
+        League keys retrieved for the current season are reused for game_status_check_interval seconds, after which
+        they are retrieved again in case the current season rolled over.
+
+        Args:
+            yf_query_instance (YahooFantasySportsQuery): The query object.
+
+        Returns:
+            str | None: The league key, or None if the object is not a YahooFantasySportsQuery instance and has no
+                league key.
+
+        """
+        if not _is_yahoo_query(yf_query_instance):
+            return getattr(yf_query_instance, "league_key", None)
+        if yf_query_instance.league_key:
+            return yf_query_instance.league_key
+        if yf_query_instance.game_id:
+            # the game ID of a query object is the game key of its season
+            return f"{yf_query_instance.game_id}.l.{yf_query_instance.league_id}"
+
+        with self._game_status_lock:
+            league_key, resolved_at = self._resolved_league_keys.get(yf_query_instance, (None, 0.0))
+        if league_key and time.time() - resolved_at < self.data.game_status_check_interval:
+            return league_key
+
+        with yf_query_instance.suppress_json_str_output():
+            league_key = yf_query_instance.get_league_key()
+        with self._game_status_lock:
+            self._resolved_league_keys[yf_query_instance] = (league_key, time.time())
+        return league_key
+
+    @staticmethod
+    def _bind_params(yf_query: Callable, params: Union[Dict[str, Any], None]) -> Dict[str, Any]:
+        """Bind query parameters to the signature of a yfpy query method, including omitted default parameters.
+
+        Args:
+            yf_query (Callable of YahooFantasySportsQuery): Chosen yfpy query method.
+            params (dict[str, Any], optional): Dictionary of parameters to be passed to chosen yfpy query function.
+
+        Returns:
+            dict[str, Any]: Dictionary with all parameter names of the query method as keys and parameter values as
+                values.
+
+        """
+        try:
+            bound_params = inspect.signature(yf_query).bind(**(params or {}))
+            bound_params.apply_defaults()
+            return dict(bound_params.arguments)
+        except (TypeError, ValueError):
+            # fall back to the given parameters for callables without an inspectable signature
+            return dict(params or {})
+
+    @classmethod
+    def get_relative_params(cls, yf_query: Callable, params: Union[Dict[str, Any], None]) -> List[str]:
+        """Get the names of the query parameters that refer to data relative to the time of the query.
+
+        Args:
+            yf_query (Callable of YahooFantasySportsQuery): Chosen yfpy query method.
+            params (dict[str, Any], optional): Dictionary of parameters to be passed to chosen yfpy query function.
+
+        Returns:
+            list[str]: Names of parameters with a relative value (see CACHE_KEY_RELATIVE_PARAMS).
+
+        """
+        return [
+            param_name for param_name, param_value in cls._bind_params(yf_query, params).items()
+            if param_name in CACHE_KEY_RELATIVE_PARAMS and param_value == CACHE_KEY_RELATIVE_PARAMS[param_name]
+        ]
+
+    def get_cache_key(self, yf_query: Callable, params: Union[Dict[str, Any], None] = None) -> str:
+        """Derive a deterministic file name (cache key) for the data retrieved by a yfpy query (see
+        `Data.get_cache_key`).
+
+        Args:
+            yf_query (Callable of YahooFantasySportsQuery): Chosen yfpy query method.
+            params (dict[str, Any], optional): Dictionary of parameters to be passed to chosen yfpy query function.
+
+        Raises:
+            ValueError: If the query is not a named function/method or is a query of relative data.
+
+        Returns:
+            str: Cache key that can be used as the file name of the retrieved data.
+
+        """
+        query_name = getattr(yf_query, "__name__", None)
+        if not query_name:
+            raise ValueError(f"Unable to derive a cache key for {yf_query}, since it is not a named function/method.")
+
+        relative_params = self.get_relative_params(yf_query, params)
+        if relative_params:
+            raise ValueError(
+                f"Unable to derive a cache key for {query_name}, since the parameters {relative_params} refer to data "
+                f"relative to the time of the query. Pass explicit parameter values or a file name instead."
+            )
+
+        yf_query_instance = getattr(yf_query, "__self__", None)
+        if _is_yahoo_query(yf_query_instance):
+            league_key = self.get_league_key(yf_query_instance)
+            key_prefix = f"{league_key.split('.l.')[0]}/{league_key}/{query_name}"
+        else:
+            key_prefix = query_name
+
+        params = self._bind_params(yf_query, params)
+        params_key = ",".join(
+            f"{param_name}={self._format_cache_key_value(param_value)}" for param_name, param_value in params.items()
+            if param_name not in CACHE_KEY_EXCLUDED_PARAMS
+        )
+        if not params_key:
+            return key_prefix
+
+        safe_params_key = re.sub(r"[^\w.,=+-]", "_", params_key)
+        if safe_params_key != params_key or len(safe_params_key) > CACHE_KEY_MAX_PARAMS_LENGTH:
+            # keep keys readable, but distinct for parameters that were shortened or contained unsafe characters
+            params_hash = hashlib.sha256(params_key.encode("utf-8")).hexdigest()[:16]
+            safe_params_key = f"{safe_params_key[:CACHE_KEY_MAX_PARAMS_LENGTH - 17]}_{params_hash}"
+        return f"{key_prefix}/{safe_params_key}"
+
+    def is_game_over(self, yf_query: Callable) -> bool:
+        """Check if the Yahoo Fantasy game (season) of a yfpy query is over (or in its offseason), in which case its
+        data will not change.
+
+        The metadata of completed games is saved along with the other data (and remembered), so completed seasons only
+        need to be checked with the Yahoo Fantasy Sports REST API once. Games that are not over are only checked again
+        after game_status_check_interval seconds.
+
+        Args:
+            yf_query (Callable of YahooFantasySportsQuery): Chosen yfpy query method.
+
+        Returns:
+            bool: True if the game of the query is over, else False (including when the game cannot be determined).
+
+        """
+        yf_query_instance = getattr(yf_query, "__self__", None)
+        if not _is_yahoo_query(yf_query_instance) or yf_query_instance.offline:
+            return False
+
+        game_id = yf_query_instance.game_id
+        active_game_key = int(game_id) if game_id is not None else yf_query_instance.game_code
+        with self._game_status_lock:
+            active_game_checked_at = self._active_games_checked_at.get(active_game_key)
+        if (active_game_checked_at is not None
+                and time.time() - active_game_checked_at < self.data.game_status_check_interval):
+            return False
+
+        if game_id is not None:
+            game_id = int(game_id)
+            game_metadata_file_name = f"{GAME_METADATA_FILE_NAME_PREFIX}{game_id}"
+            with self._game_status_lock:
+                if game_id in self._completed_game_ids:
+                    return True
+            try:
+                # completed games are the only saved game metadata, since the metadata of other games can change
+                game = self.data._unpack_loaded_data(self.data._read_data(game_metadata_file_name)[0], Game)
+            except (FileNotFoundError, YahooFantasySportsDataCorrupted):
+                with yf_query_instance.suppress_json_str_output():
+                    game = yf_query_instance.get_game_metadata_by_game_id(game_id)
+                if self._is_completed_game(game):
+                    self.data._write_data(game_metadata_file_name, game,
+                                          yf_query_instance.get_game_metadata_by_game_id, {"game_id": game_id})
+        else:
+            with yf_query_instance.suppress_json_str_output():
+                game = yf_query_instance.get_current_game_metadata()
+
+        is_completed_game = self._is_completed_game(game)
+        with self._game_status_lock:
+            if not is_completed_game:
+                self._active_games_checked_at[active_game_key] = time.time()
+            elif game_id is not None:
+                self._completed_game_ids.add(game_id)
+        return is_completed_game
+
+    @staticmethod
+    def _is_completed_game(game: Game) -> bool:
+        """Check if a Yahoo Fantasy game (season) is over or in its offseason, in which case its data will not change.
+
+        Args:
+            game (Game): YFPY Game model of the game metadata.
+
+        Returns:
+            bool: True if the game is over or in its offseason, else False.
+
+        """
+        return bool(game.is_game_over or game.is_offseason)
+
+    def is_fresh(self, file_name: str, yf_query: Callable) -> bool:
+        """Check if saved data is fresh, meaning it was saved less than cache_ttl seconds ago or it belongs to a
+        completed Yahoo Fantasy game (season).
+
+        Args:
+            file_name (str): Name of file to which data was saved.
+            yf_query (Callable of YahooFantasySportsQuery): Chosen yfpy query method that retrieves the data.
+
+        Returns:
+            bool: True if the saved data exists and is fresh, else False.
+
+        """
+        saved_data_time = self.data._get_saved_data_time(file_name)
+        if saved_data_time is None:
+            return False
+        if self.data.cache_ttl is not None and time.time() - saved_data_time <= self.data.cache_ttl:
+            return True
+        return self.is_game_over(yf_query)
+
+    def is_excluded(self, file_name: str) -> bool:
+        """Check if a saved file is excluded from the saved data that is evicted and counted towards its size.
+
+        Args:
+            file_name (str): Name of the saved file.
+
+        Returns:
+            bool: True if the file name matches any of the cache_excluded_file_name_patterns, otherwise False.
+
+        """
+        return any(
+            fnmatch.fnmatchcase(file_name, file_name_pattern)
+            for file_name_pattern in self.data.cache_excluded_file_name_patterns
+        )
+
+    @contextmanager
+    def track_saved_data(self, file_name: str) -> Iterator[None]:
+        """Context manager to track the size of the saved data while data is saved under a file name, and to prune
+        the saved data afterwards if it is due (only when max_cache_bytes or max_cache_age is set).
+
+        Args:
+            file_name (str): Name of file to which data is saved.
+
+        Returns:
+            Iterator[None]: Iterator saving the data until it is exhausted.
+
+        """
+        if self.data.max_cache_bytes is None and self.data.max_cache_age is None:
+            yield
+            return
+
+        previous_saved_size = self.data._get_saved_size(file_name)
+        yield
+        self._prune_if_due(file_name, self.data._get_saved_size(file_name) - previous_saved_size)
+
+    def _prune_if_due(self, file_name: str, saved_size_change: int) -> None:
+        """Track the size of the saved data after data was saved, and prune the saved data if it exceeds the maximum
+        size, if it was never measured, or if it was last pruned more than prune_interval seconds ago.
+
+        Args:
+            file_name (str): Name of file to which data was saved.
+            saved_size_change (int): Change of the size in bytes of the data saved under the file name.
+
+        Returns:
+            None
+
+        """
+        with self._cache_size_lock:
+            if self._cache_size is not None and not self.is_excluded(file_name):
+                self._cache_size += saved_size_change
+            is_due = (
+                self._cache_size is None
+                or (self.data.max_cache_bytes is not None and self._cache_size > self.data.max_cache_bytes)
+                or time.monotonic() - self._pruned_at >= self.data.prune_interval
+            )
+        if is_due:
+            self.prune()
+
+    @staticmethod
+    def _get_max_age(file_name: str, max_age: Union[float, Dict[str, float], None]) -> Optional[float]:
+        """Get the maximum age of saved data.
+
+        Args:
+            file_name (str): Name of file to which data was saved.
+            max_age (float | dict[str, float], optional): Maximum age in seconds, or a dictionary with file name
+                patterns as keys and maximum ages as values (see `Data`).
+
+        Returns:
+            float | None: Maximum age in seconds of the saved data, or None if it is never evicted by age.
+
+        """
+        if not isinstance(max_age, dict):
+            return max_age
+        for file_name_pattern, pattern_max_age in max_age.items():
+            if fnmatch.fnmatchcase(file_name, file_name_pattern):
+                return pattern_max_age
+        return None
+
+    def get_usage(self, depth: int = 2) -> Dict[str, Dict[str, Any]]:
+        """Inspect the usage of the saved data grouped by the leading components of the file names (see
+        `Data.get_cache_usage`).
+
+        Args:
+            depth (int, optional): Number of leading file name components by which to group the saved data (defaults
+                to 2).
+
+        Returns:
+            dict[str, dict[str, Any]]: Dictionary with file name prefixes as keys and dictionaries with the number of
+                saved files ("files"), their total size in bytes ("size"), and the most recent save ("saved_at") and
+                access ("accessed_at") times as values.
+
+        """
+        with self.data._lock_data_dir(shared=True):
+            cache_entries = self.data._get_cache_entries()
+
+        cache_usage: Dict[str, Dict[str, Any]] = {}
+        for cache_entry in sorted(cache_entries, key=lambda entry: entry["file_name"]):
+            group = "/".join(cache_entry["file_name"].split("/")[:depth])
+            group_usage = cache_usage.setdefault(group, {"files": 0, "size": 0, "saved_at": 0.0, "accessed_at": 0.0})
+            group_usage["files"] += 1
+            group_usage["size"] += cache_entry["size"]
+            group_usage["saved_at"] = max(group_usage["saved_at"], cache_entry["saved_at"])
+            group_usage["accessed_at"] = max(group_usage["accessed_at"], cache_entry["accessed_at"])
+        return cache_usage
+
+    def prune(self, max_bytes: Optional[int] = None, max_age: Union[float, Dict[str, float], None] = None,
+              file_name_prefix: str = "") -> List[str]:
+        """Evict saved data that is older than the maximum age, and then evict the least recently used (saved or
+        loaded) data until the saved data fits within the maximum size (see `Data.prune`).
+
+        Args:
+            max_bytes (int, optional): Maximum total size in bytes of the saved data (defaults to max_cache_bytes).
+            max_age (float | dict[str, float], optional): Maximum age in seconds of saved data, or a dictionary with
+                file name patterns as keys and maximum ages as values (defaults to max_cache_age).
+            file_name_prefix (str, optional): Only prune saved data with file names starting with this prefix (defaults
+                to all saved data).
+
+        Returns:
+            list[str]: File names of the evicted data.
+
+        """
+        max_bytes = max_bytes if max_bytes is not None else self.data.max_cache_bytes
+        max_age = max_age if max_age is not None else self.data.max_cache_age
+
+        with self.data._lock_data_dir():
+            cache_entries = [
+                cache_entry for cache_entry in self.data._get_cache_entries()
+                if cache_entry["file_name"].startswith(file_name_prefix)
+            ]
+
+            now = time.time()
+            evicted_file_names = set()
+            if max_age is not None:
+                for cache_entry in cache_entries:
+                    entry_max_age = self._get_max_age(cache_entry["file_name"], max_age)
+                    if entry_max_age is not None and now - cache_entry["saved_at"] > entry_max_age:
+                        evicted_file_names.add(cache_entry["file_name"])
+
+            if max_bytes is not None:
+                retained_cache_entries = sorted(
+                    (entry for entry in cache_entries if entry["file_name"] not in evicted_file_names),
+                    key=lambda entry: entry["accessed_at"]
+                )
+                total_size = sum(cache_entry["size"] for cache_entry in retained_cache_entries)
+                for cache_entry in retained_cache_entries:
+                    if total_size <= max_bytes:
+                        break
+                    evicted_file_names.add(cache_entry["file_name"])
+                    total_size -= cache_entry["size"]
+
+            evicted_file_names = sorted(evicted_file_names)
+            if evicted_file_names:
+                self.data._delete_cache_entries(evicted_file_names)
+                logger.debug(f"Evicted {len(evicted_file_names)} saved data files from {self.data.data_dir}.")
+
+        with self._cache_size_lock:
+            if file_name_prefix:
+                # only part of the saved data was measured, so measure all of it when data is saved next
+                self._cache_size = None
+            else:
+                self._cache_size = sum(
+                    cache_entry["size"] for cache_entry in cache_entries
+                    if cache_entry["file_name"] not in evicted_file_names
+                )
+                self._pruned_at = time.monotonic()
+        return evicted_file_names
+
+
+class DataManifest(object):
+    """YFPY checksummed manifest of all data files saved in the data directory of a Data object.
+
+    Every update of the manifest (a read-modify-write of the manifest file) holds an advisory lock on a dedicated lock
+    file in the data directory, so concurrent updates from other threads, Data objects, or processes are never lost,
+    even when file locking of the data directory (lock_files) is disabled.
+    """
+
+    def __init__(self, data: "Data"):
+        """Instantiate the manifest of a Data object.
+
+        Args:
+            data (Data): Data object whose data directory the manifest records.
+
+        Attributes:
+            data (Data): Data object whose data directory the manifest records.
+
+        """
+        self.data: "Data" = data
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def file_path(self) -> Path:
+        """Path of the manifest in the current data directory.
+
+        Returns:
+            Path: Manifest file path.
+
+        """
+        return self.data.data_dir / MANIFEST_FILE_NAME
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Load the manifest.
+
+        Returns:
+            dict[str, dict[str, Any]]: Dictionary with data file paths relative to the data directory as keys and
+                dictionaries with the checksum ("sha256"), size ("size"), and save time ("saved_at") of the data files
+                as values.
+
+        """
+        if self.file_path.is_file():
+            with open(self.file_path, "r", encoding="utf-8") as manifest_file:
+                return json.load(manifest_file)
+        return {}
+
+    def update(self, data_file_path: Optional[Path] = None, removed_file_paths: Optional[List[Path]] = None) -> None:
+        """Record the checksum of a saved data file in the manifest and remove the entries of removed data files.
+
+        Args:
+            data_file_path (Path, optional): Path of the saved data file.
+            removed_file_paths (list[Path], optional): Paths of removed data files.
+
+        Returns:
+            None
+
+        """
+        data_dir = self.data.data_dir
+        with self._lock, file_lock(data_dir / MANIFEST_LOCK_FILE_NAME):
+            manifest = self.load()
+            for removed_file_path in removed_file_paths or []:
+                manifest.pop(removed_file_path.relative_to(data_dir).as_posix(), None)
+            if data_file_path is not None:
+                manifest[data_file_path.relative_to(data_dir).as_posix()] = {
+                    "sha256": get_file_checksum(data_file_path),
+                    "size": data_file_path.stat().st_size,
+                    "saved_at": time.time(),
+                }
+            with atomic_write(self.file_path) as temporary_file_path:
+                with open(temporary_file_path, "w", encoding="utf-8") as manifest_file:
+                    json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+
+    def verify_checksum(self, data_file_path: Path) -> None:
+        """Verify the checksum of a saved data file against the manifest (if it has been recorded).
+
+        Args:
+            data_file_path (Path): Path of the saved data file.
+
+        Raises:
+            YahooFantasySportsDataCorrupted: If the data file does not match its recorded checksum.
+
+        Returns:
+            None
+
+        """
+        manifest_entry = self.load().get(data_file_path.relative_to(self.data.data_dir).as_posix())
+        if manifest_entry and get_file_checksum(data_file_path) != manifest_entry.get("sha256"):
+            raise YahooFantasySportsDataCorrupted(
+                f"File {data_file_path} does not match the checksum recorded in {self.file_path}."
+            )
+
+    def verify(self) -> List[str]:
+        """Verify the checksums of all data files recorded in the manifest.
+
+        Returns:
+            list[str]: Paths (relative to the data directory) of all recorded data files that are missing or do not
+                match their recorded checksum.
+
+        """
+        data_dir = self.data.data_dir
+        with self.data._lock_data_dir(shared=True):
+            return [
+                relative_file_path for relative_file_path, manifest_entry in self.load().items()
+                if not (data_dir / relative_file_path).is_file()
+                or get_file_checksum(data_dir / relative_file_path) != manifest_entry.get("sha256")
+            ]
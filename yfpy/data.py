@@ -23,27 +23,91 @@ Example:
         data.save("file_name", yahoo_query.get_all_yahoo_fantasy_game_keys)
         data.load("file_name")
 
+    Collection-shaped query results (lists of YFPY models such as players, transactions, or matchups) can instead be
+    stored in a columnar format (Apache Parquet or Arrow IPC, which require the optional pyarrow dependency) so that
+    individual columns can be read with `load_table` without rebuilding any models (`load` still rebuilds the models
+    from the serialized model data stored alongside the columns)::
+
+        data = Data(data_dir, storage_format="arrow")
+        data.save("players", yahoo_query.get_league_players)
+        data.load_table("players", columns=["player_key", "player_points_value"])
+
+    Query results can also be saved to an indexed SQLite database, from which slices of the saved data can be loaded
+    by league key, season, week, date, team key, and/or player key::
+
+        data = SQLiteData(data_dir)
+        data.save("team_3_week_1_roster", yahoo_query.get_team_roster_by_week, {"team_id": 3, "chosen_week": 1})
+        data.find(query="get_team_roster_by_week", team_key="<league_key>.t.3", season=2021)
+
+    The file name can also be omitted, in which case it is derived from the query method, its parameters, and the game
+    and league of the query object (see `Data.get_cache_key`), so any yfpy query can be memoized transparently::
+
+        data = Data(data_dir, cache=True)
+        data.retrieve(yf_query=yahoo_query.get_team_roster_by_week, params={"team_id": 3, "chosen_week": 1})
+        get_roster = data.memoize(yahoo_query.get_team_roster_by_week)
+        get_roster(3, chosen_week=1)
+
+    Saved data can be evicted by age (per file name pattern) and by total size (least recently used first), either
+    automatically whenever data is saved or on demand, and the usage of the data directory can be inspected per season
+    (game) and league::
+
+        data = Data(data_dir, cache=True, max_cache_bytes=10 ** 9, max_cache_age={"*/get_league_players/*": 3600})
+        data.get_cache_usage()
+        data.prune(file_name_prefix="331/")
+
 Attributes:
     logger (Logger): Module level logger for usage and debugging.
+    STORAGE_FORMAT_FILE_EXTENSIONS (dict[str, str]): Supported storage formats and their file extensions.
+    MODEL_CLASS_COLUMN (str): Name of the column storing the model class of each row of columnar data.
+    MODEL_DATA_COLUMN (str): Name of the column storing the serialized model data of each row of columnar data.
+    LOCK_FILE_NAME (str): File name of the lock file used for advisory locking of a data directory.
+    COMPRESSIONS (list[str]): Supported compressions.
 
 """
 __author__ = "Wren J. R. (uberfastman)"
 __email__ = "uberfastman@uberfastman.dev"
 
+import functools
 import inspect
 import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import ExitStack, contextmanager, nullcontext
 from pathlib import Path, PosixPath
-from typing import Any, Callable, Dict, List, Type, TypeVar, Union
+from typing import (
+    Any, Callable, ClassVar, ContextManager, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Type, TypeVar, Union
+)
 
 from stringcase import snakecase
 
+from yfpy.cache import CACHE_EXCLUDED_FILE_NAME_PATTERNS, MANIFEST_FILE_NAME, DataCache, DataManifest, _is_yahoo_query
+from yfpy.exceptions import YahooFantasySportsDataCorrupted
+from yfpy.export import columns_to_arrow, to_columns
 from yfpy.logger import get_logger
 from yfpy.models import YahooFantasyObject
-from yfpy.query import YahooFantasySportsQuery  # noqa
-from yfpy.utils import jsonify_data, jsonify_data_to_file, unpack_data
+from yfpy.serialization import TYPE_TAG, from_tagged_data, is_tagged_data, serialize, to_tagged_data
+from yfpy.utils import (
+    atomic_write, compression_file_extensions, file_lock, import_optional_dependency, jsonify_data,
+    jsonify_data_to_file, open_text_file, unpack_data
+)
 
 logger = get_logger(__name__)
 
+STORAGE_FORMAT_FILE_EXTENSIONS: Dict[str, str] = {
+    "json": "json",
+    "parquet": "parquet",
+    "arrow": "arrow",
+}
+
+MODEL_CLASS_COLUMN: str = "__yfpy_model__"
+MODEL_DATA_COLUMN: str = "__yfpy_data__"
+
+LOCK_FILE_NAME: str = ".yfpy.lock"
+
+COMPRESSIONS: List[str] = list(compression_file_extensions.keys())
+
 
 class Data(object):
     """YFPY Data object for Yahoo Fantasy Sports data retrieval, saving, and loading data as JSON.
@@ -51,7 +115,11 @@ class Data(object):
 
     YFO = TypeVar("YFO", bound=YahooFantasyObject)
 
-    def __init__(self, data_dir: Union[Path, str], save_data: bool = False, dev_offline: bool = False):
+    def __init__(self, data_dir: Union[Path, str], save_data: bool = False, dev_offline: bool = False,
+                 storage_format: str = "json", lock_files: bool = False, use_manifest: bool = False,
+                 compression: Optional[str] = None, cache: bool = False, cache_ttl: Optional[float] = None,
+                 max_cache_bytes: Optional[int] = None, max_cache_age: Union[float, Dict[str, float], None] = None,
+                 game_status_check_interval: float = 3600.0, prune_interval: float = 300.0):
         """Instantiate data object to retrieve, save, and load Yahoo Fantasy Sports data.
 
         Args:
@@ -59,11 +127,66 @@ class Data(object):
             save_data (bool, optional): Boolean determining whether data is saved after retrieval from the Yahoo FF API.
             dev_offline (bool, optional): Boolean for offline development (requires a prior online run with
                 save_data = True).
+            storage_format (str, optional): Format in which collection-shaped data (lists of YFPY models) is saved:
+                "json" (default), "parquet" (Apache Parquet), or "arrow" (Arrow IPC, memory-mapped by `load_table`).
+                Columnar files store the exported model columns (see yfpy.export.to_columns) in addition to the
+                serialized model data needed to rebuild the models, so they are larger than the equivalent JSON. All
+                other data is always saved as JSON.
+            lock_files (bool, optional): Boolean to use advisory file locking of the data directory (defaults to
+                False), so multiple processes can safely save and load data in the same data directory. Data files are
+                always written atomically (to a temporary file that replaces the data file once complete).
+            use_manifest (bool, optional): Boolean to record the checksum of every saved data file in a manifest in the
+                data directory and verify the checksum when data is loaded (defaults to False).
+            compression (str, optional): Compression of saved data: None (uncompressed, default), "gzip", or "zstd"
+                (requires zstandard). JSON files are compressed while they are streamed to disk (and saved as
+                <file_name>.json.gz or <file_name>.json.zst), Parquet files use the compression as their internal
+                codec, and Arrow IPC files are always saved uncompressed so they can be memory-mapped. Compressed data
+                is detected automatically when loaded.
+            cache (bool, optional): Boolean to use saved data as a read-through cache in `retrieve` (defaults to False),
+                so saved data is loaded while it is fresh and otherwise retrieved from the Yahoo FF API and saved.
+            cache_ttl (float, optional): Number of seconds for which saved data is fresh (defaults to None, in which
+                case saved data is only fresh if it belongs to a completed Yahoo Fantasy game/season). Saved data of
+                completed seasons is always fresh.
+            max_cache_bytes (int, optional): Maximum total size in bytes of the saved data (defaults to None, meaning
+                unlimited). Whenever saved data exceeds it, the least recently used (saved or loaded) data is evicted
+                until the saved data fits. The size of the saved data is tracked as data is saved, and only measured
+                again (by scanning the data directory) when it exceeds the maximum or every prune_interval seconds.
+            max_cache_age (float | dict[str, float], optional): Maximum age in seconds of saved data before it is
+                evicted when data is saved (defaults to None, meaning unlimited), or a dictionary with file name
+                patterns (fnmatch-style, such as "*/get_league_players/*") as keys and maximum ages as values, in which
+                the first pattern matching a file name applies (and data matching no pattern is never evicted by age).
+                Expired data is evicted at most every prune_interval seconds.
+            game_status_check_interval (float, optional): Number of seconds for which a Yahoo Fantasy game (season) that
+                is not over yet is not checked again when deciding whether saved data is fresh (defaults to 3600.0).
+            prune_interval (float, optional): Minimum number of seconds between the scans of all saved data when data
+                is saved with max_cache_bytes or max_cache_age set (defaults to 300.0).
 
         """
+        if storage_format not in STORAGE_FORMAT_FILE_EXTENSIONS:
+            raise ValueError(
+                f"Unsupported storage format \"{storage_format}\". Supported storage formats: "
+                f"{list(STORAGE_FORMAT_FILE_EXTENSIONS.keys())}"
+            )
+
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported compression \"{compression}\". Supported compressions: {COMPRESSIONS}")
+
         self.data_dir: Path = data_dir if isinstance(data_dir, PosixPath) else Path(data_dir)
         self.save_data: bool = save_data
         self.dev_offline: bool = dev_offline
+        self.storage_format: str = storage_format
+        self.compression: Optional[str] = compression
+        self.cache: bool = cache
+        self.cache_ttl: Optional[float] = cache_ttl
+        self.game_status_check_interval: float = game_status_check_interval
+        self.max_cache_bytes: Optional[int] = max_cache_bytes
+        self.max_cache_age: Union[float, Dict[str, float], None] = max_cache_age
+        self.prune_interval: float = prune_interval
+        self.cache_excluded_file_name_patterns: List[str] = list(CACHE_EXCLUDED_FILE_NAME_PATTERNS)
+        self.lock_files: bool = lock_files
+        self.use_manifest: bool = use_manifest
+        self._data_cache: DataCache = DataCache(self)
+        self._manifest: DataManifest = DataManifest(self)
 
     def update_data_dir(self, new_save_dir: Union[Path, str]) -> None:
         """Modify the data storage directory if it needs to be updated.
@@ -77,6 +200,389 @@ class Data(object):
         """
         self.data_dir: Path = new_save_dir if isinstance(new_save_dir, PosixPath) else Path(new_save_dir)
 
+    @property
+    def manifest_file_path(self) -> Path:
+        """Path of the checksummed manifest in the current data directory.
+
+        Returns:
+            Path: Manifest file path.
+
+        """
+        return self._manifest.file_path
+
+    def get_cache_key(self, yf_query: Callable, params: Union[Dict[str, Any], None] = None) -> str:
+        """Derive a deterministic file name (cache key) for the data retrieved by a yfpy query.
+
+        The cache key is laid out as "<game>/<league_key>/<query method>/<params>", where game is the game key of the
+        league of the query object (which is retrieved if the query object has neither a league key nor a game ID), so
+        all saved data of a game, league, or query method can be listed (and pruned) by directory. Parameters are bound
+        to the signature of the query method, so omitted default parameters and positional or keyword parameters result
+        in the same key. Queries of relative data (such as the current week) have no cache key, since the data they
+        retrieve changes over time.
+
+        Args:
+            yf_query (Callable of YahooFantasySportsQuery): Chosen yfpy query method.
+            params (dict[str, Any], optional): Dictionary of parameters to be passed to chosen yfpy query function.
+
+        Examples:
+            >>> data.get_cache_key(yahoo_query.get_team_roster_by_week, {"team_id": 3, "chosen_week": 1})
+            "331/331.l.729259/get_team_roster_by_week/team_id=3,chosen_week=1"
+
+        Raises:
+            ValueError: If the query is not a named function/method or is a query of relative data.
+
+        Returns:
+            str: Cache key that can be used as the file name of the retrieved data.
+
+        """
+        return self._data_cache.get_cache_key(yf_query, params)
+
+    def _resolve_file_name(self, file_name: Optional[str], yf_query: Optional[Callable],
+                           params: Union[Dict[str, Any], None]) -> str:
+        """Get the given file name, or derive it from the yfpy query and its parameters if no file name is given.
+
+        Args:
+            file_name (str, optional): Name of file to/from which data will be saved/loaded.
+            yf_query (Callable of YahooFantasySportsQuery, optional): Chosen yfpy query method.
+            params (dict[str, Any], optional): Dictionary of parameters to be passed to chosen yfpy query function.
+
+        Returns:
+            str: The file name.
+
+        """
+        if file_name:
+            return file_name
+        if yf_query is None:
+            raise ValueError("Either a file name or a yfpy query (from which to derive the file name) is required.")
+        return self.get_cache_key(yf_query, params)
+
+    def _lock_data_dir(self, shared: bool = False) -> ContextManager:
+        """Acquire an advisory lock on the data directory if file locking is enabled.
+
+        Args:
+            shared (bool, optional): Boolean to acquire a shared (read) lock instead of an exclusive (write) lock.
+
+        Returns:
+            ContextManager: Context manager holding the lock (or doing nothing if file locking is disabled).
+
+        """
+        if self.lock_files:
+            return file_lock(self.data_dir / LOCK_FILE_NAME, shared)
+        return nullcontext()
+
+    def verify_manifest(self) -> List[str]:
+        """Verify the checksums of all data files recorded in the manifest of the data directory.
+
+        Returns:
+            list[str]: Paths (relative to the data directory) of all recorded data files that are missing or do not
+                match their recorded checksum.
+
+        """
+        return self._manifest.verify()
+
+    def _get_data_file_path(self, file_name: str, storage_format: str, compression: Optional[str] = None) -> Path:
+        """Build the path of a data file for a file name, storage format, and compression.
+
+        Args:
+            file_name (str): Name of the data file (without file extensions).
+            storage_format (str): Storage format of the data file.
+            compression (str, optional): Compression of the data file (only applies to the file name of JSON files).
+
+        Returns:
+            Path: Data file path.
+
+        """
+        data_file_extension = STORAGE_FORMAT_FILE_EXTENSIONS[storage_format]
+        if storage_format == "json" and compression:
+            data_file_extension += f".{compression_file_extensions[compression]}"
+        return self.data_dir / f"{file_name}.{data_file_extension}"
+
+    def _get_json_data_file_paths(self, file_name: str) -> List[Path]:
+        """Build the paths of all possible JSON data files for a file name, starting with the configured compression.
+
+        Args:
+            file_name (str): Name of the data file (without file extensions).
+
+        Returns:
+            list[Path]: JSON data file paths.
+
+        """
+        compressions = [self.compression] + [None, *COMPRESSIONS]
+        return [
+            self._get_data_file_path(file_name, "json", compression) for compression in dict.fromkeys(compressions)
+        ]
+
+    def _get_all_data_file_paths(self, file_name: str) -> List[Path]:
+        """Build the paths of all possible data files for a file name in any storage format and with any compression.
+
+        Args:
+            file_name (str): Name of the data file (without file extensions).
+
+        Returns:
+            list[Path]: Data file paths.
+
+        """
+        return [
+            *self._get_json_data_file_paths(file_name),
+            *(self._get_data_file_path(file_name, storage_format) for storage_format in ["parquet", "arrow"])
+        ]
+
+    @staticmethod
+    def _get_compression(data_file_path: Path) -> Optional[str]:
+        """Detect the compression of a data file from its file extension.
+
+        Args:
+            data_file_path (Path): Data file path.
+
+        Returns:
+            str | None: Compression of the data file, or None if the data file is not compressed.
+
+        """
+        for compression, compression_file_extension in compression_file_extensions.items():
+            if data_file_path.name.endswith(f".{compression_file_extension}"):
+                return compression
+        return None
+
+    def _get_saved_data_file_path(self, file_name: str) -> Path:
+        """Find the path of the saved data file for a file name, checking for data saved in the configured storage
+        format first and falling back to JSON (compressed with the configured compression first, and then
+        uncompressed or with any other supported compression).
+
+        Args:
+            file_name (str): Name of file from which data will be loaded.
+
+        Returns:
+            Path: Path of the saved data file (or the JSON file path if no saved data file exists).
+
+        """
+        candidate_file_paths = self._get_json_data_file_paths(file_name)
+        if self.storage_format != "json":
+            candidate_file_paths.insert(0, self._get_data_file_path(file_name, self.storage_format))
+
+        for candidate_file_path in candidate_file_paths:
+            if candidate_file_path.exists():
+                return candidate_file_path
+        return candidate_file_paths[0]
+
+    @staticmethod
+    def _write_columnar_data_file(data_file_path: Path, data: List[YahooFantasyObject], storage_format: str,
+                                  compression: Optional[str] = None) -> None:
+        """Save a list of YFPY models to a columnar data file.
+
+        The exported model attributes (see yfpy.export.to_columns) are stored as individual columns, alongside the
+        model class and the serialized model data of every row so the models can be rebuilt when loaded.
+
+        Args:
+            data_file_path (Path): Path of the columnar data file.
+            data (list[YahooFantasyObject]): List of YFPY models to be saved.
+            storage_format (str): Columnar storage format ("parquet" or "arrow").
+            compression (str, optional): Compression codec of Parquet files (defaults to the pyarrow default codec).
+
+        Returns:
+            None
+
+        """
+        columns = {
+            MODEL_CLASS_COLUMN: [snakecase(el.__class__.__name__) for el in data],
+            MODEL_DATA_COLUMN: [serialize(el) for el in data],
+            **to_columns(data)
+        }
+        table = columns_to_arrow(columns)
+
+        if storage_format == "parquet":
+            import_optional_dependency("pyarrow.parquet", "pyarrow").write_table(
+                table, data_file_path, **({"compression": compression} if compression else {})
+            )
+        else:
+            # Arrow IPC files are written uncompressed so they can be memory-mapped when loaded
+            import_optional_dependency("pyarrow.feather", "pyarrow").write_feather(
+                table, data_file_path, compression="uncompressed"
+            )
+
+    @staticmethod
+    def _read_columnar_data_file(data_file_path: Path, columns: Union[List[str], None] = None) -> Any:
+        """Read a columnar data file (Parquet or Arrow IPC depending on the file extension) into a pyarrow Table.
+
+        Args:
+            data_file_path (Path): Path of the columnar data file.
+            columns (list[str], optional): Names of the columns to be read (defaults to all columns).
+
+        Returns:
+            pyarrow.Table: Arrow Table containing the selected columns.
+
+        """
+        if data_file_path.suffix == ".parquet":
+            return import_optional_dependency("pyarrow.parquet", "pyarrow").read_table(
+                data_file_path, columns=columns, memory_map=True
+            )
+        else:
+            return import_optional_dependency("pyarrow.feather", "pyarrow").read_table(
+                data_file_path, columns=columns, memory_map=True
+            )
+
+    def _write_data(self, file_name: str, data: Any, yf_query: Callable,
+                    params: Union[Dict[str, Any], None] = None) -> str:
+        """Write retrieved data to local storage.
+
+        Args:
+            file_name (str): Name of file to which data will be saved (can include subdirectories relative to the data
+                directory, which are created if needed).
+            data (Any): Data retrieved by the yfpy query.
+            yf_query (Callable of YahooFantasySportsQuery): The yfpy query method that retrieved the data.
+            params (dict[str, str], optional): Dictionary of parameters passed to the yfpy query function.
+
+        Returns:
+            str: Location to which the data was saved.
+
+        """
+        if (self.storage_format != "json" and isinstance(data, list)
+                and all(isinstance(el, YahooFantasyObject) for el in data)):
+            storage_format = self.storage_format
+        else:
+            storage_format = "json"
+        saved_data_file_path = self._get_data_file_path(file_name, storage_format, self.compression)
+
+        with ExitStack() as data_dir_lock:
+            # write the data to a temporary file that only replaces the saved data file once it is complete, so that
+            # crashes or concurrent writers never leave behind a truncated data file
+            with atomic_write(saved_data_file_path) as temporary_file_path:
+                if storage_format == "json":
+                    with open_text_file(temporary_file_path, "w", self.compression) as data_file:
+                        # save the data with type tags so YFPY models can be rebuilt directly when loaded
+                        jsonify_data_to_file(to_tagged_data(data), data_file)
+                else:
+                    self._write_columnar_data_file(temporary_file_path, data, storage_format, self.compression)
+
+                # only hold the data directory lock while replacing the data file and updating the manifest
+                data_dir_lock.enter_context(self._lock_data_dir())
+
+            # remove data files previously saved for the same file name in a different storage format or with a
+            # different compression so they cannot be loaded instead of the newly saved data
+            removed_file_paths = []
+            for data_file_path in self._get_all_data_file_paths(file_name):
+                if data_file_path != saved_data_file_path and data_file_path.exists():
+                    data_file_path.unlink()
+                    removed_file_paths.append(data_file_path)
+
+            if self.use_manifest:
+                self._manifest.update(saved_data_file_path, removed_file_paths)
+
+        return str(saved_data_file_path)
+
+    def _read_data(self, file_name: str) -> Tuple[Any, str]:
+        """Read saved data from local storage as tagged data (see yfpy.serialization.to_tagged_data), or as untagged
+        data for data saved by previous versions of YFPY.
+
+        Args:
+            file_name (str): Name of file from which data will be loaded.
+
+        Returns:
+            tuple[Any, str]: The saved data and the location from which it was read.
+
+        """
+        with self._lock_data_dir(shared=True):
+            saved_data_file_path = self._get_saved_data_file_path(file_name)
+            if not saved_data_file_path.exists():
+                raise FileNotFoundError(f"File {saved_data_file_path} does not exist. Cannot load data locally without "
+                                        f"having previously saved data.")
+
+            if self.use_manifest:
+                self._manifest.verify_checksum(saved_data_file_path)
+
+            if saved_data_file_path.suffix not in [".parquet", ".arrow"]:
+                compression = self._get_compression(saved_data_file_path)
+                with open_text_file(saved_data_file_path, "r", compression) as data_file:
+                    loaded_data = json.load(data_file)
+            else:
+                table = self._read_columnar_data_file(saved_data_file_path, [MODEL_CLASS_COLUMN, MODEL_DATA_COLUMN])
+                loaded_data = self._get_saved_models_data(
+                    table.column(MODEL_CLASS_COLUMN).to_pylist(), table.column(MODEL_DATA_COLUMN).to_pylist()
+                )
+
+            # record the access time (keeping the modification time as the save time) for least recently used eviction
+            try:
+                os.utime(saved_data_file_path, (time.time(), saved_data_file_path.stat().st_mtime))
+            except OSError:
+                logger.debug(f"Unable to record the access time of {saved_data_file_path}.")
+
+        return loaded_data, str(saved_data_file_path)
+
+    @staticmethod
+    def _get_saved_model_data(model_class: str, model_data: str) -> Dict[str, Any]:
+        """Decode a single saved YFPY model from a row of collection-shaped data.
+
+        Args:
+            model_class (str): Snake case model class name saved with the model.
+            model_data (str): Serialized model data.
+
+        Returns:
+            dict[str, Any]: The tagged model data, or a single-key dictionary with the snake case model class name as
+                key and the untagged model data as value for data saved by previous versions of YFPY.
+
+        """
+        return Data._tag_saved_model_data(model_class, json.loads(model_data))
+
+    @staticmethod
+    def _get_saved_models_data(model_classes: List[str], models_data: List[str]) -> List[Dict[str, Any]]:
+        """Decode all saved YFPY models of collection-shaped data with a single JSON decoding pass.
+
+        Args:
+            model_classes (list[str]): Snake case model class names saved with the models.
+            models_data (list[str]): Serialized model data of every model.
+
+        Returns:
+            list[dict[str, Any]]: The saved model data of every model (see `_get_saved_model_data`).
+
+        """
+        # the serialized models are compact JSON documents, so joining them decodes all of them at once
+        decoded_models_data = json.loads(f"[{','.join(models_data)}]")
+        return [
+            Data._tag_saved_model_data(model_class, decoded_model_data)
+            for model_class, decoded_model_data in zip(model_classes, decoded_models_data)
+        ]
+
+    @staticmethod
+    def _tag_saved_model_data(model_class: str, decoded_model_data: Any) -> Dict[str, Any]:
+        if isinstance(decoded_model_data, dict) and TYPE_TAG in decoded_model_data:
+            return decoded_model_data
+        return {model_class: decoded_model_data}
+
+    @staticmethod
+    def _unpack_loaded_data(loaded_data: Any,
+                            data_type_class: Type[YahooFantasyObject] = None) -> Union[YFO, List[YFO], Dict[str, YFO]]:
+        """Rebuild YFPY models from saved data.
+
+        Args:
+            loaded_data (Any): Saved data read from local storage (see `_read_data`).
+            data_type_class (Type[YahooFantasyObject], optional): YFPY models.py class for data casting.
+
+        Returns:
+            object: Data with YFPY models rebuilt.
+
+        """
+        if isinstance(loaded_data, list) and not loaded_data:
+            # saved empty collections are loaded as empty lists
+            return []
+
+        if is_tagged_data(loaded_data):
+            # rebuild YFPY models directly from their type tags in a single pass
+            data = from_tagged_data(loaded_data)
+            if data_type_class and not isinstance(data, (data_type_class, list)):
+                data = data_type_class(data)
+            return data
+
+        # fall back to parsing untagged data saved by previous versions of YFPY
+        unpacked = unpack_data(loaded_data, YahooFantasyObject)
+        data = data_type_class(unpacked) if data_type_class else unpacked
+
+        if isinstance(data, list) and data:
+            # flatten list of single-key dictionaries with object values to list of object values if top level of
+            # loaded data is a list
+            data_element_key = list(data[0].keys())[0]
+            data = [el[data_element_key] for el in data]
+
+        return data
+
     @staticmethod
     def fetch(yf_query: Callable,
               params: Union[Dict[str, str], None] = None) -> Union[str, YFO, List[YFO], Dict[str, YFO]]:
@@ -95,12 +601,15 @@ class Data(object):
         else:
             return yf_query()
 
-    def save(self, file_name: str, yf_query: Callable, params: Union[Dict[str, Any], None] = None,
+    def save(self, file_name: Optional[str] = None, yf_query: Callable = None,
+             params: Union[Dict[str, Any], None] = None,
              new_data_dir: Union[Path, str, None] = None) -> Union[str, YFO, List[YFO], Dict[str, YFO]]:
         """Retrieve and save Yahoo Fantasy Sports data locally.
 
         Args:
-            file_name (str): Name of file to which data will be saved.
+            file_name (str, optional): Name of file to which data will be saved (can include subdirectories relative to
+                the data directory, such as "2021/331.l.729259/standings"). Derived from the query and its parameters
+                when omitted (see `get_cache_key`).
             yf_query (Callable of YahooFantasySportsQuery): Chosen yfpy query method to run.
             params (dict[str, str], optional): Dictionary of parameters to be passed to chosen yfpy query function.
             new_data_dir (str | Path, optional): Full path to new desired directory to which data will be saved.
@@ -109,6 +618,10 @@ class Data(object):
             object: Data retrieved by the yfpy query.
 
         """
+        if yf_query is None:
+            raise ValueError("A yfpy query is required to retrieve data.")
+        file_name = self._resolve_file_name(file_name, yf_query, params)
+
         # change data save directory
         if new_data_dir:
             new_data_dir = new_data_dir if isinstance(new_data_dir, PosixPath) else Path(new_data_dir)
@@ -119,96 +632,160 @@ class Data(object):
         if not self.data_dir.exists():
             self.data_dir.mkdir(parents=True, exist_ok=True)
 
-        # check if parent YahooFantasySportsQuery.all_output_as_json_str = True, unset it for data saving, then reset it
-        all_output_as_json = False
-        # noinspection PyUnresolvedReferences
-        if yf_query.__self__.all_output_as_json_str:
-            if inspect.ismethod(yf_query):
-                # noinspection PyUnresolvedReferences
-                for cls in inspect.getmro(yf_query.__self__.__class__):
-                    if yf_query.__name__ in cls.__dict__:
-                        # noinspection PyUnresolvedReferences
-                        yf_query.__self__.all_output_as_json_str = False
-                        all_output_as_json = True
+        # check if parent YahooFantasySportsQuery.all_output_as_json_str = True, and if so suppress it for data saving
+        # (only for the current thread, so the shared query instance is not modified for any other threads)
+        yf_query_instance = getattr(yf_query, "__self__", None)
+        all_output_as_json = (
+            _is_yahoo_query(yf_query_instance) and yf_query_instance.all_output_as_json_str
+        )
 
         # run the actual yfpy query and retrieve the query results
-        data = self.fetch(yf_query, params)
-
-        # save the retrieved data locally
-        saved_data_file_path = self.data_dir / f"{file_name}.json"
-        with open(saved_data_file_path, "w", encoding="utf-8") as data_file:
-            if isinstance(data, list):
-                # unflatten list of object values to list of single-key dictionaries with object values if top level of
-                # data to be saved is a list
-                unnested_data = [{snakecase(el.__class__.__name__): el} for el in data]
-            else:
-                unnested_data = data
+        if all_output_as_json:
+            with yf_query_instance.suppress_json_str_output():
+                data = self.fetch(yf_query, params)
+        else:
+            data = self.fetch(yf_query, params)
 
-            jsonify_data_to_file(unnested_data, data_file)
-        logger.debug(f"Data saved locally to: {saved_data_file_path}")
+        # save the retrieved data locally (and evict saved data if it exceeds the maximum size or age)
+        with self._data_cache.track_saved_data(file_name):
+            saved_data_location = self._write_data(file_name, data, yf_query, params)
+        logger.debug(f"Data saved locally to: {saved_data_location}")
 
-        # reset parent YahooFantasySportsQuery all_output_as_json_str = True and re-run query for json string return
+        # convert data to a JSON string if parent YahooFantasySportsQuery.all_output_as_json_str = True
         if all_output_as_json:
-            # noinspection PyUnresolvedReferences
-            yf_query.__self__.all_output_as_json_str = True
-            # data = self.get(yf_query, params)
             data = jsonify_data(data)
 
         return data
 
-    def load(self, file_name: str, data_type_class: Type[YahooFantasyObject] = None,
-             new_data_dir: Union[Path, str, None] = None,
-             all_output_as_json_str: bool = False) -> Union[str, YFO, List[YFO], Dict[str, YFO]]:
+    def load(self, file_name: Optional[str] = None, data_type_class: Type[YahooFantasyObject] = None,
+             new_data_dir: Union[Path, str, None] = None, all_output_as_json_str: bool = False,
+             yf_query: Callable = None,
+             params: Union[Dict[str, Any], None] = None) -> Union[str, YFO, List[YFO], Dict[str, YFO]]:
         """Load Yahoo Fantasy Sports data already stored locally.
 
         Note:
             This method will fail if the `save` method has not been called previously.
 
         Args:
-            file_name (str): Name of file from which data will be loaded.
+            file_name (str, optional): Name of file from which data will be loaded (derived from yf_query and params
+                when omitted).
             data_type_class (Type[YahooFantasyObject], optional): YFPY models.py class for data casting.
             new_data_dir (str | Path, optional): Full path to new desired directory from which data will be loaded.
             all_output_as_json_str (bool): Boolean indicating if the output has been requested as a raw JSON string.
+            yf_query (Callable of YahooFantasySportsQuery, optional): yfpy query method that retrieved the data (only
+                used to derive the file name when no file name is given).
+            params (dict[str, Any], optional): Dictionary of parameters passed to the yfpy query function (only used to
+                derive the file name when no file name is given).
 
         Returns:
             object: Data loaded from the selected JSON file.
 
         """
+        file_name = self._resolve_file_name(file_name, yf_query, params)
+
         # change data load directory
         if new_data_dir:
             new_data_dir = new_data_dir if isinstance(new_data_dir, PosixPath) else Path(new_data_dir)
             self.update_data_dir(new_data_dir)
 
-        # load selected data file
-        saved_data_file_path = self.data_dir / f"{file_name}.json"
-        if saved_data_file_path.exists():
-            with open(saved_data_file_path, "r", encoding="utf-8") as data_file:
-                unpacked = unpack_data(json.load(data_file), YahooFantasyObject)
-                data = data_type_class(unpacked) if data_type_class else unpacked
-
-                if isinstance(data, list):
-                    # flatten list of single-key dictionaries with object values to list of object values if top level
-                    # of loaded data is a list
-                    data_element_key = list(data[0].keys())[0]
-                    data = [el[data_element_key] for el in data]
-
-            logger.debug(f"Data loaded locally from: {saved_data_file_path}")
-        else:
-            raise FileNotFoundError(f"File {saved_data_file_path} does not exist. Cannot load data locally without "
-                                    f"having previously saved data.")
+        # load selected data
+        loaded_data, saved_data_location = self._read_data(file_name)
+        data = self._unpack_loaded_data(loaded_data, data_type_class)
+        logger.debug(f"Data loaded locally from: {saved_data_location}")
 
         if all_output_as_json_str:
             return jsonify_data(data)
         else:
             return data
 
-    def retrieve(self, file_name: str, yf_query: Callable, params: Union[Dict[str, str], None] = None,
-                 data_type_class: Type[YahooFantasyObject] = None,
+    def load_table(self, file_name: Optional[str] = None, columns: Union[List[str], None] = None,
+                   new_data_dir: Union[Path, str, None] = None, yf_query: Callable = None,
+                   params: Union[Dict[str, Any], None] = None) -> Any:
+        """Load collection-shaped Yahoo Fantasy Sports data saved in a columnar storage format as a pyarrow Table
+        without rebuilding any YFPY models (requires pyarrow).
+
+        Note:
+            This method will fail if the `save` method has not been called previously with a Data object using the
+            "parquet" or "arrow" storage format.
+
+        Args:
+            file_name (str, optional): Name of file from which data will be loaded (derived from yf_query and params
+                when omitted).
+            columns (list[str], optional): Names of the columns to be loaded (defaults to all columns). Only the
+                selected columns are read from disk.
+            new_data_dir (str | Path, optional): Full path to new desired directory from which data will be loaded.
+            yf_query (Callable of YahooFantasySportsQuery, optional): yfpy query method that retrieved the data (only
+                used to derive the file name when no file name is given).
+            params (dict[str, Any], optional): Dictionary of parameters passed to the yfpy query function (only used to
+                derive the file name when no file name is given).
+
+        Returns:
+            pyarrow.Table: Arrow Table with one row per saved YFPY model (see yfpy.export.to_columns for the columns).
+
+        """
+        # change data load directory
+        if new_data_dir:
+            new_data_dir = new_data_dir if isinstance(new_data_dir, PosixPath) else Path(new_data_dir)
+            self.update_data_dir(new_data_dir)
+
+        file_name = self._resolve_file_name(file_name, yf_query, params)
+        saved_data_file_path = self._get_data_file_path(file_name, self.storage_format)
+        if self.storage_format == "json" or not saved_data_file_path.exists():
+            raise FileNotFoundError(f"File {saved_data_file_path} does not exist. Cannot load columnar data without "
+                                    f"having previously saved collection-shaped data in a columnar storage format.")
+
+        with self._lock_data_dir(shared=True):
+            if self.use_manifest:
+                self._manifest.verify_checksum(saved_data_file_path)
+            table = self._read_columnar_data_file(saved_data_file_path, columns)
+        logger.debug(f"Data table loaded locally from: {saved_data_file_path}")
+        return table
+
+    def _get_saved_data_time(self, file_name: str) -> Optional[float]:
+        """Get the time at which data was saved.
+
+        Args:
+            file_name (str): Name of file to which data was saved.
+
+        Returns:
+            float | None: Timestamp (seconds since the epoch) at which the data was saved, or None if no data was saved.
+
+        """
+        saved_data_file_path = self._get_saved_data_file_path(file_name)
+        if saved_data_file_path.exists():
+            return saved_data_file_path.stat().st_mtime
+        return None
+
+    def is_fresh(self, file_name: Optional[str], yf_query: Callable,
+                 params: Union[Dict[str, Any], None] = None) -> bool:
+        """Check if saved data is fresh, meaning it was saved less than cache_ttl seconds ago or it belongs to a
+        completed Yahoo Fantasy game (season).
+
+        Args:
+            file_name (str, optional): Name of file to which data was saved (derived from yf_query and params when
+                omitted).
+            yf_query (Callable of YahooFantasySportsQuery): Chosen yfpy query method that retrieves the data.
+            params (dict[str, Any], optional): Dictionary of parameters passed to the yfpy query function.
+
+        Returns:
+            bool: True if the saved data exists and is fresh, else False.
+
+        """
+        file_name = self._resolve_file_name(file_name, yf_query, params)
+        return self._data_cache.is_fresh(file_name, yf_query)
+
+    def retrieve(self, file_name: Optional[str] = None, yf_query: Callable = None,
+                 params: Union[Dict[str, str], None] = None, data_type_class: Type[YahooFantasyObject] = None,
                  new_data_dir: Union[Path, str, None] = None) -> Union[str, YFO, List[YFO], Dict[str, YFO]]:
         """Fetch data from the web or load it locally (combination of the save and load methods).
 
+        When caching is enabled (cache = True), saved data is loaded while it is fresh (see `is_fresh`), and otherwise
+        the data is retrieved from the Yahoo Fantasy Sports REST API and saved. When the file name is omitted, queries
+        of relative data (such as the current week) are always retrieved without saving them (see `get_cache_key`).
+
         Args:
-            file_name (str): Name of file to/from which data will be saved/loaded.
+            file_name (str, optional): Name of file to/from which data will be saved/loaded. Derived from the query and
+                its parameters when omitted (see `get_cache_key`).
             yf_query (Callable of YahooFantasySportsQuery): Chosen yfpy query method to run.
             params (dict[str, str], optional): Dictionary of parameters to be passed to chosen yfpy query function.
             data_type_class (Type[YahooFantasyObject], optional): YFPY models.py class for data casting.
@@ -219,10 +796,626 @@ class Data(object):
             object: Data retrieved by the yfpy query OR loaded from the selected JSON file.
 
         """
+        if yf_query is None:
+            raise ValueError("A yfpy query is required to retrieve data.")
+        if not file_name and not self.dev_offline and self._data_cache.get_relative_params(yf_query, params):
+            # relative data (such as the current week) changes over time, so it is never cached under a derived key
+            logger.debug(f"Fetching {getattr(yf_query, '__name__', yf_query)} without caching, since it is relative.")
+            return self.fetch(yf_query, params)
+        file_name = self._resolve_file_name(file_name, yf_query, params)
+
         if self.dev_offline:
             return self.load(file_name, data_type_class, new_data_dir)
+        elif self.cache:
+            # change data directory before checking the freshness of the saved data
+            if new_data_dir:
+                self.update_data_dir(new_data_dir if isinstance(new_data_dir, PosixPath) else Path(new_data_dir))
+
+            if self.is_fresh(file_name, yf_query):
+                yf_query_instance = getattr(yf_query, "__self__", None)
+                all_output_as_json = (
+                    _is_yahoo_query(yf_query_instance) and yf_query_instance._output_as_json_str()
+                )
+                try:
+                    return self.load(file_name, data_type_class, all_output_as_json_str=all_output_as_json)
+                except YahooFantasySportsDataCorrupted as e:
+                    logger.warning(f"{e} Retrieving data again.")
+            return self.save(file_name, yf_query, params)
         else:
             if self.save_data:
                 return self.save(file_name, yf_query, params, new_data_dir)
             else:
                 return self.fetch(yf_query, params)
+
+    def memoize(self, yf_query: Callable, data_type_class: Type[YahooFantasyObject] = None) -> Callable:
+        """Wrap a yfpy query method so that every call is retrieved (see `retrieve`) under a file name derived from
+        the query and the call parameters (see `get_cache_key`).
+
+        Args:
+            yf_query (Callable of YahooFantasySportsQuery): Chosen yfpy query method to wrap.
+            data_type_class (Type[YahooFantasyObject], optional): YFPY models.py class for data casting.
+
+        Examples:
+            >>> data = Data(data_dir, cache=True)
+            >>> get_roster = data.memoize(yahoo_query.get_team_roster_by_week)
+            >>> get_roster(3, chosen_week=1)
+            Roster({...})
+
+        Returns:
+            Callable: Function accepting the same parameters as the yfpy query method.
+
+        """
+        @functools.wraps(yf_query)
+        def memoized_query(*args, **kwargs):
+            params = inspect.signature(yf_query).bind(*args, **kwargs).arguments
+            return self.retrieve(yf_query=yf_query, params=dict(params), data_type_class=data_type_class)
+
+        return memoized_query
+
+    def _get_file_name(self, data_file_path: Path) -> Optional[str]:
+        """Get the file name under which data was saved from the path of a saved data file.
+
+        Args:
+            data_file_path (Path): Path of the saved data file.
+
+        Returns:
+            str | None: File name (relative to the data directory and without file extensions), or None if the path is
+                not a saved data file.
+
+        """
+        relative_file_path = data_file_path.relative_to(self.data_dir).as_posix()
+        data_file_extensions = [
+            *(f".{file_extension}" for file_extension in STORAGE_FORMAT_FILE_EXTENSIONS.values()),
+            *(f".json.{file_extension}" for file_extension in compression_file_extensions.values())
+        ]
+        for data_file_extension in data_file_extensions:
+            if relative_file_path.endswith(data_file_extension):
+                return relative_file_path[:-len(data_file_extension)]
+        return None
+
+    def _get_saved_size(self, file_name: str) -> int:
+        """Get the size of the data saved under a file name without scanning any other saved data.
+
+        Args:
+            file_name (str): Name of file to which data was saved.
+
+        Returns:
+            int: Size in bytes of the saved data files (0 if no data was saved).
+
+        """
+        saved_size = 0
+        for data_file_path in self._get_all_data_file_paths(file_name):
+            try:
+                saved_size += data_file_path.stat().st_size
+            except FileNotFoundError:
+                continue
+        return saved_size
+
+    def _get_cache_entries(self) -> List[Dict[str, Any]]:
+        """Get the size, save time, and last access time of all saved data.
+
+        Returns:
+            list[dict[str, Any]]: List of dictionaries with the file name ("file_name"), size in bytes ("size"), save
+                time ("saved_at"), and last access time ("accessed_at") of each saved data file.
+
+        """
+        if not self.data_dir.is_dir():
+            return []
+
+        cache_entries = []
+        for data_file_path in self.data_dir.rglob("*"):
+            # skip the manifest, lock file, and temporary files of data files that are being written
+            if data_file_path.name.startswith(".") or data_file_path.name == MANIFEST_FILE_NAME:
+                continue
+            file_name = self._get_file_name(data_file_path)
+            if file_name is None or self._data_cache.is_excluded(file_name) or not data_file_path.is_file():
+                continue
+            data_file_stat = data_file_path.stat()
+            cache_entries.append({
+                "file_name": file_name,
+                "size": data_file_stat.st_size,
+                "saved_at": data_file_stat.st_mtime,
+                "accessed_at": max(data_file_stat.st_atime, data_file_stat.st_mtime),
+            })
+        return cache_entries
+
+    def _delete_cache_entries(self, file_names: List[str]) -> None:
+        """Delete saved data (must be called while holding the exclusive data directory lock if file locking is
+        enabled).
+
+        Args:
+            file_names (list[str]): Names of the files to delete.
+
+        Returns:
+            None
+
+        """
+        deleted_file_paths = []
+        for file_name in file_names:
+            for data_file_path in self._get_all_data_file_paths(file_name):
+                if data_file_path.exists():
+                    data_file_path.unlink()
+                    deleted_file_paths.append(data_file_path)
+
+            # remove directories left empty by the deleted data files
+            data_file_dir = self._get_data_file_path(file_name, "json").parent
+            while data_file_dir != self.data_dir and data_file_dir.is_dir() and not any(data_file_dir.iterdir()):
+                data_file_dir.rmdir()
+                data_file_dir = data_file_dir.parent
+
+        if self.use_manifest and deleted_file_paths and self.manifest_file_path.is_file():
+            self._manifest.update(removed_file_paths=deleted_file_paths)
+
+    def get_cache_usage(self, depth: int = 2) -> Dict[str, Dict[str, Any]]:
+        """Inspect the usage of the saved data grouped by the leading components of the file names, which (for file
+        names derived with `get_cache_key`) are the season (game) and league of the saved data.
+
+        Args:
+            depth (int, optional): Number of leading file name components by which to group the saved data (defaults
+                to 2, meaning by game and league key for derived file names, while 1 groups by game only).
+
+        Examples:
+            >>> data.get_cache_usage()
+            {"331/331.l.729259": {"files": 42, "size": 1843211, "saved_at": 1700000000.0, "accessed_at": ...}, ...}
+
+        Returns:
+            dict[str, dict[str, Any]]: Dictionary with file name prefixes as keys and dictionaries with the number of
+                saved files ("files"), their total size in bytes ("size"), and the most recent save ("saved_at") and
+                access ("accessed_at") times as values.
+
+        """
+        return self._data_cache.get_usage(depth)
+
+    def prune(self, max_bytes: Optional[int] = None, max_age: Union[float, Dict[str, float], None] = None,
+              file_name_prefix: str = "") -> List[str]:
+        """Evict saved data that is older than the maximum age, and then evict the least recently used (saved or
+        loaded) data until the saved data fits within the maximum size.
+
+        Args:
+            max_bytes (int, optional): Maximum total size in bytes of the saved data (defaults to max_cache_bytes).
+            max_age (float | dict[str, float], optional): Maximum age in seconds of saved data, or a dictionary with
+                file name patterns as keys and maximum ages as values (defaults to max_cache_age).
+            file_name_prefix (str, optional): Only prune saved data with file names starting with this prefix, such as
+                "331/331.l.729259/" for all data of a league (defaults to all saved data).
+
+        Examples:
+            >>> data.prune(max_age=0, file_name_prefix="331/")
+            ["331/331.l.729259/get_league_metadata", ...]
+
+        Returns:
+            list[str]: File names of the evicted data.
+
+        """
+        return self._data_cache.prune(max_bytes, max_age, file_name_prefix)
+
+
+class SQLiteData(Data):
+    """YFPY Data object for Yahoo Fantasy Sports data retrieval, saving, and loading data in an indexed SQLite database.
+
+    Every saved query result is stored under its file name as one row per YFPY model (or a single row for results that
+    are not lists of models), and saving a file name again replaces (upserts) its rows. Each row is indexed by league
+    key, season, week, date, team key, and player key, so slices of the saved data (such as all rosters of a team in a
+    season) can be retrieved with `find` without loading any other saved data.
+
+    The row keys are taken from the query parameters (chosen_week, chosen_date, team_id, player_key, etc.), the league
+    key of the query object (derived from its game ID if it has not been retrieved yet), and the attributes of the saved
+    models. Seasons are taken from the saved models or, if not available, from previously saved data for the same league
+    (such as league metadata), since league keys are specific to a single season.
+    """
+
+    _DATA_COLUMNS: ClassVar[Tuple[str, ...]] = (
+        "query", "league_key", "season", "week", "date", "team_key", "player_key", "model_class", "is_list", "data"
+    )
+    _KEY_COLUMNS: ClassVar[Tuple[str, ...]] = ("league_key", "season", "week", "date", "team_key", "player_key")
+    _FIND_COLUMNS: ClassVar[Tuple[str, ...]] = ("query", *_KEY_COLUMNS)
+    _TABLE_NAME: ClassVar[str] = "yfpy_data"
+    _IDENTIFIERS: ClassVar[FrozenSet[str]] = frozenset((_TABLE_NAME, "name", "position", *_DATA_COLUMNS, "updated_at"))
+
+    def __init__(self, data_dir: Union[Path, str], save_data: bool = False, dev_offline: bool = False,
+                 database_file_name: str = "yfpy.sqlite3", cache: bool = False, cache_ttl: Optional[float] = None,
+                 max_cache_bytes: Optional[int] = None, max_cache_age: Union[float, Dict[str, float], None] = None,
+                 prune_interval: float = 300.0):
+        """Instantiate data object to retrieve, save, and load Yahoo Fantasy Sports data in a SQLite database.
+
+        Args:
+            data_dir (Path | str): Directory path where the SQLite database will be saved/loaded.
+            save_data (bool, optional): Boolean determining whether data is saved after retrieval from the Yahoo FF API.
+            dev_offline (bool, optional): Boolean for offline development (requires a prior online run with
+                save_data = True).
+            database_file_name (str, optional): File name of the SQLite database in the data directory (defaults to
+                "yfpy.sqlite3").
+            cache (bool, optional): Boolean to use saved data as a read-through cache in `retrieve` (see Data).
+            cache_ttl (float, optional): Number of seconds for which saved data is fresh (see Data).
+            max_cache_bytes (int, optional): Maximum total size in bytes of the saved model data (see Data). Since
+                loads are not recorded in the database, the least recently saved data is evicted first.
+            max_cache_age (float | dict[str, float], optional): Maximum age in seconds of saved data (see Data).
+            prune_interval (float, optional): Minimum number of seconds between the scans of all saved data (see Data).
+
+        """
+        super().__init__(data_dir, save_data, dev_offline, cache=cache, cache_ttl=cache_ttl,
+                         max_cache_bytes=max_cache_bytes, max_cache_age=max_cache_age, prune_interval=prune_interval)
+        self.database_file_name: str = database_file_name
+        self._database_lock: threading.Lock = threading.Lock()
+        self._initialized_database_paths: Set[Path] = set()
+
+    @property
+    def database_path(self) -> Path:
+        """Path of the SQLite database file in the current data directory.
+
+        Returns:
+            Path: SQLite database file path.
+
+        """
+        return self.data_dir / self.database_file_name
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection to the SQLite database (creating the database and its tables if needed) that commits on
+        success, rolls back on failure, and is always closed.
+
+        Returns:
+            Iterator[sqlite3.Connection]: SQLite database connection.
+
+        """
+        database_path = self.database_path
+        database_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(database_path, timeout=30)
+        try:
+            with connection:
+                if database_path not in self._initialized_database_paths:
+                    self._create_tables(connection)
+                    self._initialized_database_paths.add(database_path)
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _create_tables(connection: sqlite3.Connection) -> None:
+        """Create the SQLite database table and indexes for saved data if they do not already exist.
+
+        Args:
+            connection (sqlite3.Connection): SQLite database connection.
+
+        Returns:
+            None
+
+        """
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS yfpy_data ("
+            "name TEXT NOT NULL, "
+            "position INTEGER NOT NULL, "
+            "query TEXT, "
+            "league_key TEXT, "
+            "season INTEGER, "
+            "week INTEGER, "
+            "date TEXT, "
+            "team_key TEXT, "
+            "player_key TEXT, "
+            "model_class TEXT, "
+            "is_list INTEGER NOT NULL, "
+            "data TEXT NOT NULL, "
+            "updated_at REAL NOT NULL, "
+            "PRIMARY KEY (name, position))"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS yfpy_data_league ON yfpy_data (league_key, season, week)")
+        connection.execute("CREATE INDEX IF NOT EXISTS yfpy_data_team ON yfpy_data (team_key, season, week)")
+        connection.execute("CREATE INDEX IF NOT EXISTS yfpy_data_player ON yfpy_data (player_key, season, week)")
+        connection.execute("CREATE INDEX IF NOT EXISTS yfpy_data_query ON yfpy_data (query, season, week)")
+
+    @staticmethod
+    def _to_int(value: Any) -> Optional[int]:
+        """Convert a value to an integer if possible.
+
+        Args:
+            value (Any): Value to convert.
+
+        Returns:
+            int | None: The integer value, or None if the value cannot be converted.
+
+        """
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    def _get_query_keys(self, yf_query: Callable, params: Union[Dict[str, Any], None]) -> Dict[str, Any]:
+        """Derive the row keys shared by all rows of a query result from the query object and query parameters.
+
+        Args:
+            yf_query (Callable of YahooFantasySportsQuery): The yfpy query method that retrieved the data.
+            params (dict[str, str], optional): Dictionary of parameters passed to the yfpy query function.
+
+        Returns:
+            dict[str, Any]: Dictionary with row key column names as keys and row key values as values.
+
+        """
+        params = params or {}
+        yf_query_instance = getattr(yf_query, "__self__", None)
+        league_key = params.get("league_key") or self._data_cache.get_league_key(yf_query_instance)
+
+        team_key = params.get("team_key")
+        if not team_key and params.get("team_id") is not None and league_key:
+            team_key = f"{league_key}.t.{params['team_id']}"
+
+        chosen_date = params.get("chosen_date")
+        return {
+            "query": getattr(yf_query, "__name__", None),
+            "league_key": league_key,
+            "season": self._to_int(params.get("season")),
+            "week": self._to_int(params.get("chosen_week", params.get("week"))),
+            "date": str(chosen_date) if chosen_date else None,
+            "team_key": team_key,
+            "player_key": params.get("player_key"),
+        }
+
+    def _get_row_keys(self, query_keys: Dict[str, Any], model: Any) -> Dict[str, Any]:
+        """Derive the row keys of a single saved model by filling in any query keys missing from the model attributes.
+
+        Args:
+            query_keys (dict[str, Any]): Row keys shared by all rows of the query result (see `_get_query_keys`).
+            model (Any): The saved YFPY model (or any other saved data).
+
+        Returns:
+            dict[str, Any]: Dictionary with row key column names as keys and row key values as values.
+
+        """
+        row_keys = dict(query_keys)
+        if isinstance(model, YahooFantasyObject):
+            model_attributes = vars(model)
+            for key_column in ["league_key", "team_key", "player_key"]:
+                if not row_keys[key_column] and isinstance(model_attributes.get(key_column), str):
+                    row_keys[key_column] = model_attributes.get(key_column) or None
+            for key_column in ["season", "week"]:
+                if row_keys[key_column] is None:
+                    row_keys[key_column] = self._to_int(model_attributes.get(key_column))
+        return row_keys
+
+    def _write_data(self, file_name: str, data: Any, yf_query: Callable,
+                    params: Union[Dict[str, Any], None] = None) -> str:
+        """Write retrieved data to the SQLite database, replacing any data previously saved under the same file name.
+
+        Args:
+            file_name (str): Name under which data will be saved.
+            data (Any): Data retrieved by the yfpy query.
+            yf_query (Callable of YahooFantasySportsQuery): The yfpy query method that retrieved the data.
+            params (dict[str, str], optional): Dictionary of parameters passed to the yfpy query function.
+
+        Returns:
+            str: Location to which the data was saved.
+
+        """
+        query_keys = self._get_query_keys(yf_query, params)
+
+        # empty lists are saved as a single (non-list) row so that they are loaded as empty lists again
+        is_list = isinstance(data, list) and bool(data) and all(isinstance(el, YahooFantasyObject) for el in data)
+        elements = data if is_list else [data]
+
+        rows_keys = [self._get_row_keys(query_keys, element) for element in elements]
+
+        with self._database_lock, self._connect() as connection:
+            # fill in missing seasons from data previously saved for the same league
+            for row_keys in rows_keys:
+                if row_keys["season"] is None and row_keys["league_key"]:
+                    league_season = connection.execute(
+                        "SELECT season FROM yfpy_data WHERE league_key = ? AND season IS NOT NULL LIMIT 1",
+                        (row_keys["league_key"],)
+                    ).fetchone()
+                    row_keys["season"] = league_season[0] if league_season else None
+
+            updated_at = time.time()
+            rows = [
+                (
+                    file_name,
+                    position,
+                    *[row_keys[column] for column in ["query", *self._KEY_COLUMNS]],
+                    snakecase(element.__class__.__name__) if is_list else None,
+                    int(is_list),
+                    serialize(element),
+                    updated_at
+                ) for position, (element, row_keys) in enumerate(zip(elements, rows_keys))
+            ]
+
+            connection.execute("DELETE FROM yfpy_data WHERE name = ? AND position >= ?", (file_name, len(rows)))
+            connection.executemany(self._get_upsert_statement(), rows)
+
+        return f"{self.database_path} ({file_name})"
+
+    @classmethod
+    def _quote_identifier(cls, identifier: str) -> str:
+        """Quote the name of the table or of a column of the SQLite database for use in a SQL statement.
+
+        Args:
+            identifier (str): Name of the table or column.
+
+        Returns:
+            str: Quoted name of the table or column.
+
+        Raises:
+            ValueError: If the name is not the name of the table or of a column of the SQLite database.
+
+        """
+        if identifier not in cls._IDENTIFIERS:
+            raise ValueError(f"\"{identifier}\" is not the name of the table or of a column of the SQLite database.")
+        return '"' + identifier.replace('"', '""') + '"'
+
+    @classmethod
+    def _get_upsert_statement(cls) -> str:
+        """Build the SQL statement inserting or replacing a saved row.
+
+        Returns:
+            str: SQL statement with one parameter per column of the yfpy_data table.
+
+        """
+        columns = [cls._quote_identifier(column) for column in ("name", "position", *cls._DATA_COLUMNS, "updated_at")]
+        updated_columns = [f"{column} = excluded.{column}" for column in columns[2:]]
+        return " ".join((
+            "INSERT INTO", cls._quote_identifier(cls._TABLE_NAME), f"({', '.join(columns)})",
+            "VALUES", f"({', '.join(['?'] * len(columns))})",
+            "ON CONFLICT (name, position) DO UPDATE SET", ", ".join(updated_columns)
+        ))
+
+    def _get_saved_data(self, rows: List[Tuple[Optional[str], int, str]]) -> Any:
+        """Convert saved SQLite database rows to the saved (tagged) data.
+
+        Args:
+            rows (list[tuple[str | None, int, str]]): Saved rows as tuples of model class, list flag, and data.
+
+        Returns:
+            Any: The saved data.
+
+        """
+        if rows and not rows[0][1]:
+            return json.loads(rows[0][2])
+        return self._get_saved_models_data([row[0] for row in rows], [row[2] for row in rows])
+
+    def _read_data(self, file_name: str) -> Tuple[Any, str]:
+        """Read saved data from the SQLite database.
+
+        Args:
+            file_name (str): Name under which data was saved.
+
+        Returns:
+            tuple[Any, str]: The saved data and the location from which it was read.
+
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT model_class, is_list, data FROM yfpy_data WHERE name = ? ORDER BY position", (file_name,)
+            ).fetchall()
+
+        if not rows:
+            raise FileNotFoundError(f"Data \"{file_name}\" does not exist in {self.database_path}. Cannot load data "
+                                    f"locally without having previously saved data.")
+
+        return self._get_saved_data(rows), f"{self.database_path} ({file_name})"
+
+    def _get_saved_data_time(self, file_name: str) -> Optional[float]:
+        """Get the time at which data was saved to the SQLite database.
+
+        Args:
+            file_name (str): Name under which data was saved.
+
+        Returns:
+            float | None: Timestamp (seconds since the epoch) at which the data was saved, or None if no data was saved.
+
+        """
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT MAX(updated_at) FROM yfpy_data WHERE name = ?", (file_name,)
+            ).fetchone()[0]
+
+    def _get_cache_entries(self) -> List[Dict[str, Any]]:
+        """Get the size and save time of all data saved to the SQLite database (the save time is also used as the last
+        access time).
+
+        Returns:
+            list[dict[str, Any]]: List of dictionaries with the file name ("file_name"), size in bytes ("size"), save
+                time ("saved_at"), and last access time ("accessed_at") of each saved file name.
+
+        """
+        if not self.database_path.exists():
+            return []
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT name, SUM(LENGTH(data)), MAX(updated_at) FROM yfpy_data GROUP BY name"
+            ).fetchall()
+        return [
+            {"file_name": name, "size": size or 0, "saved_at": saved_at, "accessed_at": saved_at}
+            for name, size, saved_at in rows if not self._data_cache.is_excluded(name)
+        ]
+
+    def _get_saved_size(self, file_name: str) -> int:
+        """Get the size of the model data saved to the SQLite database under a file name.
+
+        Args:
+            file_name (str): Name under which data was saved.
+
+        Returns:
+            int: Size in bytes of the saved model data (0 if no data was saved).
+
+        """
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT SUM(LENGTH(data)) FROM yfpy_data WHERE name = ?", (file_name,)
+            ).fetchone()[0] or 0
+
+    def _delete_cache_entries(self, file_names: List[str]) -> None:
+        """Delete data saved to the SQLite database.
+
+        Args:
+            file_names (list[str]): Names under which the data to delete was saved.
+
+        Returns:
+            None
+
+        """
+        with self._database_lock, self._connect() as connection:
+            connection.executemany("DELETE FROM yfpy_data WHERE name = ?", [(file_name,) for file_name in file_names])
+
+    def find(self, query: str = None, league_key: str = None, season: int = None, week: int = None,
+             date: str = None, team_key: str = None, player_key: str = None,
+             data_type_class: Type[YahooFantasyObject] = None) -> List[Union[Data.YFO, Dict[str, Data.YFO]]]:
+        """Load all saved data matching the selected keys using the SQLite database indexes.
+
+        Args:
+            query (str, optional): Name of the yfpy query method that retrieved the data (e.g.
+                "get_team_roster_by_week").
+            league_key (str, optional): Yahoo league key (e.g. "331.l.729259").
+            season (int, optional): Season (e.g. 2014).
+            week (int, optional): Week.
+            date (str, optional): Date (formatted as YYYY-MM-DD).
+            team_key (str, optional): Yahoo team key (e.g. "331.l.729259.t.3").
+            player_key (str, optional): Yahoo player key (e.g. "331.p.7200").
+            data_type_class (Type[YahooFantasyObject], optional): YFPY models.py class for casting data saved as single
+                (non-list) results.
+
+        Examples:
+            >>> data = SQLiteData(data_dir)
+            >>> data.find(query="get_team_roster_by_week", team_key="406.l.413954.t.3", season=2021)
+            [
+              Roster({...}),
+              ...
+            ]
+
+        Returns:
+            list[object]: Saved YFPY models (one per saved row) ordered by season, week, date, name, and position.
+
+        """
+        selected_keys = {
+            "query": query,
+            "league_key": league_key,
+            "season": season,
+            "week": week,
+            "date": date,
+            "team_key": team_key,
+            "player_key": player_key,
+        }
+        conditions = {
+            column: selected_keys[column] for column in self._FIND_COLUMNS if selected_keys[column] is not None
+        }
+        statement = ["SELECT model_class, is_list, data FROM", self._quote_identifier(self._TABLE_NAME)]
+        if conditions:
+            statement.extend((
+                "WHERE", " AND ".join(f"{self._quote_identifier(column)} = ?" for column in conditions)
+            ))
+        statement.append("ORDER BY season, week, date, name, position")
+
+        with self._connect() as connection:
+            rows = connection.execute(" ".join(statement), list(conditions.values())).fetchall()
+
+        found_data = []
+        for model_class, is_list, row_data in rows:
+            if not is_list and row_data == "[]":
+                # saved empty lists contain no data
+                continue
+            if is_list:
+                # rows of saved lists each contain a single YFPY model
+                model_data = self._get_saved_model_data(model_class, row_data)
+                if TYPE_TAG in model_data:
+                    found_data.append(from_tagged_data(model_data))
+                else:
+                    found_data.append(unpack_data(model_data, YahooFantasyObject)[model_class])
+            else:
+                found_data.append(self._unpack_loaded_data(json.loads(row_data), data_type_class))
+        return found_data
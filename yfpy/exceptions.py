@@ -40,3 +40,7 @@ class YahooFantasySportsException(Exception):
 
 class YahooFantasySportsDataNotFound(YahooFantasySportsException):
     """YFPY exception when no data was retrieved from the Yahoo Fantasy Sports REST API."""
+
+
+class YahooFantasySportsDataCorrupted(YahooFantasySportsException):
+    """YFPY exception when locally saved Yahoo Fantasy Sports data does not match its recorded checksum."""
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+"""YFPY module for exporting collections of YFPY models to columnar (tabular) data.
+
+Lists of YFPY models (such as the players returned by `get_league_players` or
+`get_team_roster_player_stats_by_week`) are converted to a column-oriented dictionary of lists with one row per model,
+which can be aggregated directly or handed to pandas/pyarrow without walking the nested model attributes again. Player
+stats are pivoted by `stat_id` so that every stat becomes its own column. Models that wrap a collection (such as the
+Roster and Scoreboard values returned by the `*_by_weeks` queries) are exported as the models they contain.
+
+Note:
+    pandas and pyarrow are optional dependencies that are only imported when a DataFrame or Arrow Table is requested
+    (install them with `pip install pandas` and/or `pip install yfpy[arrow]`).
+
+Attributes:
+    logger (Logger): Module level logger for usage and debugging.
+    STAT_COLUMN_PREFIX (str): Prefix of the column names of pivoted stats (followed by the stat ID).
+    COLLECTION_ATTRIBUTES (dict[str, str]): Attribute names of the models contained in collection models by model class
+        name (such as the players of a Roster).
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+
+from yfpy.logger import get_logger
+from yfpy.models import YahooFantasyObject
+from yfpy.utils import import_optional_dependency
+
+logger = get_logger(__name__)
+
+STAT_COLUMN_PREFIX: str = "stat_"
+
+COLLECTION_ATTRIBUTES: Dict[str, str] = {
+    "Roster": "players",
+    "Scoreboard": "matchups",
+    "Standings": "teams",
+}
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _get_models(models: Any) -> List[YahooFantasyObject]:
+    """Get the YFPY models to export as rows from a YFPY model or a collection of YFPY models.
+
+    Args:
+        models (Any): Collection model (such as Roster or Scoreboard), single YFPY model, or iterable of YFPY models
+            (which may be wrapped in single-key dictionaries such as {"player": Player}).
+
+    Returns:
+        list[YahooFantasyObject]: YFPY models to export as rows.
+
+    """
+    if isinstance(models, YahooFantasyObject):
+        collection_attribute = COLLECTION_ATTRIBUTES.get(models.__class__.__name__)
+        if collection_attribute is None:
+            return [models]
+        models = vars(models).get(collection_attribute) or []
+        if isinstance(models, (YahooFantasyObject, dict)):
+            # collections with a single model are not stored as a list when parsed from the Yahoo API response
+            models = [models]
+    elif isinstance(models, (str, bytes, Mapping)) or not isinstance(models, Iterable):
+        raise TypeError(
+            f"Unable to export {type(models).__name__} \"{models}\" to columns: expected a YFPY model or an iterable "
+            f"of YFPY models."
+        )
+
+    model_list = []
+    for model in models:
+        # unwrap models stored as single-key dictionaries ({"player": Player}) when parsed from the Yahoo API response
+        if isinstance(model, dict) and len(model) == 1:
+            model = next(iter(model.values()))
+        if not isinstance(model, YahooFantasyObject):
+            raise TypeError(f"Unable to export {type(model).__name__} \"{model}\" to columns: expected a YFPY model.")
+        model_list.append(model)
+    return model_list
+
+
+def _get_row_values(model: YahooFantasyObject, fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Extract the scalar attribute values of a YFPY model (nested YFPY models are skipped, since their relevant values
+    are already flattened onto the parent model by the model classes).
+
+    Args:
+        model (YahooFantasyObject): YFPY model from which to extract values.
+        fields (list[str], optional): Attribute names to extract (all scalar attributes are extracted when None).
+
+    Returns:
+        dict[str, Any]: Dictionary with attribute names as keys and attribute values as values.
+
+    """
+    # read the instance dictionary directly to bypass the (comparatively slow) YahooFantasyObject.__getattribute__
+    model_attributes = vars(model)
+    if fields is not None:
+        model_attributes = {field: model_attributes.get(field) for field in fields}
+
+    row_values = {}
+    for attribute_name, attribute_value in model_attributes.items():
+        if attribute_name.startswith("_") or attribute_name == "stats":
+            continue
+        if isinstance(attribute_value, bytes):
+            row_values[attribute_name] = attribute_value.decode("utf-8")
+        elif isinstance(attribute_value, _SCALAR_TYPES):
+            row_values[attribute_name] = attribute_value
+        elif isinstance(attribute_value, list) and all(isinstance(el, _SCALAR_TYPES) for el in attribute_value):
+            row_values[attribute_name] = attribute_value
+    return row_values
+
+
+def _get_stat_values(model: YahooFantasyObject, stat_column_names: Optional[Mapping[Any, str]]) -> Dict[str, float]:
+    """Pivot the stats of a YFPY model (such as Player) into a dictionary with one entry per stat.
+
+    Args:
+        model (YahooFantasyObject): YFPY model containing a "stats" attribute.
+        stat_column_names (dict, optional): Dictionary mapping stat IDs to custom column names.
+
+    Returns:
+        dict[str, float]: Dictionary with stat column names as keys and stat values as values.
+
+    """
+    stat_values = {}
+    for stat in vars(model).get("stats") or []:
+        # stats are stored as single-key dictionaries ({"stat": Stat}) when parsed from the Yahoo API response
+        if isinstance(stat, dict):
+            stat = stat.get("stat")
+        if stat is None:
+            continue
+        stat_attributes = vars(stat)
+        stat_id = stat_attributes.get("stat_id")
+        if stat_column_names and stat_id in stat_column_names:
+            stat_column_name = stat_column_names[stat_id]
+        elif stat_column_names and str(stat_id) in stat_column_names:
+            stat_column_name = stat_column_names[str(stat_id)]
+        else:
+            stat_column_name = f"{STAT_COLUMN_PREFIX}{stat_id}"
+        stat_values[stat_column_name] = stat_attributes.get("value")
+    return stat_values
+
+
+def to_columns(models: Union[YahooFantasyObject, Iterable[YahooFantasyObject], Mapping[Any, Any]],
+               fields: Optional[List[str]] = None, include_stats: bool = True,
+               stat_column_names: Optional[Mapping[Any, str]] = None, key_column: str = "key") -> Dict[str, List[Any]]:
+    """Convert a collection of YFPY models into columnar data with one row per model.
+
+    Args:
+        models (YahooFantasyObject | Iterable[YahooFantasyObject] | dict[Any, Any]): YFPY models to export, a
+            collection model (such as Roster, Scoreboard, or Standings) whose contained models are exported, or a
+            dictionary keyed by week, date, team key, etc. with any of these as values (such as the results of the
+            `*_by_weeks` and `*_by_date_range` queries).
+        fields (list[str], optional): Model attribute names to include as columns (defaults to all scalar attributes).
+        include_stats (bool, optional): Include the model stats (if present) pivoted into one column per stat ID
+            (defaults to True).
+        stat_column_names (dict, optional): Dictionary mapping stat IDs to custom stat column names (defaults to
+            "stat_<stat_id>").
+        key_column (str, optional): Name of the column containing the dictionary keys when a dictionary of model
+            collections is exported (defaults to "key").
+
+    Examples:
+        >>> from yfpy.export import to_columns
+        >>> stat_names = {stat.stat_id: stat.display_name for stat in league.settings.stat_categories.stats}
+        >>> columns = to_columns(query.get_league_players(), stat_column_names=stat_names)
+        >>> columns["player_key"]
+        ["331.p.7200", "331.p.5479", ...]
+        >>> columns = to_columns(query.get_team_roster_by_weeks(1, range(1, 3)), key_column="week")
+        >>> columns["week"]
+        [1, 1, ..., 2, 2, ...]
+
+    Returns:
+        dict[str, list[Any]]: Dictionary with column names as keys and lists of equal length containing the column
+            values (None where a model is missing a column) as values.
+
+    Raises:
+        TypeError: If the data to export is not a YFPY model, an iterable of YFPY models, or a dictionary of these.
+
+    """
+    if isinstance(models, Mapping):
+        keyed_models = ((key, model) for key, key_models in models.items() for model in _get_models(key_models))
+    else:
+        keyed_models = ((None, model) for model in _get_models(models))
+
+    columns: Dict[str, List[Any]] = {}
+    row_count = 0
+    for key, model in keyed_models:
+        row_values = {key_column: key} if isinstance(models, Mapping) else {}
+        row_values.update(_get_row_values(model, fields))
+        if include_stats:
+            row_values.update(_get_stat_values(model, stat_column_names))
+
+        for column_name, column_value in row_values.items():
+            column = columns.get(column_name)
+            if column is None:
+                # backfill columns first seen partway through the collection
+                column = columns[column_name] = [None] * row_count
+            column.append(column_value)
+        row_count += 1
+
+        # pad columns that are missing from the current model
+        for column in columns.values():
+            if len(column) < row_count:
+                column.append(None)
+
+    logger.debug(f"Exported {row_count} rows with {len(columns)} columns.")
+    return columns
+
+
+def to_pandas(models: Union[YahooFantasyObject, Iterable[YahooFantasyObject], Mapping[Any, Any]],
+              **kwargs) -> Any:
+    """Convert a collection of YFPY models into a pandas DataFrame with one row per model (requires pandas).
+
+    Args:
+        models (YahooFantasyObject | Iterable[YahooFantasyObject] | dict[Any, Any]): YFPY models to export (see
+            `to_columns`).
+        **kwargs: Keyword arguments passed to `to_columns`.
+
+    Examples:
+        >>> from yfpy.export import to_pandas
+        >>> players_df = to_pandas(query.get_league_players())
+        >>> players_df.groupby("primary_position")["player_points_value"].sum()
+
+    Returns:
+        pandas.DataFrame: DataFrame containing the exported models.
+
+    """
+    pandas = import_optional_dependency("pandas")
+    return pandas.DataFrame(to_columns(models, **kwargs))
+
+
+def to_arrow(models: Union[YahooFantasyObject, Iterable[YahooFantasyObject], Mapping[Any, Any]],
+             **kwargs) -> Any:
+    """Convert a collection of YFPY models into a pyarrow Table with one row per model (requires pyarrow).
+
+    Args:
+        models (YahooFantasyObject | Iterable[YahooFantasyObject] | dict[Any, Any]): YFPY models to export (see
+            `to_columns`).
+        **kwargs: Keyword arguments passed to `to_columns`.
+
+    Examples:
+        >>> from yfpy.export import to_arrow
+        >>> players_table = to_arrow(query.get_league_players())
+        >>> players_table.column("player_points_value")
+
+    Returns:
+        pyarrow.Table: Arrow Table containing the exported models.
+
+    """
+    return columns_to_arrow(to_columns(models, **kwargs))
+
+
+def columns_to_arrow(columns: Dict[str, List[Any]]) -> Any:
+    """Convert columnar data (see `to_columns`) into a pyarrow Table (requires pyarrow).
+
+    Note:
+        Columns with values of mixed types that Arrow cannot store in a single typed column (for example, a column
+        containing both numbers and strings) are stored as strings.
+
+    Args:
+        columns (dict[str, list[Any]]): Dictionary with column names as keys and lists of column values as values.
+
+    Returns:
+        pyarrow.Table: Arrow Table containing the columnar data.
+
+    """
+    pyarrow = import_optional_dependency("pyarrow")
+
+    arrays = []
+    for column_name, column in columns.items():
+        try:
+            arrays.append(pyarrow.array(column))
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+            logger.debug(f"Column \"{column_name}\" contains values of mixed types and will be stored as strings.")
+            arrays.append(pyarrow.array([None if value is None else str(value) for value in column], pyarrow.string()))
+    return pyarrow.Table.from_arrays(arrays, names=list(columns.keys()))
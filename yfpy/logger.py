@@ -1,32 +1,67 @@
 # -*- coding: utf-8 -*-
 """YFPY module for configuring and formatting the custom logger.
+
+Note:
+    YFPY attaches its own stream handler to each of its loggers only once (the first time the logger is requested), and
+    never removes handlers added by the host application. Host applications that want full control over log output can
+    call :func:`disable_default_log_handlers` to remove the YFPY stream handlers and prevent them from being attached.
+
+Attributes:
+    DEFAULT_HANDLER_NAME (str): Name used to identify the stream handlers attached by YFPY.
+    DEFAULT_LOG_PAYLOAD_MAX_LENGTH (int): Maximum number of characters of a data payload included in a log message
+        (can be overridden with a non-negative integer in the YFPY_LOG_PAYLOAD_MAX_LENGTH environment variable).
+
 """
 __author__ = "Wren J. R. (uberfastman)"
 __email__ = "uberfastman@uberfastman.dev"
 
-from logging import getLogger, Logger, Formatter, StreamHandler, INFO
+import os
+from logging import getLogger, Logger, Formatter, StreamHandler, INFO, NOTSET, Handler
+from typing import Any, Callable, Optional, Union
 
+DEFAULT_HANDLER_NAME: str = "yfpy"
 
-def get_logger(name: str, level: int = INFO) -> Logger:
-    """Get custom YFPY logger object.
+
+def _parse_log_payload_max_length(value: Optional[str], default: int = 5000) -> int:
+    """Parse the maximum log payload length configured with the YFPY_LOG_PAYLOAD_MAX_LENGTH environment variable.
 
     Args:
-        name (str): The module name for the logger.
-        level (int): The log level for the logger. Default level set to INFO.
+        value (str, optional): Value of the environment variable (None if it is not set).
+        default (int, optional): Maximum log payload length used if the value is not set or invalid (defaults to 5000).
 
     Returns:
-        Logger: A Python Logger object with custom configuration and formatting.
+        int: Maximum number of characters of a data payload included in a log message.
 
     """
-    logger = getLogger(name)
-    if len(logger.handlers) > 0:
-        logger.handlers = []
-    if level:
-        logger.setLevel(level)
+    if value is None or not value.strip():
+        return default
+    try:
+        max_length = int(value)
+    except ValueError:
+        max_length = -1
+    if max_length < 0:
+        getLogger(__name__).warning(
+            f"Invalid YFPY_LOG_PAYLOAD_MAX_LENGTH value \"{value}\" (expected a non-negative integer), using the "
+            f"default of {default} characters instead."
+        )
+        return default
+    return max_length
+
+
+DEFAULT_LOG_PAYLOAD_MAX_LENGTH: int = _parse_log_payload_max_length(os.environ.get("YFPY_LOG_PAYLOAD_MAX_LENGTH"))
+
+_default_handlers_enabled: bool = True
 
+
+def _create_default_handler() -> Handler:
+    """Create the default YFPY stream handler.
+
+    Returns:
+        Handler: A Python logging StreamHandler with custom formatting.
+
+    """
     sh = StreamHandler()
-    if level:
-        sh.setLevel(level)
+    sh.set_name(DEFAULT_HANDLER_NAME)
 
     formatter = Formatter(
         fmt="%(asctime)s.%(msecs)03d - %(levelname)s - %(filename)s - %(name)s:%(lineno)d - %(message)s",
@@ -34,6 +69,87 @@ def get_logger(name: str, level: int = INFO) -> Logger:
     )
     sh.setFormatter(formatter)
 
-    logger.addHandler(sh)
+    return sh
+
+
+def get_logger(name: str, level: int = INFO) -> Logger:
+    """Get custom YFPY logger object.
+
+    Note:
+        The log level is only applied to loggers that do not have a level yet, so levels configured by the host
+        application (or by an earlier call) are left untouched.
+
+    Args:
+        name (str): The module name for the logger.
+        level (int): The log level for the logger. Default level set to INFO.
+
+    Returns:
+        Logger: A Python Logger object with custom configuration and formatting.
+
+    """
+    logger = getLogger(name)
+    if level and logger.level == NOTSET:
+        logger.setLevel(level)
+
+    # only attach the default handler if the logger has no handlers yet, so repeated calls (and host application
+    # handlers) are left untouched
+    if _default_handlers_enabled and not logger.handlers:
+        logger.addHandler(_create_default_handler())
 
     return logger
+
+
+def disable_default_log_handlers(name: str = "yfpy") -> None:
+    """Remove the default YFPY stream handlers and stop attaching them to any subsequently created YFPY loggers.
+
+    Args:
+        name (str, optional): The name of the parent logger from which (along with all of its children) to remove the
+            default YFPY handlers (defaults to "yfpy").
+
+    Returns:
+        None
+
+    """
+    global _default_handlers_enabled
+    _default_handlers_enabled = False
+
+    logger_names = [name] + [
+        logger_name for logger_name in Logger.manager.loggerDict.keys() if logger_name.startswith(f"{name}.")
+    ]
+    for logger_name in logger_names:
+        logger = getLogger(logger_name)
+        for handler in list(logger.handlers):
+            if handler.get_name() == DEFAULT_HANDLER_NAME:
+                logger.removeHandler(handler)
+
+
+class LogPayload(object):
+    """Lazily formatted and size-capped data payload for log messages.
+
+    Passing a LogPayload as a logging argument (e.g. `logger.debug("Response: %s", LogPayload(data))`) defers the
+    (potentially expensive) string conversion of the payload until the log record is actually emitted, so nothing is
+    serialized when the log level is disabled.
+    """
+
+    def __init__(self, payload: Union[Any, Callable[[], Any]], max_length: Optional[int] = None):
+        """Instantiate a lazily formatted log payload.
+
+        Args:
+            payload (Any | Callable): The data to be included in the log message, or a zero-argument callable returning
+                that data.
+            max_length (int, optional): Maximum number of characters of the payload to include in the log message
+                (defaults to DEFAULT_LOG_PAYLOAD_MAX_LENGTH, and a value of 0 disables truncation).
+
+        """
+        self.payload: Union[Any, Callable[[], Any]] = payload
+        self.max_length: int = max_length if max_length is not None else DEFAULT_LOG_PAYLOAD_MAX_LENGTH
+
+    def __str__(self):
+        payload = self.payload() if callable(self.payload) else self.payload
+        payload_str = str(payload)
+        if self.max_length and len(payload_str) > self.max_length:
+            return (
+                f"{payload_str[:self.max_length]}... [truncated {len(payload_str) - self.max_length} of "
+                f"{len(payload_str)} characters]"
+            )
+        return payload_str
@@ -11,23 +11,32 @@ Attributes:
 __author__ = "Wren J. R. (uberfastman)"
 __email__ = "uberfastman@uberfastman.dev"
 
+import copy
 import json
 import logging
 import os
 import sys
+import threading
 import time
+import weakref
 from dotenv import load_dotenv
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from datetime import date, timedelta
 from json import JSONDecodeError
 from pathlib import Path
-from typing import Callable, Dict, List, Type, TypeVar, Union, Any, Optional
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Tuple, Type, TypeVar, Union, Any, Optional
 
 from requests import Response
-from requests.exceptions import HTTPError
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError, RequestException
 from yahoo_oauth import OAuth2
 
+from yfpy.auth import TOKEN_FIELDS, TokenStore, get_token_expires_in
+from yfpy.builder import QueryBuilder
 from yfpy.exceptions import YahooFantasySportsDataNotFound
-from yfpy.logger import get_logger
+from yfpy.logger import LogPayload, get_logger
 from yfpy.models import (
     DraftResult,
     Game,
@@ -51,6 +60,9 @@ from yfpy.models import (
     YahooFantasyObject
 )
 from yfpy.utils import (
+    AdaptivePageSize,
+    RateLimiter,
+    SingleFlight,
     jsonify_data,
     prettify_data,
     reformat_json_list,
@@ -64,10 +76,229 @@ logger = get_logger(__name__)
 # suppress yahoo-oauth debug logging
 logging.getLogger("yahoo_oauth").setLevel(level=logging.INFO)
 
+# errors of access token refreshes that fail (failed requests, refresh responses without the expected token fields or
+# with invalid JSON, and token store files that cannot be read or written)
+_ACCESS_TOKEN_REFRESH_ERRORS = (RequestException, KeyError, ValueError, OSError)
+
+
+class _SharedAuthentication(object):
+    """Authentication state shared by a YahooFantasySportsQuery instance and all instances derived from it, as well as
+    by all instances authenticating with the same Yahoo account (see :meth:`for_account`).
+    """
+
+    # registry of the authentication state of each Yahoo account, which is released once no instances use it anymore
+    _registry: "weakref.WeakValueDictionary[Tuple[Any, ...], _SharedAuthentication]" = weakref.WeakValueDictionary()
+    _registry_lock: threading.Lock = threading.Lock()
+
+    # maximum number of seconds the background token refresh thread sleeps before checking the access token again, and
+    # number of seconds it waits before retrying a failed refresh
+    _background_refresh_max_sleep: float = 60.0
+    _background_refresh_retry_delay: float = 15.0
+
+    def __init__(self):
+        """Instantiate shared authentication state.
+
+        Attributes:
+            oauth (OAuth2): The authenticated yahoo-oauth OAuth2 client (None until authentication has completed).
+            lock (threading.RLock): Lock serializing authentication and token refreshes across threads and instances.
+            token_store (TokenStore): Token store sharing the access token with other processes (None if the access
+                token is not shared across processes).
+            token_refresh_margin (float): Number of seconds before the access token expires at which requests refresh it
+                (background refreshes happen at twice that margin, so requests normally never wait for a refresh).
+            background_token_refresh (bool): Boolean to refresh the access token from a daemon thread.
+
+        """
+        self.oauth: Optional[OAuth2] = None
+        self.lock: threading.RLock = threading.RLock()
+        self.token_store: Optional[TokenStore] = None
+        self.token_refresh_margin: float = 0.0
+        self.background_token_refresh: bool = False
+        self._background_refresh_thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def for_account(cls, consumer_key: str, consumer_secret: str, guid: Optional[str] = None,
+                    token_source: Optional[str] = None) -> "_SharedAuthentication":
+        """Get the shared authentication state of a Yahoo account, so all instances for the same account reuse one
+        access token and one authenticated session (and its connection pool).
+
+        Args:
+            consumer_key (str): Yahoo developer app consumer key.
+            consumer_secret (str): Yahoo developer app consumer secret.
+            guid (str, optional): Yahoo account GUID (if known from previously saved access token data).
+            token_source (str, optional): Refresh token or token store path the account authenticates with, which
+                identifies the account instead of the GUID while the GUID is not known yet.
+
+        Returns:
+            _SharedAuthentication: The authentication state of the Yahoo account.
+
+        """
+        # before logging in, different accounts of the same Yahoo developer app can only be told apart by their tokens
+        account_key = (consumer_key, consumer_secret, guid, token_source if guid is None else None)
+        with cls._registry_lock:
+            shared_auth = cls._registry.get(account_key)
+            if shared_auth is None:
+                shared_auth = cls._registry[account_key] = cls()
+            return shared_auth
+
+    def get_token_dict(self) -> Dict[str, Any]:
+        """Get the access token fields of the OAuth2 client.
+
+        Returns:
+            dict[str, Any]: Yahoo access token fields (empty if authentication has not completed yet).
+
+        """
+        if self.oauth is None:
+            return {}
+        return {field: getattr(self.oauth, field, None) for field in TOKEN_FIELDS}
+
+    def _set_token_dict(self, token_dict: Dict[str, Any]) -> None:
+        """Update the access token fields of the OAuth2 client and its session.
+
+        Args:
+            token_dict (dict[str, Any]): Yahoo access token fields.
+
+        Returns:
+            None
+
+        """
+        for field in ["access_token", "guid", "refresh_token", "token_time", "token_type"]:
+            setattr(self.oauth, field, token_dict.get(field))
+        # the session of the OAuth2 client sends the access token it was created with unless it is updated as well
+        self.oauth.session.access_token = self.oauth.access_token
+
+    def _refresh(self, token_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Refresh the access token of the OAuth2 client.
+
+        Args:
+            token_dict (dict[str, Any]): Freshest known Yahoo access token fields to refresh.
+
+        Returns:
+            dict[str, Any]: Refreshed Yahoo access token fields.
+
+        """
+        self._set_token_dict(token_dict)
+        self.oauth.refresh_access_token()
+        self.oauth.session.access_token = self.oauth.access_token
+        return self.get_token_dict()
+
+    def token_expires_in(self) -> float:
+        """Calculate the number of seconds until the access token of the OAuth2 client expires.
+
+        Returns:
+            float: Number of seconds until the access token expires (negative if it has already expired).
+
+        """
+        return get_token_expires_in(self.get_token_dict())
+
+    def refresh_access_token(self, min_expires_in: float = 0.0) -> None:
+        """Ensure the access token of the OAuth2 client remains valid for at least min_expires_in seconds, reusing a
+        fresher access token from the token store (if any) before refreshing it.
+
+        Args:
+            min_expires_in (float, optional): Minimum number of seconds the access token must remain valid (defaults to
+                0.0).
+
+        Returns:
+            None
+
+        """
+        with self.lock:
+            token_dict = self.get_token_dict()
+            if self.token_store is not None:
+                self._set_token_dict(self.token_store.refresh(token_dict, self._refresh, min_expires_in))
+            elif get_token_expires_in(token_dict) <= min_expires_in:
+                self._refresh(token_dict)
+
+    def refresh_rejected_access_token(self, rejected_access_token: Optional[str]) -> None:
+        """Refresh an access token rejected by the Yahoo Fantasy Sports REST API, unless another thread (or, with a
+        token store, another process) has already replaced it, so concurrent authentication failures collapse into a
+        single refresh.
+
+        Args:
+            rejected_access_token (str): The access token that was sent with the rejected request.
+
+        Returns:
+            None
+
+        """
+        with self.lock:
+            token_dict = self.get_token_dict()
+            if token_dict.get("access_token") != rejected_access_token:
+                return
+
+            if self.token_store is None:
+                self._refresh(token_dict)
+                return
+
+            with self.token_store.lock():
+                stored_token_dict = self.token_store.load(token_dict["consumer_key"], token_dict.get("guid"))
+                if (stored_token_dict and stored_token_dict.get("access_token") != rejected_access_token
+                        and get_token_expires_in(stored_token_dict) > 0):
+                    self._set_token_dict(stored_token_dict)
+                else:
+                    self.token_store.save(self._refresh(token_dict))
+
+    def start_background_refresh(self) -> None:
+        """Start a daemon thread refreshing the access token ahead of its expiry (once per shared authentication state).
+
+        Returns:
+            None
+
+        """
+        with self.lock:
+            if self._background_refresh_thread is None:
+                self._background_refresh_thread = threading.Thread(
+                    target=self._run_background_refresh,
+                    args=(weakref.ref(self),),
+                    name="yfpy-token-refresh",
+                    daemon=True
+                )
+                self._background_refresh_thread.start()
+
+    @classmethod
+    def _run_background_refresh(cls, shared_auth_ref: "weakref.ReferenceType[_SharedAuthentication]") -> None:
+        """Refresh the access token ahead of its expiry until the shared authentication state is no longer used.
+
+        Args:
+            shared_auth_ref (weakref.ReferenceType[_SharedAuthentication]): Weak reference to the shared authentication
+                state, so the thread does not keep it alive.
+
+        Returns:
+            None
+
+        """
+        while True:
+            shared_auth = shared_auth_ref()
+            if shared_auth is None:
+                return
+
+            background_refresh_margin = 2 * shared_auth.token_refresh_margin
+            sleep_seconds = shared_auth.token_expires_in() - background_refresh_margin
+            if sleep_seconds <= 0:
+                try:
+                    shared_auth.refresh_access_token(background_refresh_margin)
+                    sleep_seconds = shared_auth.token_expires_in() - background_refresh_margin
+                except _ACCESS_TOKEN_REFRESH_ERRORS as e:
+                    logger.warning(
+                        f"Background access token refresh failed (retrying in "
+                        f"{cls._background_refresh_retry_delay} seconds): {e}"
+                    )
+                    sleep_seconds = cls._background_refresh_retry_delay
+
+            del shared_auth
+            time.sleep(min(max(sleep_seconds, 0.0), cls._background_refresh_max_sleep))
+
 
 # noinspection PyTypeChecker,PyUnresolvedReferences,GrazieInspection
 class YahooFantasySportsQuery(object):
     """Yahoo Fantasy Sports REST API query CLASS to retrieve all types of fantasy sports data.
+
+    Note:
+        A single YahooFantasySportsQuery instance is thread-safe and can be shared by multiple worker threads: all
+        per-request state (retries and back-off) is local to each request, token refreshes are serialized by a lock,
+        recording of executed queries is synchronized, and temporary output overrides (see
+        :meth:`suppress_json_str_output`) only apply to the thread that set them. The underlying authenticated session
+        (and its connection pool, sized with the `connection_pool_size` argument) is shared by all threads.
     """
 
     YFO = TypeVar("YFO", bound=YahooFantasyObject)
@@ -87,7 +318,18 @@ class YahooFantasySportsQuery(object):
                  browser_callback: bool = not runtime_environment_is_docker,
                  retries: int = 3,
                  backoff: int = 0,
-                 offline: bool = False):
+                 offline: bool = False,
+                 connection_pool_size: int = 10,
+                 requests_per_second: Optional[float] = None,
+                 max_concurrent_requests: Optional[int] = None,
+                 league_player_page_size: int = 25,
+                 adaptive_page_size: bool = False,
+                 coalesce_requests: bool = True,
+                 lazy_authentication: bool = True,
+                 share_authentication: bool = True,
+                 token_store_path: Optional[Union[Path, str]] = None,
+                 token_refresh_margin: float = 300.0,
+                 background_token_refresh: bool = False):
         """Instantiate a YahooQueryObject for running queries against the Yahoo fantasy REST API.
 
         Args:
@@ -122,6 +364,39 @@ class YahooFantasySportsQuery(object):
                 failed query request.
             offline (bool, optional): Boolean to run in offline mode (Only works if all needed Yahoo Fantasy data
                 has been previously saved locally using the Data module in data.py).
+            connection_pool_size (int, optional): Maximum number of pooled HTTP connections kept open by the
+                authenticated session, which should be at least the number of threads sharing this instance (defaults
+                to 10).
+            requests_per_second (float, optional): Maximum number of requests started per second, shared by this
+                instance and all instances derived from it with :meth:`for_league` (defaults to None for no limit).
+            max_concurrent_requests (int, optional): Maximum number of requests in flight at the same time, shared by
+                this instance and all instances derived from it with :meth:`for_league` (defaults to None for no
+                limit).
+            league_player_page_size (int, optional): Number of players retrieved per page by get_league_players
+                (defaults to 25, which is also the maximum page size Yahoo supports).
+            adaptive_page_size (bool, optional): Boolean to tune the league player page size from the observed latency,
+                payload size, and errors of the page requests (defaults to False), shared by this instance and all
+                instances derived from it with :meth:`for_league`.
+            coalesce_requests (bool, optional): Boolean to deduplicate identical concurrent queries (defaults to True),
+                so threads sharing this instance (or instances derived from it with :meth:`for_league`) that run the
+                same query at the same time share a single request (each of them getting its own copy of the retrieved
+                YFPY models).
+            lazy_authentication (bool, optional): Boolean to defer authentication (including any access token refresh
+                or browser prompt) until the first request is made (defaults to True), so constructing instances is
+                cheap. Authentication always happens immediately if save_token_data_to_env_file is True.
+            share_authentication (bool, optional): Boolean to share the access token and authenticated session (and its
+                connection pool) with all other instances in the same process using the same Yahoo consumer key,
+                consumer secret, and account (identified by its GUID if known, else by its refresh token or token store
+                path) (defaults to True). Instances sharing authentication use
+                the token store of the first instance that has one, the largest token_refresh_margin, and background
+                token refreshes if any instance requests them.
+            token_store_path (Path | str, optional): Path of a local JSON file in which to share the access token with
+                all other processes on the host using the same file (defaults to None), so a single token refresh
+                serves every worker process (see `yfpy.auth.TokenStore`).
+            token_refresh_margin (float, optional): Number of seconds before the access token expires at which it is
+                refreshed before making a request (defaults to 300.0).
+            background_token_refresh (bool, optional): Boolean to refresh the access token from a daemon thread at twice
+                the token_refresh_margin before it expires (defaults to False), so requests do not wait for refreshes.
 
         Attributes:
             _env_var_fallback (bool): Fall back to values retrieved from environment variables for any missing
@@ -138,6 +413,29 @@ class YahooFantasySportsQuery(object):
                 failed query request.
             _fantasy_content_data_field (str): The initial JSON field in which all Yahoo Fantasy Sports API responses
                 store the data output of the submitted query.
+            _connection_pool_size (int): Maximum number of pooled HTTP connections kept open by the authenticated
+                session.
+            _token_store (TokenStore): Token store sharing the access token across processes (None if not shared).
+            _token_refresh_margin (float): Number of seconds before the access token expires at which it is refreshed.
+            _background_token_refresh (bool): Boolean to refresh the access token from a daemon thread.
+            _shared_auth (_SharedAuthentication): Authentication state (OAuth2 client and lock) shared with all
+                instances derived from this one with :meth:`for_league` (and, if share_authentication is True, with all
+                instances for the same Yahoo account).
+            _rate_limiter (RateLimiter): Request rate and concurrency limiter shared with all instances derived from
+                this one with :meth:`for_league`.
+            _league_player_page_size (AdaptivePageSize): Page size of get_league_players shared with all instances
+                derived from this one with :meth:`for_league`.
+            _coalesce_requests (bool): Boolean to deduplicate identical concurrent queries.
+            _in_flight_queries (SingleFlight): Identical concurrent query deduplication shared with all instances
+                derived from this one with :meth:`for_league`.
+            _executed_queries_lock (threading.Lock): Lock synchronizing updates to executed_queries across threads.
+            _failed_league_player_retrievals_lock (threading.Lock): Lock synchronizing updates to
+                failed_league_player_retrievals across threads.
+            _thread_local (threading.local): Thread-local storage for per-thread output overrides.
+            _pinned_league_key (str): League key resolved once and reused by all queries of a concurrent multi-week or
+                multi-date query while league_key is not set (None otherwise).
+            _league_key_pin_count (int): Number of concurrent queries currently using the pinned league key.
+            _league_key_pin_lock (threading.Lock): Lock synchronizing the pinned league key across threads.
             league_id (str): League ID of selected Yahoo Fantasy league.
             game_code (str): Game code of selected Yahoo Fantasy game corresponding to a specific sport (refers to the
                 current season if used as the value for game_key), where "nfl" is for fantasy football, "nhl" is for
@@ -146,6 +444,8 @@ class YahooFantasySportsQuery(object):
                 defaulting to the game ID for the current year.
             league_key (str): The Yahoo Fantasy Sports league key formatted as <game_id>.l.<league_id>.
             executed_queries (list[dict[str, Any]]): List of completed queries and their responses.
+            failed_league_player_retrievals (list[dict[str, Any]]): List of league players that could not be retrieved
+                by get_league_players, with the league key, player index, URL, and error message of each failure.
             all_output_as_json_str (bool): Option to automatically convert all query output to JSON strings.
             offline (bool): Boolean to run in offline mode (Only works if all needed Yahoo Fantasy data has been
                 previously saved locally using the Data module in data.py).
@@ -213,6 +513,42 @@ class YahooFantasySportsQuery(object):
 
         self._fantasy_content_data_field: str = "fantasy_content"
 
+        # explicitly check for truthy/falsy value
+        self.offline: bool = True if offline is True else False
+
+        self._connection_pool_size: int = connection_pool_size
+        self._token_store: Optional[TokenStore] = TokenStore(token_store_path) if token_store_path else None
+        self._token_refresh_margin: float = token_refresh_margin
+        self._background_token_refresh: bool = background_token_refresh
+        if share_authentication and not self.offline:
+            refresh_token = self._yahoo_access_token_dict.get(
+                "refresh_token", os.environ.get("YAHOO_REFRESH_TOKEN", None) if self._env_var_fallback else None
+            )
+            self._shared_auth: _SharedAuthentication = _SharedAuthentication.for_account(
+                self._yahoo_consumer_key,
+                self._yahoo_consumer_secret,
+                self._yahoo_access_token_dict.get(
+                    "guid", os.environ.get("YAHOO_GUID", None) if self._env_var_fallback else None
+                ),
+                refresh_token or (str(self._token_store.token_file_path.resolve()) if self._token_store else None)
+            )
+        else:
+            self._shared_auth: _SharedAuthentication = _SharedAuthentication()
+        with self._shared_auth.lock:
+            self._reconcile_shared_auth_settings()
+        self._rate_limiter: RateLimiter = RateLimiter(requests_per_second, max_concurrent_requests)
+        self._league_player_page_size: AdaptivePageSize = AdaptivePageSize(
+            league_player_page_size, max_page_size=max(league_player_page_size, 25), adaptive=adaptive_page_size
+        )
+        self._coalesce_requests: bool = coalesce_requests
+        self._in_flight_queries: SingleFlight = SingleFlight()
+        self._executed_queries_lock: threading.Lock = threading.Lock()
+        self._failed_league_player_retrievals_lock: threading.Lock = threading.Lock()
+        self._thread_local: threading.local = threading.local()
+        self._pinned_league_key: Optional[str] = None
+        self._league_key_pin_count: int = 0
+        self._league_key_pin_lock: threading.Lock = threading.Lock()
+
         self.league_id: str = league_id
         self.game_code: str = (
             game_code if game_code in yahoo_fantasy_sports_game_codes else retrieve_game_code_from_user()
@@ -220,19 +556,78 @@ class YahooFantasySportsQuery(object):
         self.game_id: int = game_id
         self.league_key: str = None
         self.executed_queries: List[Dict[str, Any]] = []
+        self.failed_league_player_retrievals: List[Dict[str, Any]] = []
 
         # explicitly check for truthy/falsy value
         self.all_output_as_json_str: bool = True if all_output_as_json_str is True else False
 
-        # explicitly check for truthy/falsy value
-        self.offline: bool = True if offline is True else False
-
-        if not self.offline:
+        if not self.offline and (not lazy_authentication or save_token_data_to_env_file):
             self._authenticate()
 
             if save_token_data_to_env_file:
                 self.save_access_token_data_to_env_file(env_file_location)
 
+    @property
+    def oauth(self) -> OAuth2:
+        """The authenticated yahoo-oauth OAuth2 client shared with all instances derived from this one (authenticating
+        first if no instance sharing it has authenticated yet).
+
+        Returns:
+            OAuth2: The yahoo-oauth OAuth2 client.
+
+        """
+        if self._shared_auth.oauth is None and not self.offline:
+            self._authenticate()
+        return self._shared_auth.oauth
+
+    @oauth.setter
+    def oauth(self, oauth: OAuth2) -> None:
+        self._shared_auth.oauth = oauth
+
+    def for_league(self, league_id: str, game_id: Optional[int] = None) -> "YahooFantasySportsQuery":
+        """Create a query instance for a different league that reuses this instance's authentication.
+
+        Note:
+            The returned instance shares the OAuth2 client (and its session and connection pool), token refreshes, and
+            rate limiter of this instance, so no additional authentication is needed. Executed queries are tracked
+            separately for each instance.
+
+        Args:
+            league_id (str): League ID of the selected Yahoo Fantasy league.
+            game_id (int, optional): Game ID of the selected Yahoo Fantasy game (defaults to the game ID of this
+                instance).
+
+        Examples:
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(league_id="######", game_code="nfl", game_id=449)
+            >>> other_league_query = query.for_league("######")
+            >>> other_league_query.get_league_standings()
+            Standings({...})
+
+        Returns:
+            YahooFantasySportsQuery: A YahooFantasySportsQuery instance for the selected league.
+
+        """
+        league_query = copy.copy(self)
+        league_query.league_id = league_id
+        league_query.executed_queries = []
+        league_query.failed_league_player_retrievals = []
+        league_query._executed_queries_lock = threading.Lock()
+        league_query._failed_league_player_retrievals_lock = threading.Lock()
+        league_query._thread_local = threading.local()
+        league_query._pinned_league_key = None
+        league_query._league_key_pin_count = 0
+        league_query._league_key_pin_lock = threading.Lock()
+
+        if game_id is not None and game_id != self.game_id:
+            league_query.game_id = game_id
+            league_query.league_key = None
+        elif self.league_key:
+            # reuse the game key of this instance's league key to avoid looking it up again for the new league
+            league_query.league_key = f"{self.league_key.split('.l.')[0]}.l.{league_id}"
+
+        return league_query
+
     def _get_dict_from_access_token_json(self, yahoo_access_token_json: Union[str, Dict]) -> Dict[str, Any]:
         """Creates a dictionary of Yahoo access token fields extracted from provided JSON (or a provided dictionary).
 
@@ -289,7 +684,56 @@ class YahooFantasySportsQuery(object):
         return yahoo_access_token_dict
 
     def _authenticate(self) -> None:
-        """Authenticate with the Yahoo Fantasy Sports REST API using OAuth2.
+        """Authenticate with the Yahoo Fantasy Sports REST API using OAuth2, unless an instance sharing the
+        authentication state has already done so.
+
+        Returns:
+            None
+
+        """
+        with self._shared_auth.lock:
+            if self._shared_auth.oauth is None:
+                self._authenticate_oauth()
+            else:
+                self._update_access_token_dict()
+
+    def _reconcile_shared_auth_settings(self) -> None:
+        """Apply the token settings of this instance to the authentication state it shares with other instances using
+        the same Yahoo account.
+
+        Note:
+            This method must only be called while holding the authentication lock. A token store is adopted if the
+            shared authentication state has none (and conflicting token stores are reported), the access token is
+            refreshed at the largest token_refresh_margin of all instances, and background token refreshes are started
+            if any instance requests them.
+
+        Returns:
+            None
+
+        """
+        shared_auth = self._shared_auth
+        if self._token_store is not None:
+            if shared_auth.token_store is None:
+                shared_auth.token_store = self._token_store
+            elif shared_auth.token_store.token_file_path.resolve() != self._token_store.token_file_path.resolve():
+                logger.warning(
+                    f"Ignoring token store {self._token_store.token_file_path}, since the access token of this Yahoo "
+                    f"account is already shared with token store {shared_auth.token_store.token_file_path}."
+                )
+
+        if self._token_refresh_margin > shared_auth.token_refresh_margin:
+            shared_auth.token_refresh_margin = self._token_refresh_margin
+
+        if self._background_token_refresh:
+            shared_auth.background_token_refresh = True
+            if shared_auth.oauth is not None:
+                shared_auth.start_background_refresh()
+
+    def _authenticate_oauth(self) -> None:
+        """Create the OAuth2 client, refresh its access token if needed, and share its session across threads.
+
+        Note:
+            This method must only be called while holding the authentication lock (see :meth:`_authenticate`).
 
         Returns:
             None
@@ -298,47 +742,83 @@ class YahooFantasySportsQuery(object):
         logger.debug("Authenticating with Yahoo.")
 
         # provide Yahoo access token fields if available or search for them in environment variables if env_var_fallback
-        # is True, and then complete OAuth2 3-legged handshake by either refreshing existing OAuth2 refresh token or
-        # requesting account access and returning a verification code to input to the command line prompt
-        self.oauth = OAuth2(
-            self._yahoo_consumer_key,
-            self._yahoo_consumer_secret,
-            access_token=self._yahoo_access_token_dict.get(
+        # is True
+        token_kwargs = {
+            "access_token": self._yahoo_access_token_dict.get(
                 "access_token",
                 os.environ.get("YAHOO_ACCESS_TOKEN", None) if self._env_var_fallback else None
             ),
-            guid=self._yahoo_access_token_dict.get(
+            "guid": self._yahoo_access_token_dict.get(
                 "guid",
                 os.environ.get("YAHOO_GUID", None) if self._env_var_fallback else None
             ),
-            refresh_token=self._yahoo_access_token_dict.get(
+            "refresh_token": self._yahoo_access_token_dict.get(
                 "refresh_token",
                 os.environ.get("YAHOO_REFRESH_TOKEN", None) if self._env_var_fallback else None
             ),
-            token_time=self._yahoo_access_token_dict.get(
+            "token_time": self._yahoo_access_token_dict.get(
                 "token_time",
                 float(os.environ.get("YAHOO_TOKEN_TIME", 0.0)) if self._env_var_fallback else 0.0
             ),
-            token_type=self._yahoo_access_token_dict.get(
+            "token_type": self._yahoo_access_token_dict.get(
                 "token_type",
                 os.environ.get("YAHOO_TOKEN_TYPE", None) if self._env_var_fallback else None
             ),
-            browser_callback=self._browser_callback,
-            store_file=False
+        }
+
+        # hold the token store lock while authenticating, so concurrently starting processes reuse the access token of
+        # whichever process refreshes it first
+        token_store = self._shared_auth.token_store
+        with token_store.lock() if token_store is not None else nullcontext():
+            if token_store is not None:
+                stored_token_dict = token_store.load(self._yahoo_consumer_key, token_kwargs["guid"])
+                if get_token_expires_in(stored_token_dict) > get_token_expires_in(token_kwargs):
+                    logger.debug(f"Using access token stored in {token_store.token_file_path}.")
+                    token_kwargs.update({field: stored_token_dict.get(field) for field in token_kwargs.keys()})
+
+            # complete OAuth2 3-legged handshake by either refreshing existing OAuth2 refresh token or requesting
+            # account access and returning a verification code to input to the command line prompt
+            self.oauth = OAuth2(
+                self._yahoo_consumer_key,
+                self._yahoo_consumer_secret,
+                **token_kwargs,
+                browser_callback=self._browser_callback,
+                store_file=False
+            )
+
+            # refresh the access token ahead of its expiry (and save it to the token store)
+            self._shared_auth.refresh_access_token(self._shared_auth.token_refresh_margin)
+
+        # size the connection pool of the authenticated session so it can be shared by multiple threads
+        connection_pool_adapter = HTTPAdapter(
+            pool_connections=self._connection_pool_size,
+            pool_maxsize=self._connection_pool_size
         )
+        self.oauth.session.mount("https://", connection_pool_adapter)
+        self.oauth.session.mount("http://", connection_pool_adapter)
+
+        self._update_access_token_dict()
+
+        if self._shared_auth.background_token_refresh:
+            self._shared_auth.start_background_refresh()
 
-        if not self.oauth.token_is_valid():
-            self.oauth.refresh_access_token()
+    def _update_access_token_dict(self) -> None:
+        """Update the Yahoo access token fields of this instance from the shared OAuth2 client.
 
+        Returns:
+            None
+
+        """
+        oauth = self._shared_auth.oauth
         self._yahoo_access_token_dict.update(
             {
-                "access_token": self.oauth.access_token,
-                "consumer_key": self.oauth.consumer_key,
-                "consumer_secret": self.oauth.consumer_secret,
-                "guid": self.oauth.guid,
-                "refresh_token": self.oauth.refresh_token,
-                "token_time": self.oauth.token_time,
-                "token_type": self.oauth.token_type,
+                "access_token": oauth.access_token,
+                "consumer_key": oauth.consumer_key,
+                "consumer_secret": oauth.consumer_secret,
+                "guid": oauth.guid,
+                "refresh_token": oauth.refresh_token,
+                "token_time": oauth.token_time,
+                "token_type": oauth.token_type,
             }
         )
 
@@ -395,6 +875,10 @@ class YahooFantasySportsQuery(object):
             # exit method without saving Yahoo access token data when no env_file_location argument is provided
             return
 
+        # use the current access token, which may have been refreshed by another instance sharing it
+        if self._shared_auth.oauth is not None:
+            self._update_access_token_dict()
+
         env_file_content = self._retrieve_env_file_contents(env_file_path)
 
         if save_json_to_var_only:
@@ -418,9 +902,46 @@ class YahooFantasySportsQuery(object):
                 else:
                     env_file.write(f"{k.upper()}={v}\n")
 
+    @contextmanager
+    def suppress_json_str_output(self) -> Iterator[None]:
+        """Context manager to temporarily return query output as YFPY models for the current thread only, even when
+        all_output_as_json_str is True.
+
+        Examples:
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(league_id="######", game_code="nfl", all_output_as_json_str=True)
+            >>> with query.suppress_json_str_output():
+            ...     query.get_league_metadata()
+            League({...})
+
+        Returns:
+            Iterator[None]: Context in which query output is not converted to JSON strings.
+
+        """
+        previous_suppression_depth = getattr(self._thread_local, "json_str_output_suppression_depth", 0)
+        self._thread_local.json_str_output_suppression_depth = previous_suppression_depth + 1
+        try:
+            yield
+        finally:
+            self._thread_local.json_str_output_suppression_depth = previous_suppression_depth
+
+    def _output_as_json_str(self) -> bool:
+        """Check whether query output for the current thread should be converted to JSON strings.
+
+        Returns:
+            bool: True if all_output_as_json_str is set and it is not suppressed for the current thread, else False.
+
+        """
+        return self.all_output_as_json_str and not getattr(self._thread_local, "json_str_output_suppression_depth", 0)
+
     def get_response(self, url: str) -> Response:
         """Retrieve Yahoo Fantasy Sports data from the REST API.
 
+        Note:
+            Retries and back-off are tracked per request, so concurrent requests from multiple threads sharing this
+            instance do not consume each other's retries. A request rejected with a 401 status code (such as when the
+            access token expired) refreshes the access token and is replayed once without using up a retry.
+
         Args:
             url (str): REST API request URL string.
 
@@ -428,58 +949,85 @@ class YahooFantasySportsQuery(object):
             Response: API response from Yahoo Fantasy Sports API request.
 
         """
-        logger.debug(f"Making request to URL: {url}")
-        response: Response = self.oauth.session.get(url, params={"format": "json"})
-
-        status_code = response.status_code
-        # when you exceed Yahoo's allowed data request limits, they throw a request status code of 999
-        if status_code == 999:
-            raise HTTPError("Yahoo data unavailable due to rate limiting. Please try again later.")
+        retries_remaining = self._retries
+        backoff = self._backoff
+        replayed_unauthorized_request = False
+        while True:
+            logger.debug("Making request to URL: %s", url)
+            oauth = self.oauth
+            if self._shared_auth.token_expires_in() <= self._shared_auth.token_refresh_margin:
+                self._shared_auth.refresh_access_token(self._shared_auth.token_refresh_margin)
+            access_token = oauth.access_token
+            with self._rate_limiter.limit():
+                # time only the request itself (excluding rate limiting waits and retry back-off)
+                request_start_time = time.monotonic()
+                response: Response = oauth.session.get(url, params={"format": "json"})
+                self._thread_local.last_response_seconds = time.monotonic() - request_start_time
+
+            status_code = response.status_code
+            response_content = getattr(response, "content", None)
+            self._thread_local.last_response_bytes = len(response_content) if response_content is not None else None
+
+            # when you exceed Yahoo's allowed data request limits, they throw a request status code of 999
+            if status_code == 999:
+                raise HTTPError("Yahoo data unavailable due to rate limiting. Please try again later.")
+
+            if status_code == 401 and not replayed_unauthorized_request:
+                replayed_unauthorized_request = True
+                try:
+                    self._shared_auth.refresh_rejected_access_token(access_token)
+                except _ACCESS_TOKEN_REFRESH_ERRORS as e:
+                    logger.warning(f"Unable to refresh access token rejected by request for URL {url}: {e}")
+                else:
+                    logger.debug("Replaying request with refreshed access token for URL: %s", url)
+                    continue
 
-        if status_code == 401:
-            self._authenticate()
+            response_json = {}
+            try:
+                response_json = response.json()
+                logger.debug("Response (JSON): %s", LogPayload(response_json))
+            except JSONDecodeError:
+                response.raise_for_status()
 
-        response_json = {}
-        try:
-            response_json = response.json()
-            logger.debug(f"Response (JSON): {response_json}")
-        except JSONDecodeError:
-            response.raise_for_status()
+            try:
+                if (status_code // 100) != 2:
+                    # handle if the yahoo query returns an error
+                    if response_json.get("error"):
+                        response_error_msg = response_json.get("error").get("description")
+                        error_msg = f"Attempt to retrieve data at URL {response.url} failed with error: " \
+                                    f"\"{response_error_msg}\""
+                        logger.error(error_msg)
+                        raise YahooFantasySportsDataNotFound(error_msg, url=response.url)
 
-        try:
-            if (status_code // 100) != 2:
-                # handle if the yahoo query returns an error
-                if response_json.get("error"):
-                    response_error_msg = response_json.get("error").get("description")
-                    error_msg = f"Attempt to retrieve data at URL {response.url} failed with error: " \
-                                f"\"{response_error_msg}\""
-                    logger.error(error_msg)
-                    raise YahooFantasySportsDataNotFound(error_msg, url=response.url)
-
-            response.raise_for_status()
-
-        except HTTPError as e:
-            # retry with incremental back-off
-            if self._retries > 0:
-                self._retries -= 1
-                self._backoff += 1
-                logger.warning(f"Request for URL {url} failed with status code {response.status_code}. "
-                               f"Retrying {self._retries} more time{'s' if self._retries > 1 else ''}...")
-                time.sleep(0.3 * self._backoff)
-                response = self.get_response(url)
-            else:
-                # log error and terminate query if status code is not 200 after 3 retries
-                logger.error(f"Request failed with status code: {response.status_code} - {e}")
                 response.raise_for_status()
 
+            except HTTPError as e:
+                # retry with incremental back-off
+                if retries_remaining > 0:
+                    retries_remaining -= 1
+                    backoff += 1
+                    logger.warning(
+                        f"Request for URL {url} failed with status code {response.status_code}. "
+                        f"Retrying {retries_remaining} more time{'s' if retries_remaining != 1 else ''}..."
+                    )
+                    time.sleep(0.3 * backoff)
+                    continue
+                else:
+                    # log error and terminate query if status code is not 200 after all retries
+                    logger.error(f"Request failed with status code: {response.status_code} - {e}")
+                    response.raise_for_status()
+
+            break
+
         raw_response_data = response_json.get(self._fantasy_content_data_field)
 
         # extract data from "fantasy_content" field if it exists
         if raw_response_data:
-            logger.debug(f"Data fetched with query URL: {response.url}")
+            logger.debug("Data fetched with query URL: %s", response.url)
             logger.debug(
-                f"Response (Yahoo fantasy data extracted from: "
-                f"\"{self._fantasy_content_data_field}\"): {raw_response_data}"
+                "Response (Yahoo fantasy data extracted from: \"%s\"): %s",
+                self._fantasy_content_data_field,
+                LogPayload(raw_response_data)
             )
         else:
             error_msg = f"No data found at URL {response.url} when attempting extraction from field: " \
@@ -489,6 +1037,71 @@ class YahooFantasySportsQuery(object):
 
         return response
 
+    def _retrieve_query_data(self, url: str, data_key_list: Union[List[str], List[List[str]]],
+                             data_type_class: Type = None) -> Union[YFO, List[YFO], Dict[str, YFO]]:
+        """Retrieve, extract, unpack, and cast the data of a query from the Yahoo fantasy sports REST API.
+
+        Args:
+            url (str): REST API request URL string.
+            data_key_list (list[str] | list[list[str]]): List of keys used to extract the specific data desired by the
+                given query (see `query`).
+            data_type_class (Type, optional): Highest level data model type (if one exists for the retrieved data).
+
+        Returns:
+            object: Model class instance from yfpy/models.py, dictionary, or list (depending on query), with unpacked
+            and parsed response data.
+
+        """
+        response = self.get_response(url)
+        raw_response_data = response.json().get(self._fantasy_content_data_field)
+
+        # iterate through list of data keys and drill down to final desired data field
+        for i in range(len(data_key_list)):
+            if isinstance(raw_response_data, list):
+                if isinstance(data_key_list[i], list):
+                    reformatted = reformat_json_list(raw_response_data)
+                    raw_response_data = [
+                        {data_key_list[i][0]: reformatted[data_key_list[i][0]]},
+                        {data_key_list[i][1]: reformatted[data_key_list[i][1]]}
+                    ]
+                else:
+                    raw_response_data = reformat_json_list(raw_response_data)[data_key_list[i]]
+            else:
+                if isinstance(data_key_list[i], list):
+                    raw_response_data = [
+                        {data_key_list[i][0]: raw_response_data[data_key_list[i][0]]},
+                        {data_key_list[i][1]: raw_response_data[data_key_list[i][1]]}
+                    ]
+                else:
+                    raw_response_data = raw_response_data.get(data_key_list[i])
+
+        if raw_response_data:
+            logger.debug(
+                "Response (Yahoo fantasy data extracted from: %s): %s", data_key_list, LogPayload(raw_response_data)
+            )
+        else:
+            error_msg = f"No data found when attempting extraction from fields: {data_key_list}"
+            logger.error(error_msg)
+            raise YahooFantasySportsDataNotFound(error_msg, payload=data_key_list, url=response.url)
+
+        # unpack, parse, and assign data types to all retrieved data content
+        unpacked = unpack_data(raw_response_data, YahooFantasyObject)
+        logger.debug(
+            "Unpacked and parsed JSON (Yahoo fantasy data wth parent type: %s):\n%s",
+            data_type_class,
+            LogPayload(unpacked)
+        )
+
+        with self._executed_queries_lock:
+            self.executed_queries.append({
+                "url": response.url,
+                "response_status_code": response.status_code,
+                "response": response
+            })
+
+        # cast the highest level of data to type corresponding to query (if type exists)
+        return data_type_class(unpacked) if data_type_class else unpacked
+
     # noinspection GrazieInspection
     def query(self, url: str, data_key_list: Union[List[str], List[List[str]]], data_type_class: Type = None,
               sort_function: Callable = None) -> (Union[str, YFO, List[YFO], Dict[str, YFO], None]):
@@ -511,49 +1124,15 @@ class YahooFantasySportsQuery(object):
 
         """
         if not self.offline:
-            response = self.get_response(url)
-            raw_response_data = response.json().get(self._fantasy_content_data_field)
-
-            # iterate through list of data keys and drill down to final desired data field
-            for i in range(len(data_key_list)):
-                if isinstance(raw_response_data, list):
-                    if isinstance(data_key_list[i], list):
-                        reformatted = reformat_json_list(raw_response_data)
-                        raw_response_data = [
-                            {data_key_list[i][0]: reformatted[data_key_list[i][0]]},
-                            {data_key_list[i][1]: reformatted[data_key_list[i][1]]}
-                        ]
-                    else:
-                        raw_response_data = reformat_json_list(raw_response_data)[data_key_list[i]]
-                else:
-                    if isinstance(data_key_list[i], list):
-                        raw_response_data = [
-                            {data_key_list[i][0]: raw_response_data[data_key_list[i][0]]},
-                            {data_key_list[i][1]: raw_response_data[data_key_list[i][1]]}
-                        ]
-                    else:
-                        raw_response_data = raw_response_data.get(data_key_list[i])
-
-            if raw_response_data:
-                logger.debug(f"Response (Yahoo fantasy data extracted from: {data_key_list}): {raw_response_data}")
+            if self._coalesce_requests:
+                # share a single request with identical concurrent queries (each of which gets its own copy of the
+                # retrieved models)
+                query_data = self._in_flight_queries.do(
+                    (url, json.dumps(data_key_list), data_type_class),
+                    lambda: self._retrieve_query_data(url, data_key_list, data_type_class)
+                )
             else:
-                error_msg = f"No data found when attempting extraction from fields: {data_key_list}"
-                logger.error(error_msg)
-                raise YahooFantasySportsDataNotFound(error_msg, payload=data_key_list, url=response.url)
-
-            # unpack, parse, and assign data types to all retrieved data content
-            unpacked = unpack_data(raw_response_data, YahooFantasyObject)
-            logger.debug(
-                f"Unpacked and parsed JSON (Yahoo fantasy data wth parent type: {data_type_class}):\n{unpacked}")
-
-            self.executed_queries.append({
-                "url": response.url,
-                "response_status_code": response.status_code,
-                "response": response
-            })
-
-            # cast the highest level of data to type corresponding to query (if type exists)
-            query_data = data_type_class(unpacked) if data_type_class else unpacked
+                query_data = self._retrieve_query_data(url, data_key_list, data_type_class)
 
             # sort data when applicable
             if sort_function and not isinstance(query_data, dict):
@@ -565,7 +1144,7 @@ class YahooFantasySportsQuery(object):
                 if last_data_key.endswith("s"):
                     query_data = [el[last_data_key[:-1]] for el in query_data]
 
-            if self.all_output_as_json_str:
+            if self._output_as_json_str():
                 return jsonify_data(query_data)
             else:
                 return query_data
@@ -574,6 +1153,111 @@ class YahooFantasySportsQuery(object):
             logger.error("Cannot run Yahoo query while using offline mode! Please try again with offline=False.")
             return None
 
+    def _query_concurrently(self, query_function: Callable[[Any], Any], query_keys: Iterable[Hashable],
+                            max_workers: int = 8, pin_league_key: bool = True) -> Union[str, Dict[Hashable, Any]]:
+        """Run a single-key query function concurrently for multiple keys (such as weeks or dates).
+
+        Args:
+            query_function (Callable): Query function taking a single key (such as a week or a date) as its argument.
+            query_keys (Iterable[Hashable]): Keys for which to run the query function.
+            max_workers (int, optional): Maximum number of queries run concurrently (defaults to 8).
+            pin_league_key (bool, optional): Boolean to resolve the league key once for all queries (defaults to True,
+                and should be False for query functions that do not use the league key).
+
+        Returns:
+            dict[Hashable, Any]: Dictionary with the query keys as keys and the respective query results as values (or
+            a JSON string of that dictionary if all_output_as_json_str is True).
+
+        """
+        query_keys = list(dict.fromkeys(query_keys))
+
+        def _query_key(query_key: Hashable) -> Any:
+            # retrieve YFPY models in the worker thread so JSON string conversion happens once for all results
+            with self.suppress_json_str_output():
+                return query_function(query_key)
+
+        # resolve the league key once instead of once per query key
+        with self._pin_league_key() if pin_league_key else nullcontext():
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(query_keys)))) as executor:
+                query_data = dict(zip(query_keys, executor.map(_query_key, query_keys)))
+
+        if self._output_as_json_str():
+            return jsonify_data(query_data)
+        else:
+            return query_data
+
+    @contextmanager
+    def _pin_league_key(self) -> Iterator[None]:
+        """Context manager resolving the league key once (if league_key is not set) and reusing it for all queries run
+        within the context, so queries fanned out across weeks or dates do not each look up the game key again.
+
+        Returns:
+            Iterator[None]: Context in which get_league_key returns the pinned league key.
+
+        """
+        if self.league_key:
+            yield
+            return
+
+        with self._league_key_pin_lock:
+            pinned_league_key = self._pinned_league_key
+        if pinned_league_key is None:
+            pinned_league_key = self.get_league_key()
+
+        with self._league_key_pin_lock:
+            self._pinned_league_key = self._pinned_league_key or pinned_league_key
+            self._league_key_pin_count += 1
+        try:
+            yield
+        finally:
+            with self._league_key_pin_lock:
+                self._league_key_pin_count -= 1
+                if not self._league_key_pin_count:
+                    self._pinned_league_key = None
+
+    def build_query(self) -> QueryBuilder:
+        """Start a composed query that retrieves multiple resources, filters, and subresources with a single request.
+
+        Examples:
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(league_id="######", game_code="nfl")
+            >>> query.build_query().league().out("settings", "standings").fetch()
+            League({
+              ...,
+              "settings": Settings({...}),
+              "standings": Standings({...}),
+              ...
+            })
+            >>> query.build_query().league().teams().roster(week=1).players().stats(type="week", week=1).fetch()
+            [
+              Team({...}),
+              ...
+            ]
+
+        Returns:
+            QueryBuilder: Query builder for this query object (see yfpy.builder.QueryBuilder).
+
+        """
+        return QueryBuilder(self)
+
+    @staticmethod
+    def _get_dates_in_range(start_date: str, end_date: str) -> List[str]:
+        """Create a list of all dates from a start date through an end date.
+
+        Args:
+            start_date (str): First date of the range. REQUIRED FORMAT: YYYY-MM-DD (Ex. 2011-05-01)
+            end_date (str): Last date of the range (inclusive). REQUIRED FORMAT: YYYY-MM-DD (Ex. 2011-05-07)
+
+        Returns:
+            list[str]: List of date strings formatted as YYYY-MM-DD.
+
+        """
+        first_date = date.fromisoformat(start_date)
+        last_date = date.fromisoformat(end_date)
+        if last_date < first_date:
+            raise ValueError(f"End date {end_date} is before start date {start_date}.")
+        return [str(first_date + timedelta(days=day)) for day in range((last_date - first_date).days + 1)]
+
     def get_all_yahoo_fantasy_game_keys(self) -> List[Game]:
         """Retrieve all Yahoo Fantasy Sports game keys by ID (from year of inception to present), sorted by season/year.
 
@@ -627,18 +1311,11 @@ class YahooFantasySportsQuery(object):
             str: The game key for a Yahoo Fantasy Sports game specified by season.
 
         """
-        all_output_as_json = False
-        if self.all_output_as_json_str:
-            self.all_output_as_json_str = False
-            all_output_as_json = True
-
-        game_key = self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/games;game_codes={self.game_code};seasons={season}",
-            ["games"]
-        ).get("game").game_key
-
-        if all_output_as_json:
-            self.all_output_as_json_str = True
+        with self.suppress_json_str_output():
+            game_key = self.query(
+                f"https://fantasysports.yahooapis.com/fantasy/v2/games;game_codes={self.game_code};seasons={season}",
+                ["games"]
+            ).get("game").game_key
 
         return game_key
 
@@ -1023,6 +1700,8 @@ class YahooFantasySportsQuery(object):
         if not self.league_key:
             if season:
                 return f"{self.get_game_key_by_season(season)}.l.{self.league_id}"
+            elif self._pinned_league_key:
+                return self._pinned_league_key
             elif self.game_id:
                 return f"{self.get_game_metadata_by_game_id(self.game_id).game_key}.l.{self.league_id}"
             else:
@@ -1333,6 +2012,46 @@ class YahooFantasySportsQuery(object):
             League
         )
 
+    def get_league_snapshot(self) -> League:
+        """Retrieve metadata, settings, standings, current scoreboard, and all team rosters for chosen league with two
+        composed requests (instead of one request per resource and team).
+
+        Examples:
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(league_id="######", game_code="nfl")
+            >>> query.get_league_snapshot()
+            League({
+              "league_key": "331.l.729259",
+              ...,
+              "settings": Settings({...}),
+              "standings": Standings({...}),
+              "scoreboard": Scoreboard({...}),
+              "teams": [
+                Team({..., "roster": Roster({...})}),
+                ...
+              ]
+            })
+
+        Returns:
+            League: YFPY League instance with its settings, standings, scoreboard, and teams (with rosters).
+
+        """
+        with self.suppress_json_str_output():
+            league = self.build_query().league().out("settings", "standings", "scoreboard").fetch()
+            teams = self.build_query().league().teams().out("roster").fetch()
+
+        if isinstance(teams, dict):
+            # a single team is unpacked as a dictionary containing the team
+            teams = [teams.get("team")]
+
+        # rebuild the league from its data so the teams are included when the league is serialized
+        league = League({**league._extracted_data, "teams": teams})
+
+        if self._output_as_json_str():
+            return jsonify_data(league)
+        else:
+            return league
+
     def get_league_settings(self) -> Settings:
         """Retrieve settings (rules) for chosen league.
 
@@ -1493,79 +2212,279 @@ class YahooFantasySportsQuery(object):
             })
 
         Returns:
-            Standings: YFPY Standings instance.
+            Standings: YFPY Standings instance.
+
+        """
+        return self.query(
+            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/standings",
+            ["league", "standings"],
+            Standings
+        )
+
+    def get_league_teams(self) -> List[Team]:
+        """Retrieve teams for chosen league.
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(league_id="######", game_code="nfl")
+            >>> query.get_league_teams()
+            [
+              Team({
+                "clinched_playoffs": 1,
+                "draft_grade": "B",
+                "draft_position": 4,
+                "draft_recap_url":
+                  "https://football.fantasysports.yahoo.com/archive/nfl/2014/729259/1/draftrecap",
+                "has_draft_grade": 1,
+                "league_scoring_type": "head",
+                "managers": {
+                  "manager": {
+                    "guid": "BMACD7S5UXV7JIQX4PGGUVQJAU",
+                    "manager_id": "1",
+                    "nickname": "--hidden--"
+                  }
+                },
+                "name": "Hellacious Hill 12",
+                "number_of_moves": "71",
+                "number_of_trades": 0,
+                "roster_adds": {
+                  "coverage_type": "week",
+                  "coverage_value": "17",
+                  "value": "0"
+                },
+                "team_id": "1",
+                "team_key": "331.l.729259.t.1",
+                "team_logos": {
+                  "team_logo": {
+                    "size": "large",
+                    "url": "https://ct.yimg.com/cy/1441/24935131299_a8242dab70_192sq.jpg?ct=fantasy"
+                  }
+                },
+                "url": "https://football.fantasysports.yahoo.com/archive/nfl/2014/729259/1",
+                "waiver_priority": 9
+              }),
+              ...,
+              Team({...})
+            ]
+
+        Returns:
+            list[Team]: List of YFPY Team instances.
+
+        """
+        return self.query(
+            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/teams",
+            ["league", "teams"]
+        )
+
+    def _get_league_teams_by_team_key(self, league_query: QueryBuilder) -> Dict[str, Team]:
+        """Run a composed league teams query and key the retrieved teams by team key.
+
+        Args:
+            league_query (QueryBuilder): Composed query starting with the teams collection of the league.
+
+        Returns:
+            dict[str, Team]: Dictionary with team keys as keys and YFPY Team instances as values.
+
+        """
+        with self.suppress_json_str_output():
+            teams = league_query.fetch()
+        if isinstance(teams, dict):
+            # a single team is unpacked as a dictionary containing the team
+            teams = [teams.get("team")]
+        return {team.team_key: team for team in teams}
+
+    def get_league_teams_roster_player_stats_by_week(
+            self, chosen_week: Union[int, str] = "current") -> Dict[str, List[Player]]:
+        """Retrieve rosters with player stats of all teams by week for chosen league with a single request (instead of
+        calling get_team_roster_player_stats_by_week for every team).
+
+        Args:
+            chosen_week (int): Selected week for which to retrieve data.
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(league_id="######", game_code="nfl")
+            >>> query.get_league_teams_roster_player_stats_by_week(1)
+            {
+              "331.l.729259.t.1": [
+                Player({
+                  ...,
+                  "player_key": "331.p.8256",
+                  "player_points": PlayerPoints({...}),
+                  "player_stats": PlayerStats({...}),
+                  ...
+                }),
+                ...
+              ],
+              ...
+            }
+
+        Returns:
+            dict[str, list[Player]]: Dictionary with team keys as keys and lists of YFPY Player instances containing
+                attribute "player_stats" as values.
+
+        """
+        teams = self._get_league_teams_by_team_key(
+            self.build_query().league().teams().roster(week=chosen_week).players().stats()
+        )
+        league_teams_players = {
+            team_key: team.players if isinstance(team.players, list) else [team.players.get("player")]
+            for team_key, team in teams.items()
+        }
+
+        if self._output_as_json_str():
+            return jsonify_data(league_teams_players)
+        else:
+            return league_teams_players
+
+    def get_league_teams_stats_by_week(
+            self, chosen_week: Union[int, str] = "current"
+    ) -> Dict[str, Dict[str, Union[TeamPoints, TeamProjectedPoints]]]:
+        """Retrieve stats of all teams by week for chosen league with a single request (instead of calling
+        get_team_stats_by_week for every team).
+
+        Args:
+            chosen_week (int): Selected week for which to retrieve data.
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(league_id="######", game_code="nfl")
+            >>> query.get_league_teams_stats_by_week(1)
+            {
+              "331.l.729259.t.1": {
+                "team_points": TeamPoints({
+                  "coverage_type": "week",
+                  "total": "95.06",
+                  "week": "1"
+                }),
+                "team_projected_points": TeamProjectedPoints({
+                  "coverage_type": "week",
+                  "total": "78.85",
+                  "week": "1"
+                })
+              },
+              ...
+            }
+
+        Returns:
+            dict[str, dict[str, TeamPoints | TeamProjectedPoints]]: Dictionary with team keys as keys and dictionaries
+                containing keys "team_points" and "team_projected_points" with respective values YFPY TeamPoints and
+                YFPY TeamProjectedPoints instances as values.
+
+        """
+        teams = self._get_league_teams_by_team_key(
+            self.build_query().league().teams().stats(type="week", week=chosen_week)
+        )
+        league_teams_stats = {
+            team_key: {"team_points": team.team_points, "team_projected_points": team.team_projected_points}
+            for team_key, team in teams.items()
+        }
+
+        if self._output_as_json_str():
+            return jsonify_data(league_teams_stats)
+        else:
+            return league_teams_stats
+
+    def _retrieve_league_player_range(self, league_player_start: int,
+                                      league_player_count: int) -> Tuple[List[Player], List[Dict[str, Any]]]:
+        """Retrieve a range of league players, splitting the range (see `_bisect_league_players`) if it cannot be
+        retrieved.
+
+        Args:
+            league_player_start (int): Index of the first player of the range.
+            league_player_count (int): Number of players in the range.
+
+        Returns:
+            tuple[list[Player], list[dict[str, Any]]]: The retrieved players (in league player order) and the failures
+                of all players that could not be retrieved.
+
+        """
+        league_key = self.get_league_key()
+        try:
+            with self.suppress_json_str_output():
+                league_players = self.query(
+                    f"https://fantasysports.yahooapis.com/fantasy/v2/league/{league_key}/players;"
+                    f"start={league_player_start};count={league_player_count}",
+                    ["league", "players"]
+                )
+            if isinstance(league_players, dict):
+                # a single player is unpacked as a dictionary containing the player
+                league_players = league_players.get("player")
+            return league_players if isinstance(league_players, list) else [league_players], []
+
+        except YahooFantasySportsDataNotFound as yfpy_err:
+            if yfpy_err.payload:
+                # the range starts after the last league player
+                return [], []
+            if league_player_count > 1:
+                return self._bisect_league_players(league_player_start, league_player_count)
+            return [], [self._get_league_player_retrieval_failure(league_key, league_player_start, yfpy_err)]
+
+    @staticmethod
+    def _get_league_player_retrieval_failure(league_key: str, league_player_index: int,
+                                             yfpy_err: YahooFantasySportsDataNotFound) -> Dict[str, Any]:
+        """Record a league player that could not be retrieved.
+
+        Args:
+            league_key (str): League key of the league of the player.
+            league_player_index (int): Index of the player.
+            yfpy_err (YahooFantasySportsDataNotFound): Error raised when retrieving the player.
+
+        Returns:
+            dict[str, Any]: Failure with the league key, player index, URL, and error message.
 
         """
-        return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/standings",
-            ["league", "standings"],
-            Standings
-        )
-
-    def get_league_teams(self) -> List[Team]:
-        """Retrieve teams for chosen league.
+        return {
+            "league_key": league_key,
+            "failed_player_retrieval_index": league_player_index,
+            "failed_player_retrieval_url": yfpy_err.url,
+            "failed_player_retrieval_message": yfpy_err.message
+        }
+
+    def _bisect_league_players(self, league_player_start: int,
+                               league_player_count: int) -> Tuple[List[Player], List[Dict[str, Any]]]:
+        """Retrieve a range of league players that failed to be retrieved by splitting it in half and retrieving both
+        halves concurrently (recursively), so that players that cannot be retrieved are isolated in O(log n) requests.
 
-        Examples:
-            >>> from pathlib import Path
-            >>> from yfpy.query import YahooFantasySportsQuery
-            >>> query = YahooFantasySportsQuery(league_id="######", game_code="nfl")
-            >>> query.get_league_teams()
-            [
-              Team({
-                "clinched_playoffs": 1,
-                "draft_grade": "B",
-                "draft_position": 4,
-                "draft_recap_url":
-                  "https://football.fantasysports.yahoo.com/archive/nfl/2014/729259/1/draftrecap",
-                "has_draft_grade": 1,
-                "league_scoring_type": "head",
-                "managers": {
-                  "manager": {
-                    "guid": "BMACD7S5UXV7JIQX4PGGUVQJAU",
-                    "manager_id": "1",
-                    "nickname": "--hidden--"
-                  }
-                },
-                "name": "Hellacious Hill 12",
-                "number_of_moves": "71",
-                "number_of_trades": 0,
-                "roster_adds": {
-                  "coverage_type": "week",
-                  "coverage_value": "17",
-                  "value": "0"
-                },
-                "team_id": "1",
-                "team_key": "331.l.729259.t.1",
-                "team_logos": {
-                  "team_logo": {
-                    "size": "large",
-                    "url": "https://ct.yimg.com/cy/1441/24935131299_a8242dab70_192sq.jpg?ct=fantasy"
-                  }
-                },
-                "url": "https://football.fantasysports.yahoo.com/archive/nfl/2014/729259/1",
-                "waiver_priority": 9
-              }),
-              ...,
-              Team({...})
-            ]
+        Args:
+            league_player_start (int): Index of the first player of the range.
+            league_player_count (int): Number of players in the range.
 
         Returns:
-            list[Team]: List of YFPY Team instances.
+            tuple[list[Player], list[dict[str, Any]]]: The retrieved players (in league player order) and the failures
+                of all players that could not be retrieved.
 
         """
-        return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/teams",
-            ["league", "teams"]
-        )
+        first_half_count = league_player_count // 2
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first_half = executor.submit(
+                self._retrieve_league_player_range, league_player_start, first_half_count
+            )
+            second_half = executor.submit(
+                self._retrieve_league_player_range, league_player_start + first_half_count,
+                league_player_count - first_half_count
+            )
+            first_half_players, first_half_failures = first_half.result()
+            second_half_players, second_half_failures = second_half.result()
+        return first_half_players + second_half_players, first_half_failures + second_half_failures
 
     def get_league_players(self, player_count_limit: int = None, player_count_start: int = 0,
-                           is_retry: bool = False) -> List[Player]:
+                           page_size: int = None) -> List[Player]:
         """Retrieve valid players for chosen league.
 
         Args:
             player_count_limit (int): Maximum number of players to retreive.
             player_count_start (int): Index from which to retrieve all subsequent players.
-            is_retry (bool): Boolean to indicate whether the method is being retried during error handling.
+            page_size (int): Number of players to retrieve per page (defaults to the league_player_page_size of the
+                query object, which is tuned automatically if adaptive_page_size is enabled).
+
+        Note:
+            When a batch of players cannot be retrieved, the batch is split in half (and both halves are retrieved
+            concurrently) until the players that cannot be retrieved are isolated. These players are skipped and
+            recorded in `failed_league_player_retrievals`.
 
         Examples:
             >>> from pathlib import Path
@@ -1619,16 +2538,30 @@ class YahooFantasySportsQuery(object):
         league_player_count = player_count_start
         all_players_retrieved = False
         league_player_data = []
-        league_player_retrieval_limit = 25
         while not all_players_retrieved:
+            if page_size:
+                league_player_retrieval_limit = page_size
+            else:
+                league_player_retrieval_limit = self._league_player_page_size.page_size
 
             try:
+                # reset the request timing, which is not recorded by this thread if an identical concurrent query is
+                # coalesced with this one
+                self._thread_local.last_response_seconds = None
                 league_player_query_data = self.query(
                     f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/players;"
-                    f"start={league_player_count};count={league_player_retrieval_limit if not is_retry else 1}",
+                    f"start={league_player_count};count={league_player_retrieval_limit}",
                     ["league", "players"]
                 )
-
+                page_request_seconds = getattr(self._thread_local, "last_response_seconds", None)
+                if not page_size and page_request_seconds is not None:
+                    self._league_player_page_size.record_success(
+                        page_request_seconds, getattr(self._thread_local, "last_response_bytes", None)
+                    )
+
+                if isinstance(league_player_query_data, dict):
+                    # a single player is unpacked as a dictionary containing the player
+                    league_player_query_data = league_player_query_data.get("player")
                 league_players = (league_player_query_data if isinstance(league_player_query_data, list) else
                                   [league_player_query_data])
                 league_player_count_from_query = len(league_players)
@@ -1649,44 +2582,44 @@ class YahooFantasySportsQuery(object):
                     league_player_data.extend(league_players)
 
             except YahooFantasySportsDataNotFound as yfpy_err:
-                if not is_retry:
-                    payload = yfpy_err.payload
-                    if payload:
-                        logger.debug("No more league player data available.")
-                        all_players_retrieved = True
+                payload = yfpy_err.payload
+                if payload:
+                    logger.debug("No more league player data available.")
+                    all_players_retrieved = True
+                else:
+                    if not page_size:
+                        self._league_player_page_size.record_failure()
+                    logger.warning(
+                        f"Error retrieving player batch: "
+                        f"{league_player_count}-{league_player_count + league_player_retrieval_limit - 1}. "
+                        f"Splitting batch to isolate players that cannot be retrieved.")
+
+                    # only split the part of the batch that is within the player count limit
+                    failed_batch_count = league_player_retrieval_limit
+                    if player_count_limit:
+                        failed_batch_count = min(failed_batch_count, player_count_limit - league_player_count)
+                    if failed_batch_count > 1:
+                        player_retrieval_successes, player_retrieval_failures = self._bisect_league_players(
+                            league_player_count, failed_batch_count
+                        )
                     else:
-                        logger.warning(
-                            f"Error retrieving player batch: "
-                            f"{league_player_count}-{league_player_count + league_player_retrieval_limit - 1}. "
-                            f"Attempting to retrieve individual players from batch.")
-
-                        player_retrieval_successes = []
-                        player_retrieval_failures = []
-                        for i in range(25):
-                            try:
-                                player_data = self.get_league_players(
-                                    player_count_limit=league_player_count + 1,
-                                    player_count_start=league_player_count,
-                                    is_retry=True
-                                )
-                                player_retrieval_successes.extend(player_data)
-
-                            except YahooFantasySportsDataNotFound as nested_yfpy_err:
-                                player_retrieval_failures.append(
-                                    {
-                                        "failed_player_retrieval_index": league_player_count,
-                                        "failed_player_retrieval_url": nested_yfpy_err.url,
-                                        "failed_player_retrieval_message": nested_yfpy_err.message
-                                    }
-                                )
-
-                            league_player_count += 1
-
-                        league_player_data.extend(player_retrieval_successes)
-                        logger.warning(f"Players retrieval failures:\n{prettify_data(player_retrieval_failures)}")
+                        # a single player that cannot be retrieved is recorded as failed instead of being split
+                        player_retrieval_successes, player_retrieval_failures = [], [
+                            self._get_league_player_retrieval_failure(
+                                self.get_league_key(), league_player_count, yfpy_err
+                            )
+                        ]
 
-                else:
-                    raise yfpy_err
+                    retrieved_player_count = len(player_retrieval_successes) + len(player_retrieval_failures)
+                    if retrieved_player_count < league_player_retrieval_limit:
+                        all_players_retrieved = True
+                    league_player_count += retrieved_player_count
+                    league_player_data.extend(player_retrieval_successes)
+
+                    if player_retrieval_failures:
+                        with self._failed_league_player_retrievals_lock:
+                            self.failed_league_player_retrievals.extend(player_retrieval_failures)
+                        logger.warning(f"Players retrieval failures:\n{prettify_data(player_retrieval_failures)}")
 
             logger.debug(f"League player count: {league_player_count}")
 
@@ -1913,6 +2846,61 @@ class YahooFantasySportsQuery(object):
             ["league", "scoreboard", "0", "matchups"]
         )
 
+    def get_league_scoreboard_by_weeks(self, chosen_weeks: Iterable[int],
+                                       max_workers: int = 8) -> Dict[int, Scoreboard]:
+        """Retrieve scoreboards for chosen league for multiple weeks (requests for all weeks are run concurrently).
+
+        Args:
+            chosen_weeks (Iterable[int]): Selected weeks for which to retrieve data (e.g. range(1, 18)).
+            max_workers (int, optional): Maximum number of requests run concurrently (defaults to 8).
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(league_id="######", game_code="nfl")
+            >>> query.get_league_scoreboard_by_weeks(range(1, 3))
+            {
+              1: Scoreboard({
+                <scoreboard data> (see get_league_scoreboard_by_week docstring for scoreboard data example)
+              }),
+              2: Scoreboard({...})
+            }
+
+        Returns:
+            dict[int, Scoreboard]: Dictionary with weeks as keys and YFPY Scoreboard instances as values.
+
+        """
+        return self._query_concurrently(self.get_league_scoreboard_by_week, chosen_weeks, max_workers)
+
+    def get_league_matchups_by_weeks(self, chosen_weeks: Iterable[int],
+                                     max_workers: int = 8) -> Dict[int, List[Matchup]]:
+        """Retrieve matchups for chosen league for multiple weeks (requests for all weeks are run concurrently).
+
+        Args:
+            chosen_weeks (Iterable[int]): Selected weeks for which to retrieve data (e.g. range(1, 18)).
+            max_workers (int, optional): Maximum number of requests run concurrently (defaults to 8).
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(league_id="######", game_code="nfl")
+            >>> query.get_league_matchups_by_weeks(range(1, 3))
+            {
+              1: [
+                Matchup({
+                  <matchup data> (see get_league_matchups_by_week docstring for matchup data example)
+                }),
+                ...
+              ],
+              2: [...]
+            }
+
+        Returns:
+            dict[int, list[Matchup]]: Dictionary with weeks as keys and lists of YFPY Matchup instances as values.
+
+        """
+        return self._query_concurrently(self.get_league_matchups_by_week, chosen_weeks, max_workers)
+
     def get_team_info(self, team_id: Union[str, int]) -> Team:
         """Retrieve info of specific team by team_id for chosen league.
 
@@ -2126,6 +3114,40 @@ class YahooFantasySportsQuery(object):
             ["team", ["team_points", "team_projected_points"]]
         )
 
+    def get_team_stats_by_weeks(
+            self, team_id: Union[str, int], chosen_weeks: Iterable[int], max_workers: int = 8
+    ) -> Dict[int, Dict[str, Union[TeamPoints, TeamProjectedPoints]]]:
+        """Retrieve stats of specific team by team_id for multiple weeks for chosen league (requests for all weeks are
+        run concurrently).
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieva data (can be integers 1 through n where n is the
+                number of teams in the league).
+            chosen_weeks (Iterable[int]): Selected weeks for which to retrieve data (e.g. range(1, 18)).
+            max_workers (int, optional): Maximum number of requests run concurrently (defaults to 8).
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(league_id="######", game_code="nfl")
+            >>> query.get_team_stats_by_weeks(1, range(1, 3))
+            {
+              1: {
+                "team_points": TeamPoints({...}),
+                "team_projected_points": TeamProjectedPoints({...})
+              },
+              2: {...}
+            }
+
+        Returns:
+            dict[int, dict[str, TeamPoints | TeamProjectedPoints]]: Dictionary with weeks as keys and dictionaries
+                containing keys "team_points" and "team_projected_points" (see get_team_stats_by_week) as values.
+
+        """
+        return self._query_concurrently(
+            lambda chosen_week: self.get_team_stats_by_week(team_id, chosen_week), chosen_weeks, max_workers
+        )
+
     def get_team_standings(self, team_id: Union[str, int]) -> TeamStandings:
         """Retrieve standings of specific team by team_id for chosen league.
 
@@ -2241,6 +3263,37 @@ class YahooFantasySportsQuery(object):
             Roster
         )
 
+    def get_team_roster_by_weeks(self, team_id: Union[str, int], chosen_weeks: Iterable[int],
+                                 max_workers: int = 8) -> Dict[int, Roster]:
+        """Retrieve rosters of specific team by team_id for multiple weeks for chosen league (requests for all weeks
+        are run concurrently).
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieva data (can be integers 1 through n where n is the
+                number of teams in the league).
+            chosen_weeks (Iterable[int]): Selected weeks for which to retrieve data (e.g. range(1, 18)).
+            max_workers (int, optional): Maximum number of requests run concurrently (defaults to 8).
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(league_id="######", game_code="nfl")
+            >>> query.get_team_roster_by_weeks(1, range(1, 3))
+            {
+              1: Roster({
+                <roster data> (see get_team_roster_by_week docstring for roster data example)
+              }),
+              2: Roster({...})
+            }
+
+        Returns:
+            dict[int, Roster]: Dictionary with weeks as keys and YFPY Roster instances as values.
+
+        """
+        return self._query_concurrently(
+            lambda chosen_week: self.get_team_roster_by_week(team_id, chosen_week), chosen_weeks, max_workers
+        )
+
     def get_team_roster_player_info_by_week(self, team_id: Union[str, int],
                                             chosen_week: Union[int, str] = "current") -> List[Player]:
         """Retrieve roster with ALL player info of specific team by team_id and by week for chosen league.
@@ -2450,6 +3503,85 @@ class YahooFantasySportsQuery(object):
             ["team", "roster", "0", "players"]
         )
 
+    def get_team_roster_player_info_by_weeks(self, team_id: Union[str, int], chosen_weeks: Iterable[int],
+                                             max_workers: int = 8) -> Dict[int, List[Player]]:
+        """Retrieve rosters with ALL player info of specific team by team_id for multiple weeks for chosen league
+        (requests for all weeks are run concurrently).
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieva data (can be integers 1 through n where n is the
+                number of teams in the league).
+            chosen_weeks (Iterable[int]): Selected weeks for which to retrieve data (e.g. range(1, 18)).
+            max_workers (int, optional): Maximum number of requests run concurrently (defaults to 8).
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(league_id="######", game_code="nfl")
+            >>> query.get_team_roster_player_info_by_weeks(1, range(1, 3))
+            {
+              1: [
+                Player({
+                  <player data> (see get_team_roster_player_info_by_week docstring for player data example)
+                }),
+                ...
+              ],
+              2: [...]
+            }
+
+        Returns:
+            dict[int, list[Player]]: Dictionary with weeks as keys and lists of YFPY Player instances (see
+                get_team_roster_player_info_by_week) as values.
+
+        """
+        return self._query_concurrently(
+            lambda chosen_week: self.get_team_roster_player_info_by_week(team_id, chosen_week), chosen_weeks,
+            max_workers
+        )
+
+    def get_team_roster_player_info_by_date_range(self, team_id: Union[str, int], start_date: str, end_date: str,
+                                                  max_workers: int = 8) -> Dict[str, List[Player]]:
+        """Retrieve rosters with ALL player info of specific team by team_id for every date in a date range for chosen
+        league (requests for all dates are run concurrently).
+
+        Note:
+            This applies to MLB, NBA, and NHL leagues, but does NOT apply to NFL leagues.
+            This query will FAIL if you pass it an INVALID date string!
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieva data (can be integers 1 through n where n is the
+                number of teams in the league).
+            start_date (str): First date for which to retrieve data. REQUIRED FORMAT: YYYY-MM-DD (Ex. 2011-05-01)
+            end_date (str): Last date (inclusive) for which to retrieve data. REQUIRED FORMAT: YYYY-MM-DD
+                (Ex. 2011-05-07)
+            max_workers (int, optional): Maximum number of requests run concurrently (defaults to 8).
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(league_id="######", game_code="nhl")
+            >>> query.get_team_roster_player_info_by_date_range(1, "2011-05-01", "2011-05-02")
+            {
+              "2011-05-01": [
+                Player({
+                  <player data> (see get_team_roster_player_info_by_date docstring for player data example)
+                }),
+                ...
+              ],
+              "2011-05-02": [...]
+            }
+
+        Returns:
+            dict[str, list[Player]]: Dictionary with dates as keys and lists of YFPY Player instances (see
+                get_team_roster_player_info_by_date) as values.
+
+        """
+        return self._query_concurrently(
+            lambda chosen_date: self.get_team_roster_player_info_by_date(team_id, chosen_date),
+            self._get_dates_in_range(start_date, end_date),
+            max_workers
+        )
+
     def get_team_roster_player_stats(self, team_id: Union[str, int]) -> List[Player]:
         """Retrieve roster with ALL player info for the season of specific team by team_id and for chosen league.
 
@@ -2688,6 +3820,54 @@ class YahooFantasySportsQuery(object):
             ["team", "matchups"]
         )
 
+    def get_team_matchups_by_weeks(self, team_id: Union[str, int],
+                                   chosen_weeks: Iterable[int]) -> Dict[int, List[Matchup]]:
+        """Retrieve matchups of specific team by team_id for multiple weeks for chosen league in a single request.
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieva data (can be integers 1 through n where n is the
+                number of teams in the league).
+            chosen_weeks (Iterable[int]): Selected weeks for which to retrieve data (e.g. range(1, 18)).
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(league_id="######", game_code="nfl")
+            >>> query.get_team_matchups_by_weeks(1, range(1, 3))
+            {
+              1: [
+                Matchup({
+                  <matchup data> (see get_league_matchups_by_week docstring for matchup data example)
+                })
+              ],
+              2: [...]
+            }
+
+        Returns:
+            dict[int, list[Matchup]]: Dictionary with weeks as keys and lists of YFPY Matchup instances as values.
+
+        """
+        chosen_weeks = list(dict.fromkeys(int(chosen_week) for chosen_week in chosen_weeks))
+        team_key = f"{self.get_league_key()}.t.{team_id}"
+        with self.suppress_json_str_output():
+            matchups = self.query(
+                f"https://fantasysports.yahooapis.com/fantasy/v2/team/{team_key}/matchups;"
+                f"weeks={','.join(str(chosen_week) for chosen_week in chosen_weeks)}",
+                ["team", "matchups"]
+            )
+
+        if not isinstance(matchups, list):
+            matchups = [matchups.get("matchup")]
+
+        matchups_by_week = {chosen_week: [] for chosen_week in chosen_weeks}
+        for matchup in matchups:
+            matchups_by_week.setdefault(int(matchup.week), []).append(matchup)
+
+        if self._output_as_json_str():
+            return jsonify_data(matchups_by_week)
+        else:
+            return matchups_by_week
+
     def get_player_stats_for_season(self, player_key: str, limit_to_league_stats: bool = True) -> Player:
         """Retrieve stats of specific player by player_key for the entire season for chosen league.
 
@@ -2975,6 +4155,84 @@ class YahooFantasySportsQuery(object):
                 Player
             )
 
+    def get_player_stats_by_weeks(self, player_key: str, chosen_weeks: Iterable[int],
+                                  limit_to_league_stats: bool = True, max_workers: int = 8) -> Dict[int, Player]:
+        """Retrieve stats of specific player by player_key for multiple weeks for chosen league (requests for all weeks
+        are run concurrently).
+
+        Args:
+            player_key (str): The player key of chosen player (example: 331.p.7200 - <game_id>.p.<player_id>).
+            chosen_weeks (Iterable[int]): Selected weeks for which to retrieve data (e.g. range(1, 18)).
+            limit_to_league_stats (bool): Boolean (default: True) to limit the retrieved player stats to those for the
+                selected league. When set to False, query retrieves all player stats for the game (NFL, NHL, NBA, MLB).
+            max_workers (int, optional): Maximum number of requests run concurrently (defaults to 8).
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(league_id="######", game_code="nfl")
+            >>> query.get_player_stats_by_weeks("331.p.7200", range(1, 3))
+            {
+              1: Player({
+                <player data> (see get_player_stats_by_week docstring for player data example)
+              }),
+              2: Player({...})
+            }
+
+        Returns:
+            dict[int, Player]: Dictionary with weeks as keys and YFPY Player instances containing attribute
+                "player_stats" as values.
+
+        """
+        return self._query_concurrently(
+            lambda chosen_week: self.get_player_stats_by_week(player_key, chosen_week, limit_to_league_stats),
+            chosen_weeks,
+            max_workers,
+            pin_league_key=limit_to_league_stats
+        )
+
+    def get_player_stats_by_date_range(self, player_key: str, start_date: str, end_date: str,
+                                       limit_to_league_stats: bool = True, max_workers: int = 8) -> Dict[str, Player]:
+        """Retrieve player stats by player_key for every date in a date range for chosen league (requests for all
+        dates are run concurrently).
+
+        Note:
+            This applies to MLB, NBA, and NHL leagues, but does NOT apply to NFL leagues.
+            This query will FAIL if you pass it an INVALID date string!
+
+        Args:
+            player_key (str): The player key of chosen player (example: 331.p.7200 - <game_id>.p.<player_id>).
+            start_date (str): First date for which to retrieve data. REQUIRED FORMAT: YYYY-MM-DD (Ex. 2011-05-01)
+            end_date (str): Last date (inclusive) for which to retrieve data. REQUIRED FORMAT: YYYY-MM-DD
+                (Ex. 2011-05-07)
+            limit_to_league_stats (bool): Boolean (default: True) to limit the retrieved player stats to those for the
+                selected league. When set to False, query retrieves all player stats for the game (NFL, NHL, NBA, MLB).
+            max_workers (int, optional): Maximum number of requests run concurrently (defaults to 8).
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(league_id="######", game_code="nhl")
+            >>> query.get_player_stats_by_date_range("nhl.p.4588", "2011-05-01", "2011-05-02")
+            {
+              "2011-05-01": Player({
+                <player data> (see get_player_stats_by_date docstring for player data example)
+              }),
+              "2011-05-02": Player({...})
+            }
+
+        Returns:
+            dict[str, Player]: Dictionary with dates as keys and YFPY Player instances containing attribute
+                "player_stats" as values.
+
+        """
+        return self._query_concurrently(
+            lambda chosen_date: self.get_player_stats_by_date(player_key, chosen_date, limit_to_league_stats),
+            self._get_dates_in_range(start_date, end_date),
+            max_workers,
+            pin_league_key=limit_to_league_stats
+        )
+
     def get_player_ownership(self, player_key: str) -> Player:
         """Retrieve ownership of specific player by player_key for chosen league.
 
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""YFPY module for compact serialization and fast deserialization of YFPY models.
+
+YFPY models are serialized as "tagged" data, in which every model is represented by a dictionary of the data it was
+created from along with a type tag naming its model class. Deserializing tagged data rebuilds the models directly in a
+single pass, without re-running the Yahoo Fantasy Sports API response parsing in `yfpy.utils.unpack_data`.
+
+Tagged data can be serialized to compact JSON (no indentation or whitespace), or to the binary MessagePack or CBOR
+formats (which require the optional msgpack or cbor2 dependencies).
+
+Example:
+    The serialization functions can be used as follows::
+
+        serialized_players = serialize(yahoo_query.get_league_players(), serialization_format="msgpack")
+        players = deserialize(serialized_players, serialization_format="msgpack")
+
+Attributes:
+    logger (Logger): Module level logger for usage and debugging.
+    TYPE_TAG (str): Dictionary key containing the model class name of a serialized YFPY model.
+    VALUE_TAG (str): Dictionary key containing the data of a serialized YFPY model created from non-dictionary data.
+    SERIALIZATION_FORMATS (list[str]): Supported serialization formats.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import json
+from typing import Any, Dict, List, Type, Union
+
+from yfpy.logger import get_logger
+from yfpy.models import YahooFantasyObject
+from yfpy.utils import import_optional_dependency
+
+logger = get_logger(__name__)
+
+TYPE_TAG: str = "__yfpy_type__"
+VALUE_TAG: str = "__yfpy_value__"
+
+SERIALIZATION_FORMATS: List[str] = ["json", "msgpack", "cbor"]
+
+
+def get_model_classes() -> Dict[str, Type[YahooFantasyObject]]:
+    """Retrieve all YFPY model classes by class name.
+
+    Returns:
+        dict[str, Type[YahooFantasyObject]]: Dictionary with model class names as keys and model classes as values.
+
+    """
+    return {
+        YahooFantasyObject.__name__: YahooFantasyObject,
+        **{cls.__name__: cls for cls in YahooFantasyObject.__subclasses__()}
+    }
+
+
+def to_tagged_data(data: Any) -> Any:
+    """Recursive function to convert YFPY models (and any lists or dictionaries containing them) to tagged data
+    containing only JSON-compatible types.
+
+    Args:
+        data (Any): YFPY model, list, dictionary, or primitive to convert.
+
+    Returns:
+        Any: Tagged data with every YFPY model replaced by a dictionary of the data it was created from with an added
+            type tag.
+
+    """
+    if isinstance(data, YahooFantasyObject):
+        # serialize the data the model was created from, so the model can be recreated identically
+        extracted_data = data._extracted_data
+        if isinstance(extracted_data, dict):
+            return {TYPE_TAG: data.__class__.__name__, **{k: to_tagged_data(v) for k, v in extracted_data.items()}}
+        else:
+            return {TYPE_TAG: data.__class__.__name__, VALUE_TAG: to_tagged_data(extracted_data)}
+    elif isinstance(data, dict):
+        return {k: to_tagged_data(v) for k, v in data.items()}
+    elif isinstance(data, (list, tuple)):
+        return [to_tagged_data(el) for el in data]
+    elif isinstance(data, bytes):
+        return data.decode("utf-8")
+    else:
+        return data
+
+
+def is_tagged_data(data: Any, max_depth: int = 2) -> bool:
+    """Check if data contains tagged YFPY models (see `to_tagged_data`) at its top level or in the dictionaries and
+    lists nested directly inside it.
+
+    Args:
+        data (Any): Data to check.
+        max_depth (int, optional): Maximum nesting depth of dictionaries and lists to check (defaults to 2).
+
+    Returns:
+        bool: True if the data contains a tagged YFPY model, else False.
+
+    """
+    if isinstance(data, dict):
+        if TYPE_TAG in data:
+            return True
+        nested_data = data.values()
+    elif isinstance(data, list):
+        nested_data = data
+    else:
+        return False
+    return max_depth > 0 and any(is_tagged_data(el, max_depth - 1) for el in nested_data)
+
+
+def from_tagged_data(tagged_data: Any, model_classes: Dict[str, Type[YahooFantasyObject]] = None) -> Any:
+    """Recursive function to rebuild YFPY models from tagged data (see `to_tagged_data`).
+
+    Args:
+        tagged_data (Any): Tagged data to convert.
+        model_classes (dict[str, Type[YahooFantasyObject]], optional): Dictionary with model class names as keys and
+            model classes as values (defaults to all YFPY model classes).
+
+    Returns:
+        Any: Data with every tagged dictionary replaced by the YFPY model it represents.
+
+    """
+    if model_classes is None:
+        model_classes = get_model_classes()
+
+    if isinstance(tagged_data, dict):
+        model_class_name = tagged_data.get(TYPE_TAG)
+        if model_class_name is None:
+            return {k: from_tagged_data(v, model_classes) for k, v in tagged_data.items()}
+
+        model_class = model_classes.get(model_class_name)
+        if model_class is None:
+            raise ValueError(f"Unable to deserialize unknown YFPY model class \"{model_class_name}\".")
+
+        if VALUE_TAG in tagged_data:
+            return model_class(from_tagged_data(tagged_data[VALUE_TAG], model_classes))
+        return model_class({k: from_tagged_data(v, model_classes) for k, v in tagged_data.items() if k != TYPE_TAG})
+    elif isinstance(tagged_data, list):
+        return [from_tagged_data(el, model_classes) for el in tagged_data]
+    else:
+        return tagged_data
+
+
+def serialize(data: Any, serialization_format: str = "json") -> Union[str, bytes]:
+    """Serialize YFPY models (and any lists or dictionaries containing them) compactly.
+
+    Args:
+        data (Any): Data to serialize.
+        serialization_format (str, optional): Serialization format: "json" (compact JSON string, default), "msgpack"
+            (MessagePack bytes, requires msgpack), or "cbor" (CBOR bytes, requires cbor2).
+
+    Returns:
+        str | bytes: Serialized data.
+
+    """
+    tagged_data = to_tagged_data(data)
+    if serialization_format == "json":
+        return json.dumps(tagged_data, separators=(",", ":"), ensure_ascii=False)
+    elif serialization_format == "msgpack":
+        return import_optional_dependency("msgpack").packb(tagged_data, use_bin_type=True)
+    elif serialization_format == "cbor":
+        return import_optional_dependency("cbor2").dumps(tagged_data)
+    else:
+        raise ValueError(
+            f"Unsupported serialization format \"{serialization_format}\". Supported serialization formats: "
+            f"{SERIALIZATION_FORMATS}"
+        )
+
+
+def deserialize(serialized_data: Union[str, bytes], serialization_format: str = "json") -> Any:
+    """Deserialize data serialized with `serialize` and rebuild its YFPY models.
+
+    Args:
+        serialized_data (str | bytes): Serialized data.
+        serialization_format (str, optional): Serialization format: "json" (default), "msgpack" (requires msgpack), or
+            "cbor" (requires cbor2).
+
+    Returns:
+        Any: Deserialized data.
+
+    """
+    if serialization_format == "json":
+        tagged_data = json.loads(serialized_data)
+    elif serialization_format == "msgpack":
+        tagged_data = import_optional_dependency("msgpack").unpackb(serialized_data, raw=False)
+    elif serialization_format == "cbor":
+        tagged_data = import_optional_dependency("cbor2").loads(serialized_data)
+    else:
+        raise ValueError(
+            f"Unsupported serialization format \"{serialization_format}\". Supported serialization formats: "
+            f"{SERIALIZATION_FORMATS}"
+        )
+    return from_tagged_data(tagged_data)
@@ -8,11 +8,23 @@ Attributes:
 __author__ = "Wren J. R. (uberfastman)"
 __email__ = "uberfastman@uberfastman.dev"
 
+import copy
+import gzip
+import hashlib
+import io
 import json
+import os
 import re
+import stat
+import tempfile
+import threading
 from collections import ChainMap, OrderedDict
-from typing import Any, Dict, IO, List, Type, Union
-from time import sleep
+from contextlib import contextmanager
+from importlib import import_module
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Hashable, IO, Iterator, List, Optional, Type, Union
+from time import monotonic, sleep
 
 import stringcase
 
@@ -22,6 +34,8 @@ logger = get_logger(__name__)
 
 yahoo_fantasy_sports_game_codes = ["nfl", "nhl", "mlb", "nba"]
 
+compression_file_extensions = {"gzip": "gz", "zstd": "zst"}
+
 
 def retrieve_game_code_from_user() -> str:
     """Recursive function to retrieve required Yahoo Fantasy Sports game code from user input.
@@ -62,16 +76,20 @@ def complex_json_handler(obj: Any) -> Any:
             raise TypeError('Object of type %s with value of %s is not JSON serializable' % (type(obj), repr(obj)))
 
 
-def jsonify_data(data: object) -> str:
+def jsonify_data(data: object, compact: bool = False) -> str:
     """Function to serialize a YahooFantasyObject to a JSON string.
 
     Args:
         data (object): YahooFantasyObject to be serialized to a JSON string.
+        compact (bool, optional): Boolean to serialize to compact JSON without indentation or whitespace instead of
+            pretty-printed JSON (defaults to False).
 
     Returns:
         str: JSON string serialized from YahooFantasyObject.
 
     """
+    if compact:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=complex_json_handler)
     return json.dumps(data, indent=2, ensure_ascii=False, default=complex_json_handler)
 
 
@@ -359,3 +377,426 @@ def reformat_json_list(json_obj: Any) -> Any:
     else:
         # create chain map that filters out empty lists/dicts but leaves objects where value = 0
         return ChainMap(*[value for value in json_obj if (value == 0 or value)])
+
+
+def import_optional_dependency(module_name: str, package_name: Optional[str] = None) -> ModuleType:
+    """Function to import an optional dependency only when it is needed.
+
+    Args:
+        module_name (str): Name of the module to import.
+        package_name (str, optional): Name of the package providing the module if it differs from the module name.
+
+    Returns:
+        ModuleType: The imported module.
+
+    """
+    try:
+        return import_module(module_name)
+    except ImportError as e:
+        raise ImportError(
+            f"The optional dependency \"{module_name}\" is required for this feature. Please install it with "
+            f"\"pip install {package_name or module_name.split('.')[0]}\"."
+        ) from e
+
+
+_umask_lock = threading.Lock()
+_umask: Optional[int] = None
+
+
+def _get_umask() -> int:
+    """Get the file mode creation mask (umask) of the current process.
+
+    Returns:
+        int: The umask.
+
+    """
+    global _umask
+    with _umask_lock:
+        if _umask is None:
+            # the umask can only be read by setting it, so it is read once and restored immediately
+            _umask = os.umask(0o022)
+            os.umask(_umask)
+        return _umask
+
+
+@contextmanager
+def atomic_write(file_path: Union[Path, str], mode: Optional[int] = None) -> Iterator[Path]:
+    """Context manager to atomically create or replace a file by writing to a temporary file in the same directory that
+    is renamed to the target file path only once it has been written completely.
+
+    Readers therefore only ever see the previous complete file or the new complete file, even if the writing process
+    crashes or another process writes the same file concurrently.
+
+    Args:
+        file_path (Path | str): Target file path.
+        mode (int, optional): Permissions of the written file (defaults to the permissions of the replaced file, or to
+            the permissions of a newly created file according to the umask if the file does not exist yet, since
+            temporary files are otherwise only accessible by their owner).
+
+    Examples:
+        >>> with atomic_write(Path("data.json")) as temporary_file_path:
+        ...     temporary_file_path.write_text("{}")
+
+    Returns:
+        Iterator[Path]: Path of the temporary file to be written.
+
+    """
+    file_path = Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_descriptor, temporary_file_name = tempfile.mkstemp(
+        prefix=f".{file_path.name}.", suffix=".tmp", dir=file_path.parent
+    )
+    os.close(file_descriptor)
+    temporary_file_path = Path(temporary_file_name)
+    try:
+        yield temporary_file_path
+        if mode is None:
+            try:
+                mode = stat.S_IMODE(file_path.stat().st_mode)
+            except FileNotFoundError:
+                mode = 0o666 & ~_get_umask()
+        os.chmod(temporary_file_path, mode)
+        # flush the written file to disk before it replaces the target file
+        with open(temporary_file_path, "rb+") as temporary_file:
+            os.fsync(temporary_file.fileno())
+        os.replace(temporary_file_path, file_path)
+    finally:
+        if temporary_file_path.exists():
+            temporary_file_path.unlink()
+
+
+@contextmanager
+def file_lock(lock_file_path: Union[Path, str], shared: bool = False) -> Iterator[None]:
+    """Context manager to hold an advisory inter-process lock on a lock file (using fcntl on POSIX systems and msvcrt
+    on Windows, where shared locks are not supported and all locks are exclusive).
+
+    Note:
+        Advisory locks only coordinate processes that also use them. If no supported locking mechanism is available,
+        the lock is skipped with a warning.
+
+    Args:
+        lock_file_path (Path | str): Path of the lock file (created if it does not exist).
+        shared (bool, optional): Boolean to acquire a shared (read) lock instead of an exclusive (write) lock.
+
+    Returns:
+        Iterator[None]: Iterator holding the lock until it is exhausted.
+
+    """
+    lock_file_path = Path(lock_file_path)
+    lock_file_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_file_path, "a+b") as lock_file:
+        try:
+            import fcntl
+        except ImportError:
+            fcntl = None
+
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            return
+
+        try:
+            import msvcrt
+        except ImportError:
+            msvcrt = None
+
+        if msvcrt:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            return
+
+        logger.warning(f"File locking is not supported on this platform. Skipping lock on {lock_file_path}.")
+        yield
+
+
+@contextmanager
+def open_text_file(file_path: Union[Path, str], mode: str = "r",
+                   compression: Optional[str] = None) -> Iterator[IO[str]]:
+    """Context manager to open a (optionally compressed) UTF-8 text file for streaming reads or writes, so the file
+    content is compressed/decompressed incrementally instead of in memory all at once.
+
+    Args:
+        file_path (Path | str): Path of the file.
+        mode (str, optional): File mode ("r" for reading or "w" for writing, defaults to "r").
+        compression (str, optional): Compression of the file: None (uncompressed, default), "gzip", or "zstd" (requires
+            zstandard).
+
+    Returns:
+        Iterator[IO[str]]: Text file stream.
+
+    """
+    if compression is None:
+        with open(file_path, mode, encoding="utf-8") as text_file:
+            yield text_file
+    elif compression == "gzip":
+        with gzip.open(file_path, f"{mode}t", encoding="utf-8") as text_file:
+            yield text_file
+    elif compression == "zstd":
+        zstandard = import_optional_dependency("zstandard")
+        with open(file_path, f"{mode}b") as binary_file:
+            if "w" in mode:
+                compression_stream = zstandard.ZstdCompressor().stream_writer(binary_file)
+            else:
+                compression_stream = zstandard.ZstdDecompressor().stream_reader(binary_file)
+            with io.TextIOWrapper(compression_stream, encoding="utf-8") as text_file:
+                yield text_file
+    else:
+        raise ValueError(
+            f"Unsupported compression \"{compression}\". Supported compressions: "
+            f"{list(compression_file_extensions.keys())}"
+        )
+
+
+def get_file_checksum(file_path: Union[Path, str], chunk_size: int = 1024 * 1024) -> str:
+    """Calculate the SHA-256 checksum of a file without reading the entire file into memory at once.
+
+    Args:
+        file_path (Path | str): Path of the file.
+        chunk_size (int, optional): Number of bytes read at a time (defaults to 1 MiB).
+
+    Returns:
+        str: Hexadecimal SHA-256 checksum of the file.
+
+    """
+    checksum = hashlib.sha256()
+    with open(file_path, "rb") as checksum_file:
+        for chunk in iter(lambda: checksum_file.read(chunk_size), b""):
+            checksum.update(chunk)
+    return checksum.hexdigest()
+
+
+class RateLimiter(object):
+    """Thread-safe limiter for the rate and concurrency of requests shared by one or more query instances.
+    """
+
+    def __init__(self, requests_per_second: Optional[float] = None, max_concurrent_requests: Optional[int] = None):
+        """Instantiate a rate limiter.
+
+        Args:
+            requests_per_second (float, optional): Maximum number of requests started per second (defaults to None for
+                no rate limit).
+            max_concurrent_requests (int, optional): Maximum number of requests in flight at the same time (defaults to
+                None for no concurrency limit).
+
+        Attributes:
+            requests_per_second (float): Maximum number of requests started per second.
+            max_concurrent_requests (int): Maximum number of requests in flight at the same time.
+
+        """
+        self.requests_per_second: Optional[float] = requests_per_second
+        self.max_concurrent_requests: Optional[int] = max_concurrent_requests
+
+        self._interval: float = (1.0 / requests_per_second) if requests_per_second else 0.0
+        self._next_request_time: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+        self._semaphore: Optional[threading.BoundedSemaphore] = (
+            threading.BoundedSemaphore(max_concurrent_requests) if max_concurrent_requests else None
+        )
+
+    @contextmanager
+    def limit(self) -> Iterator[None]:
+        """Context manager that blocks until a request is allowed to start and holds a concurrency slot until it ends.
+
+        Returns:
+            Iterator[None]: Context in which a single request can be made.
+
+        """
+        if self._semaphore:
+            self._semaphore.acquire()
+        try:
+            if self._interval:
+                with self._lock:
+                    now = monotonic()
+                    request_time = max(now, self._next_request_time)
+                    self._next_request_time = request_time + self._interval
+                if request_time > now:
+                    sleep(request_time - now)
+            yield
+        finally:
+            if self._semaphore:
+                self._semaphore.release()
+
+
+class SingleFlight(object):
+    """Thread-safe deduplication of identical concurrent calls ("single-flight"), so that concurrent callers with the
+    same key share the execution and the result (or exception) of a single call.
+    """
+
+    def __init__(self, copy_results: bool = True):
+        """Instantiate a single-flight call group.
+
+        Args:
+            copy_results (bool, optional): Boolean to give every caller sharing a call its own deep copy of the result
+                (defaults to True), so callers cannot observe each other's changes to mutable results.
+
+        Attributes:
+            copy_results (bool): Boolean to give every caller sharing a call its own deep copy of the result.
+            coalesced_calls (int): Number of calls that shared the result of an identical in-flight call.
+
+        """
+        self.copy_results: bool = copy_results
+        self.coalesced_calls: int = 0
+
+        self._lock: threading.Lock = threading.Lock()
+        self._in_flight_calls: Dict[Hashable, Dict[str, Any]] = {}
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """Run a function, unless a call with the same key is already in flight, in which case wait for that call and
+        share its result.
+
+        Args:
+            key (Hashable): Key identifying identical calls.
+            function (Callable): Zero-argument function to run.
+
+        Returns:
+            Any: The result of the function (or of the identical in-flight call), copied if it was shared and
+                copy_results is True.
+
+        """
+        with self._lock:
+            in_flight_call = self._in_flight_calls.get(key)
+            is_leader = in_flight_call is None
+            if is_leader:
+                in_flight_call = self._in_flight_calls[key] = {
+                    "done": threading.Event(), "result": None, "error": None, "followers": 0
+                }
+            else:
+                in_flight_call["followers"] += 1
+                self.coalesced_calls += 1
+
+        if not is_leader:
+            in_flight_call["done"].wait()
+            if in_flight_call["error"] is not None:
+                raise in_flight_call["error"]
+            # the shared result itself is never returned to any caller, so it is not modified while it is copied
+            return copy.deepcopy(in_flight_call["result"]) if self.copy_results else in_flight_call["result"]
+
+        try:
+            in_flight_call["result"] = function()
+        except BaseException as e:
+            in_flight_call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight_calls[key]
+                is_shared = in_flight_call["followers"] > 0
+            in_flight_call["done"].set()
+        return copy.deepcopy(in_flight_call["result"]) if self.copy_results and is_shared else in_flight_call["result"]
+
+
+class AdaptivePageSize(object):
+    """Thread-safe page size for paginated queries that is tuned from the observed latency, payload size, and errors of
+    the page requests (additive increase, multiplicative decrease).
+
+    Every fast and successful page grows the page size by a fixed step (up to the maximum page size), while every slow,
+    oversized, or failed page halves it (down to the minimum page size), so paginated queries use the largest pages that
+    are retrieved efficiently and back off quickly when responses get slow or error-prone.
+    """
+
+    def __init__(self, page_size: int = 25, min_page_size: int = 1, max_page_size: int = 25, adaptive: bool = True,
+                 target_latency: float = 2.0, max_payload_bytes: Optional[int] = None, increase_step: int = 5):
+        """Instantiate an adaptive page size.
+
+        Args:
+            page_size (int, optional): Initial page size (defaults to 25).
+            min_page_size (int, optional): Minimum page size (defaults to 1).
+            max_page_size (int, optional): Maximum page size (defaults to 25, the maximum number of players Yahoo
+                returns per page).
+            adaptive (bool, optional): Boolean to tune the page size from the recorded page requests (defaults to True),
+                or to always use the initial page size.
+            target_latency (float, optional): Maximum latency in seconds of a page request before the page size is
+                decreased (defaults to 2.0).
+            max_payload_bytes (int, optional): Maximum response payload size in bytes of a page request before the page
+                size is decreased (defaults to None for no limit).
+            increase_step (int, optional): Number of items by which the page size is increased after a fast and
+                successful page request (defaults to 5).
+
+        Attributes:
+            min_page_size (int): Minimum page size.
+            max_page_size (int): Maximum page size.
+            adaptive (bool): Boolean to tune the page size from the recorded page requests.
+            target_latency (float): Maximum latency in seconds of a page request before the page size is decreased.
+            max_payload_bytes (int): Maximum response payload size in bytes of a page request before the page size is
+                decreased.
+            increase_step (int): Number of items by which the page size is increased after a fast and successful page
+                request.
+
+        """
+        if not 1 <= min_page_size <= max_page_size:
+            raise ValueError(f"Invalid page size range: {min_page_size}-{max_page_size}.")
+
+        self.min_page_size: int = min_page_size
+        self.max_page_size: int = max_page_size
+        self.adaptive: bool = adaptive
+        self.target_latency: float = target_latency
+        self.max_payload_bytes: Optional[int] = max_payload_bytes
+        self.increase_step: int = increase_step
+
+        self._page_size: int = min(max(page_size, min_page_size), max_page_size)
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def page_size(self) -> int:
+        """Current page size.
+
+        Returns:
+            int: Number of items to request per page.
+
+        """
+        with self._lock:
+            return self._page_size
+
+    def record_success(self, latency: float, payload_bytes: Optional[int] = None) -> None:
+        """Record a successful page request, increasing the page size if the request was fast and small enough, or
+        decreasing it otherwise.
+
+        Args:
+            latency (float): Latency in seconds of the page request.
+            payload_bytes (int, optional): Response payload size in bytes of the page request (if known).
+
+        Returns:
+            None
+
+        """
+        is_slow = latency > self.target_latency
+        is_oversized = bool(self.max_payload_bytes and payload_bytes and payload_bytes > self.max_payload_bytes)
+        if is_slow or is_oversized:
+            self._decrease(f"{'slow' if is_slow else 'oversized'} page ({latency:.2f}s, {payload_bytes} bytes)")
+        elif self.adaptive:
+            with self._lock:
+                self._page_size = min(self._page_size + self.increase_step, self.max_page_size)
+
+    def record_failure(self) -> None:
+        """Record a failed page request, decreasing the page size.
+
+        Returns:
+            None
+
+        """
+        self._decrease("failed page")
+
+    def _decrease(self, reason: str) -> None:
+        """Halve the page size (down to the minimum page size).
+
+        Args:
+            reason (str): Reason for the decrease (for logging).
+
+        Returns:
+            None
+
+        """
+        if not self.adaptive:
+            return
+        with self._lock:
+            page_size = max(self._page_size // 2, self.min_page_size)
+            if page_size != self._page_size:
+                logger.debug(f"Decreasing page size from {self._page_size} to {page_size} after {reason}.")
+            self._page_size = page_size